@@ -0,0 +1,131 @@
+import time
+import logging
+import threading
+import gevent
+from locust import events
+from locust.clients import HttpSession
+from locust.runners import MasterRunner, WorkerRunner
+from config.settings import settings
+from auth.token_manager import token_manager
+
+# Child of the load test logger configured in tests/base/log.py
+logger = logging.getLogger('loadtest.auth')
+
+# Master -> workers: [{client_id, token, expires_in, api_host}, ...]
+TOKENS_MESSAGE = 'oauth_tokens'
+# Worker -> master: {client_id, rejected_token}
+TOKEN_REQUEST_MESSAGE = 'oauth_token_request'
+
+
+class MasterTokenBroker:
+    """Obtains OAuth tokens on the master and hands them to workers
+
+    At test start the master authenticates every client in the token pool once and broadcasts
+    the tokens; its background refresher broadcasts each renewed token. Workers ask for a token
+    when theirs is missing, expired or rejected with a 401, so the number of auth requests does
+    not grow with the number of workers.
+    """
+
+    def __init__(self, environment, pool):
+        self.environment = environment
+        self.pool = pool
+        self._session = None
+        for manager in pool.managers:
+            manager.add_token_listener(self._on_new_token)
+        environment.runner.register_message(TOKEN_REQUEST_MESSAGE, self._on_token_request, concurrent=True)
+        environment.events.test_start.add_listener(self._on_test_start)
+
+    @property
+    def session(self):
+        """HTTP session used for the master's auth requests (reported in the master's stats)"""
+        if self._session is None:
+            host = self.environment.host or settings.API_HOST
+            self._session = HttpSession(base_url=host, request_event=self.environment.events.request, user=None)
+            self._session.timeout = 10
+        return self._session
+
+    def broadcast(self, managers=None, worker_id=None):
+        """Send the current tokens to one worker, or to all of them"""
+        entries = [entry for entry in (m.export_token() for m in managers or self.pool.managers) if entry]
+        if entries:
+            self.environment.runner.send_message(TOKENS_MESSAGE, entries, client_id=worker_id)
+
+    def _on_test_start(self, environment, **kwargs):
+        if not (self.environment.host or settings.API_HOST):
+            logger.warning("No API host configured - workers will authenticate themselves")
+            return
+        # Workers only start spawning users after this returns, so they have their tokens first
+        gevent.joinall([gevent.spawn(manager.get_shared_token, self.session) for manager in self.pool.managers])
+        # New tokens were already broadcast by _on_new_token; this covers reused ones (restarts from the web UI)
+        self.broadcast()
+
+    def _on_new_token(self, manager):
+        self.broadcast([manager])
+
+    def _on_token_request(self, environment, msg, **kwargs):
+        data = msg.data or {}
+        manager = self.pool.manager_by_id(data.get("client_id"))
+        if manager is None:
+            logger.warning("Token request for unknown OAuth client %s from worker %s", data.get("client_id"), msg.node_id)
+            return
+        rejected_token = data.get("rejected_token")
+        if rejected_token:
+            # Single-flight: only the first worker reporting this token triggers a new login
+            manager.reauthenticate(self.session, rejected_token)
+        else:
+            manager.get_shared_token(self.session)
+        self.broadcast([manager], worker_id=msg.node_id)
+
+
+class WorkerTokenBroker:
+    """Receives OAuth tokens from the master instead of authenticating on every worker
+
+    Token managers call request_token() where they would log in; it asks the master and waits
+    up to TOKEN_BROKER_TIMEOUT seconds for the answer. On timeout the manager authenticates
+    directly, so a worker never stalls on a missing master token.
+    """
+
+    def __init__(self, environment, pool):
+        self.environment = environment
+        self.pool = pool
+        self._received = {}  # manager -> threading.Event set when the master sends its token
+        for manager in pool.managers:
+            manager.broker = self
+            self._received[manager] = threading.Event()
+        environment.runner.register_message(TOKENS_MESSAGE, self._on_tokens)
+
+    def request_token(self, manager, rejected_token=None):
+        """Ask the master for the manager's current token (or a new one after a 401); returns it or None"""
+        received = self._received[manager]
+        received.clear()
+        self.environment.runner.send_message(TOKEN_REQUEST_MESSAGE, {
+            "client_id": manager.credentials()[0],
+            "rejected_token": rejected_token,
+        })
+        deadline = time.time() + settings.TOKEN_BROKER_TIMEOUT
+        while received.wait(max(deadline - time.time(), 0)):
+            received.clear()
+            token = manager._shared_token
+            if token and token != rejected_token:
+                return token
+        return None
+
+    def _on_tokens(self, environment, msg, **kwargs):
+        for entry in msg.data or []:
+            manager = self.pool.manager_by_id(entry["client_id"])
+            if manager is None:
+                logger.warning("Received token for unknown OAuth client %s", entry["client_id"])
+                continue
+            manager.set_token(entry["token"], entry["expires_in"], entry.get("api_host"))
+            self._received[manager].set()
+        logger.info("Received %s token(s) from the master", len(msg.data or []))
+
+
+@events.init.add_listener
+def _on_init(environment, runner=None, **kwargs):
+    if not settings.TOKEN_BROKER:
+        return
+    if isinstance(runner, MasterRunner):
+        MasterTokenBroker(environment, token_manager)
+    elif isinstance(runner, WorkerRunner):
+        WorkerTokenBroker(environment, token_manager)
@@ -1,18 +1,51 @@
 import time
+import zlib
+import logging
+import itertools
 import threading
+import weakref
 from config.settings import settings
 
+# Child of the load test logger configured in tests/base/log.py
+logger = logging.getLogger('loadtest.auth')
+
 class TokenManager:
-    """Thread-safe token manager for OAuth2 authentication"""
+    """Thread-safe token manager for OAuth2 authentication
+    
+    After the first successful authentication a background refresher renews the token
+    TOKEN_REFRESH_BUFFER seconds before it expires, swaps it in and pushes the new
+    Authorization header to every registered client, so requests never wait on auth.
+    """
+    
+    # Seconds between retries when a background refresh fails (the old token stays in use)
+    REFRESH_RETRY_INTERVAL = 5
+    # Minimum seconds between 401-triggered re-authentications (avoids login storms on bad credentials)
+    REAUTH_COOLDOWN = 5
     
-    def __init__(self):
+    def __init__(self, client_id=None, client_secret=None, label=None):
+        # Unset credentials are read from settings on every call (CLIENT_ID / CLIENT_SECRET)
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.label = label  # Appended to the auth request name, e.g. "/authorisation/token [client-a]"
         self._shared_token = None
-        self._token_expires_at = None
+        self._token_expires_at = None   # When the token should be refreshed (expiry - buffer)
+        self._token_valid_until = None  # When the token actually expires
         self._auth_lock = threading.Lock()
         # Track credentials to detect changes
         self._last_client_id = None
         self._last_client_secret = None
         self._last_api_host = None
+        # Background refresh
+        self._clients = weakref.WeakSet()  # Sessions whose Authorization header is kept current
+        self._refresh_client = None
+        self._next_refresh_at = None
+        self._refresher = None
+        self._refresher_wakeup = threading.Event()
+        self._last_reauth_at = None
+        # Distributed runs (auth/token_broker.py): workers get tokens from the master's broker
+        # instead of authenticating; the master notifies listeners to broadcast new tokens
+        self.broker = None
+        self._token_listeners = []
     
     def get_shared_token(self, client):
         """Get a shared token for all users, authenticate only once"""
@@ -22,8 +55,7 @@ class TokenManager:
         current_api_host = client.base_url if client.base_url else settings.API_HOST
         
         # Check if credentials have changed - if so, clear cached token
-        current_client_id = settings.CLIENT_ID
-        current_client_secret = settings.CLIENT_SECRET
+        current_client_id, current_client_secret = self.credentials()
         
         if (self._last_client_id != current_client_id or 
             self._last_client_secret != current_client_secret or
@@ -31,13 +63,20 @@ class TokenManager:
             # Credentials changed, clear cached token
             self._shared_token = None
             self._token_expires_at = None
+            self._token_valid_until = None
             self._last_client_id = current_client_id
             self._last_client_secret = current_client_secret
             self._last_api_host = current_api_host
         
         # Check if we have a valid token (without lock for performance)
-        if self._shared_token and self._token_expires_at and time.time() < self._token_expires_at:
-            return self._shared_token
+        token = self._shared_token
+        if token and self._token_expires_at:
+            now = time.time()
+            if now < self._token_expires_at:
+                return token
+            # Inside the refresh buffer: the background refresher is renewing it, keep using the old one
+            if (self._refresher_running() or self.broker is not None) and now < self._token_valid_until:
+                return token
         
         # Use lock to ensure only one authentication happens at a time
         with self._auth_lock:
@@ -45,44 +84,259 @@ class TokenManager:
             if self._shared_token and self._token_expires_at and time.time() < self._token_expires_at:
                 return self._shared_token
             
-            # Need to authenticate - use client's base_url to respect --host parameter
-            auth_url = f"{current_api_host}{settings.AUTH_ENDPOINT}"
-            auth_data = {
-                "grant_type": "client_credentials",
-                "client_id": settings.CLIENT_ID,
-                "client_secret": settings.CLIENT_SECRET,
-                "scope": settings.SCOPE
-            }
-            auth_headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json"
-            }
-            
-            auth_response = client.post(auth_url, json=auth_data, headers=auth_headers)
+            return self._authenticate(client, current_api_host)
+    
+    def reauthenticate(self, client, rejected_token=None):
+        """Single-flight re-authentication after a 401
+        
+        Callers queue on _auth_lock; only the first one whose token was rejected logs in again,
+        the rest get the token it obtained. Returns None (no retry) if the token was already
+        renewed within REAUTH_COOLDOWN seconds and is still being rejected.
+        """
+        with self._auth_lock:
+            now = time.time()
+            if self._shared_token and self._shared_token != rejected_token:
+                return self._shared_token
+            if self._last_reauth_at and now - self._last_reauth_at < self.REAUTH_COOLDOWN:
+                return None
+            self._last_reauth_at = now
+            logger.warning("Token rejected with 401 - re-authenticating")
+            api_host = client.base_url if client.base_url else settings.API_HOST
+            return self._authenticate(client, api_host, rejected_token)
+    
+    def register_client(self, client):
+        """Keep this session's Authorization header in sync with background token refreshes"""
+        self._clients.add(client)
+    
+    def add_token_listener(self, callback):
+        """Call ``callback(manager)`` whenever a new token is obtained"""
+        self._token_listeners.append(callback)
+    
+    def export_token(self):
+        """Return the current token as a message-friendly dict, or None"""
+        token = self._shared_token
+        if not token:
+            return None
+        return {
+            "client_id": self.credentials()[0],
+            "token": token,
+            "expires_in": self._token_valid_until - time.time(),
+            "api_host": self._last_api_host,
+        }
+    
+    def set_token(self, token, expires_in, api_host=None):
+        """Install a token obtained elsewhere (the master's token broker) and push it to all sessions"""
+        self._last_client_id, self._last_client_secret = self.credentials()
+        if api_host:
+            self._last_api_host = api_host
+        self._install_token(token, expires_in)
+    
+    def credentials(self):
+        """Return the (client_id, client_secret) pair this manager authenticates with"""
+        if self.client_id is not None:
+            return self.client_id, self.client_secret
+        return settings.CLIENT_ID, settings.CLIENT_SECRET
+    
+    def _authenticate(self, client, api_host, rejected_token=None):
+        """Request a new token (caller holds _auth_lock); returns the token or None"""
+        if self.broker is not None:
+            token = self.broker.request_token(self, rejected_token)
+            if token:
+                return token
+            logger.warning("No token from the master's token broker - authenticating directly")
+        
+        # Need to authenticate - use client's base_url to respect --host parameter
+        auth_url = f"{api_host}{settings.AUTH_ENDPOINT}"
+        client_id, client_secret = self.credentials()
+        auth_data = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "scope": settings.SCOPE
+        }
+        auth_headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        
+        request_kwargs = {}
+        if self.label:
+            # Report each pooled client's auth requests separately
+            request_kwargs["name"] = f"{settings.AUTH_ENDPOINT} [{self.label}]"
+        
+        auth_response = client.post(auth_url, json=auth_data, headers=auth_headers, **request_kwargs)
+        
+        if auth_response.status_code == 200:
+            token_data = auth_response.json()
+            access_token = token_data.get("access_token")
             
-            if auth_response.status_code == 200:
-                token_data = auth_response.json()
-                access_token = token_data.get("access_token")
-                
-                if access_token:
-                    self._shared_token = access_token
-                    expires_in = token_data.get("expires_in", settings.DEFAULT_TOKEN_EXPIRY)
-                    self._token_expires_at = time.time() + expires_in - settings.TOKEN_REFRESH_BUFFER
-                    self._last_client_id = settings.CLIENT_ID
-                    self._last_client_secret = settings.CLIENT_SECRET
-                    self._last_api_host = current_api_host
-                    return access_token
-                else:
-                    print(f"Access token not found in response")
+            if access_token:
+                expires_in = token_data.get("expires_in", settings.DEFAULT_TOKEN_EXPIRY)
+                self._last_client_id = client_id
+                self._last_client_secret = client_secret
+                self._last_api_host = api_host
+                self._refresh_client = client
+                self._install_token(access_token, expires_in)
+                self._start_refresher()
+                return access_token
             else:
-                print(f"Authentication failed: {auth_response.status_code} - {auth_response.text}")
+                logger.error("Access token not found in response")
+        else:
+            logger.error("Authentication failed: %s - %s", auth_response.status_code, auth_response.text)
+        
+        return None
+    
+    def _install_token(self, token, expires_in):
+        """Swap in a new token: readers see either the old or the new one, never none"""
+        now = time.time()
+        self._shared_token = token
+        self._token_valid_until = now + expires_in
+        self._token_expires_at = now + expires_in - settings.TOKEN_REFRESH_BUFFER
+        self._next_refresh_at = self._token_expires_at
+        self._push_token(token)
+        for callback in self._token_listeners:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error("Token listener failed: %s", e)
+    
+    def _push_token(self, token):
+        """Update the Authorization header of every registered session"""
+        for client in list(self._clients):
+            client.headers["Authorization"] = f"Bearer {token}"
+    
+    def _refresher_running(self):
+        return self._refresher is not None and self._refresher.is_alive()
+    
+    def _start_refresher(self):
+        # Workers with a broker get refreshed tokens broadcast by the master
+        if not settings.TOKEN_BACKGROUND_REFRESH or self.broker is not None or self._refresher_running():
+            return
+        name = f"token-refresher-{self.label}" if self.label else 'token-refresher'
+        self._refresher = threading.Thread(target=self._refresh_loop, name=name, daemon=True)
+        self._refresher.start()
+    
+    def _refresh_loop(self):
+        """Renew the token when it enters the refresh buffer (a greenlet under Locust)"""
+        while self._shared_token is not None:
+            delay = self._next_refresh_at - time.time()
+            if delay > 0:
+                self._refresher_wakeup.wait(delay)
+                self._refresher_wakeup.clear()
+                continue
             
-            return None
+            with self._auth_lock:
+                if self._shared_token is None:
+                    break
+                if time.time() < self._token_expires_at:
+                    # A caller already re-authenticated
+                    self._next_refresh_at = self._token_expires_at
+                    continue
+                try:
+                    token = self._authenticate(self._refresh_client, self._last_api_host)
+                except Exception as e:
+                    logger.error("Background token refresh failed: %s", e)
+                    token = None
+            
+            if token:
+                logger.info("Token refreshed in the background%s", f" ({self.label})" if self.label else "")
+            else:
+                # Keep using the current token (still valid until _token_valid_until) and retry soon
+                self._next_refresh_at = time.time() + self.REFRESH_RETRY_INTERVAL
     
     def clear_token(self):
         """Clear the cached token (useful for testing)"""
         self._shared_token = None
         self._token_expires_at = None
+        self._token_valid_until = None
+        self._refresher_wakeup.set()  # Stop the background refresher
+
+
+class TokenPool:
+    """Spread users over several OAuth clients (CLIENT_CREDENTIALS)
+    
+    Each client has its own TokenManager - token, background refresher and 401 handling - so
+    token lifetimes and per-client rate limits apply independently. A session is assigned to a
+    client on first use, round-robin or (TOKEN_ASSIGNMENT=hash) by a stable hash of its user
+    class and per-class index, so a given user slot always lands on the same client. The client
+    ID is stored on the session as ``oauth_client_id`` for per-client stats (tests/base/client_stats.py).
+    
+    Without CLIENT_CREDENTIALS the pool wraps a single manager using CLIENT_ID / CLIENT_SECRET.
+    Exposes the TokenManager interface, so callers do not need to know which one they hold.
+    """
+    
+    def __init__(self, credentials=None, assignment=None):
+        self._credentials = credentials  # [(client_id, client_secret), ...]; None = read settings on first use
+        self._assignment = assignment
+        self._managers = None
+        self._assigned = weakref.WeakKeyDictionary()  # session -> TokenManager
+        self._round_robin = itertools.count()
+        self._class_counters = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def managers(self):
+        """One TokenManager per configured OAuth client (built lazily so .env changes apply)"""
+        if self._managers is None:
+            credentials = self._credentials if self._credentials is not None else settings.CLIENT_CREDENTIALS
+            if len(credentials) > 1:
+                self._managers = [TokenManager(client_id, client_secret, label=client_id)
+                                  for client_id, client_secret in credentials]
+            elif credentials:
+                self._managers = [TokenManager(*credentials[0])]
+            else:
+                self._managers = [TokenManager()]
+        return self._managers
+    
+    def manager_for(self, client):
+        """Return the TokenManager a session is assigned to, assigning one on first use"""
+        manager = self._assigned.get(client)
+        if manager is not None:
+            return manager
+        
+        with self._lock:
+            manager = self._assigned.get(client)
+            if manager is None:
+                managers = self.managers
+                if len(managers) == 1:
+                    index = 0
+                elif (self._assignment or settings.TOKEN_ASSIGNMENT) == 'hash':
+                    user = getattr(client, 'user', None)
+                    class_name = type(user).__name__ if user is not None else type(client).__name__
+                    slot = self._class_counters.get(class_name, 0)
+                    self._class_counters[class_name] = slot + 1
+                    index = zlib.crc32(f"{class_name}:{slot}".encode('utf-8')) % len(managers)
+                else:
+                    index = next(self._round_robin) % len(managers)
+                manager = managers[index]
+                self._assigned[client] = manager
+                client.oauth_client_id = manager.credentials()[0]
+        return manager
+    
+    def manager_by_id(self, client_id):
+        """Return the manager for an OAuth client ID (the only manager when the pool has one), or None"""
+        managers = self.managers
+        for manager in managers:
+            if manager.credentials()[0] == client_id:
+                return manager
+        return managers[0] if len(managers) == 1 else None
+    
+    def get_shared_token(self, client):
+        """Get the shared token of the session's OAuth client, authenticating once per client"""
+        return self.manager_for(client).get_shared_token(client)
+    
+    def reauthenticate(self, client, rejected_token=None):
+        """Single-flight re-authentication of the session's OAuth client after a 401"""
+        return self.manager_for(client).reauthenticate(client, rejected_token)
+    
+    def register_client(self, client):
+        """Keep this session's Authorization header in sync with its client's token refreshes"""
+        self.manager_for(client).register_client(client)
+    
+    def clear_token(self):
+        """Clear the cached tokens of all clients (useful for testing)"""
+        for manager in self.managers:
+            manager.clear_token()
 
-# Global token manager instance
-token_manager = TokenManager()
+# Global token manager instance (a pool of one unless CLIENT_CREDENTIALS lists several clients)
+token_manager = TokenPool()
@@ -23,17 +23,130 @@ class Settings:
         'integrations:read integrations:write integrations:delete'
     )
     
+    # HTTP engine: 'http' (python-requests HttpUser) or 'fast' (geventhttpclient FastHttpUser)
+    HTTP_ENGINE = os.getenv('HTTP_ENGINE', 'http')
+    
+    # Logging (see tests/base/log.py) - quiet by default so load runs are not slowed by output
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING')
+    LOG_FILE = os.getenv('LOG_FILE')  # Unset: write to stderr
+    LOG_RATE_LIMIT = int(os.getenv('LOG_RATE_LIMIT', '5'))  # Max messages per key per interval (0 = unlimited)
+    LOG_RATE_INTERVAL = float(os.getenv('LOG_RATE_INTERVAL', '10'))  # Seconds
+    LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '1.0'))  # Fraction of DEBUG/INFO messages kept
+    LOG_BATCH_SIZE = int(os.getenv('LOG_BATCH_SIZE', '200'))
+    LOG_FLUSH_INTERVAL = float(os.getenv('LOG_FLUSH_INTERVAL', '1.0'))  # Seconds
+    
+    # Shared ID registry (see tests/base/id_registry.py)
+    ID_REGISTRY_TTL = float(os.getenv('ID_REGISTRY_TTL', '300'))  # Seconds before IDs are refreshed in the background
+    ID_REGISTRY_RETRY_INTERVAL = float(os.getenv('ID_REGISTRY_RETRY_INTERVAL', '30'))  # Seconds before retrying a failed fetch
+    ID_SAMPLING_SKEW = float(os.getenv('ID_SAMPLING_SKEW', '0'))  # 0 = uniform, >0 = Zipf exponent (e.g. 1.0)
+    
+    # Fixture discovery at test start (see tests/base/discovery.py)
+    DISCOVERY_ENABLED = os.getenv('DISCOVERY_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    DISCOVERY_RESOURCES = os.getenv(
+        'DISCOVERY_RESOURCES', 'scores,staff,users,teams,groups,scorecards,integrations'
+    ).replace(' ', '').split(',')
+    DISCOVERY_MAX_PAGES = int(os.getenv('DISCOVERY_MAX_PAGES', '200'))  # Per resource
+    DISCOVERY_CONCURRENCY = int(os.getenv('DISCOVERY_CONCURRENCY', '10'))  # Concurrent page requests per resource
+    
+    # On-disk fixture cache of discovered IDs, one file per API host (see tests/base/fixture_cache.py)
+    FIXTURE_CACHE_ENABLED = os.getenv('FIXTURE_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    FIXTURE_CACHE_DIR = os.getenv('FIXTURE_CACHE_DIR', '.fixture_cache')
+    FIXTURE_CACHE_TTL = float(os.getenv('FIXTURE_CACHE_TTL', '3600'))  # Seconds
+    
+    # Indexed OpenAPI spec cache, keyed by the spec's hash (see tests/base/openapi_spec.py)
+    SPEC_CACHE_ENABLED = os.getenv('SPEC_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    SPEC_CACHE_DIR = os.getenv('SPEC_CACHE_DIR', '.spec_cache')
+    
+    # Open-model arrival rate mode (see tests/base/arrival.py); unset = closed model (back-to-back tasks)
+    ARRIVAL_RATE = float(os.getenv('ARRIVAL_RATE', '0'))  # Requests/second per user class, mixed by @task weights
+    ARRIVAL_TASK_RATES = {  # "task_name=rate,..." - requests/second per task
+        name: float(rate)
+        for name, rate in (pair.split('=', 1) for pair in os.getenv('ARRIVAL_TASK_RATES', '').replace(' ', '').split(',') if '=' in pair)
+    }
+    ARRIVAL_PROCESS = os.getenv('ARRIVAL_PROCESS', 'poisson')  # 'poisson' or 'fixed'
+    ARRIVAL_MAX_IN_FLIGHT = int(os.getenv('ARRIVAL_MAX_IN_FLIGHT', '500'))  # Per user class and process
+    ARRIVAL_LATE_THRESHOLD = float(os.getenv('ARRIVAL_LATE_THRESHOLD', '0.05'))  # Seconds after schedule
+    
+    # Load shapes (see tests/base/shapes.py): LOAD_SHAPE=step|spike|soak|ramp_to_break with -f <test file>,shape.py
+    LOAD_SHAPE = os.getenv('LOAD_SHAPE')
+    SHAPE_BASE_USERS = int(os.getenv('SHAPE_BASE_USERS', '10'))
+    SHAPE_PEAK_USERS = int(os.getenv('SHAPE_PEAK_USERS', '100'))
+    SHAPE_STEP_USERS = int(os.getenv('SHAPE_STEP_USERS', '10'))
+    SHAPE_STEPS = int(os.getenv('SHAPE_STEPS', '5'))
+    SHAPE_STEP_DURATION = float(os.getenv('SHAPE_STEP_DURATION', '60'))  # Seconds
+    SHAPE_SPAWN_RATE = float(os.getenv('SHAPE_SPAWN_RATE', '10'))  # Users per second
+    SHAPE_DURATION = float(os.getenv('SHAPE_DURATION', '600'))  # Seconds (spike, soak)
+    SHAPE_SPIKE_AT = float(os.getenv('SHAPE_SPIKE_AT', '120'))  # Seconds
+    SHAPE_SPIKE_DURATION = float(os.getenv('SHAPE_SPIKE_DURATION', '60'))  # Seconds
+    SHAPE_PERIOD = float(os.getenv('SHAPE_PERIOD', '3600'))  # Seconds per diurnal cycle (soak)
+    SHAPE_MAX_P95 = float(os.getenv('SHAPE_MAX_P95', '2000'))  # Milliseconds (ramp_to_break)
+    SHAPE_MAX_ERROR_RATE = float(os.getenv('SHAPE_MAX_ERROR_RATE', '0.05'))  # Fraction of requests (ramp_to_break)
+    
+    # Pre-serialized request bodies per operation; 0 = build each body per request (see tests/base/payload_pool.py)
+    PAYLOAD_POOL_SIZE = int(os.getenv('PAYLOAD_POOL_SIZE', '0'))
+    
+    # Created resources are deleted by a pool of cleanup greenlets (see tests/base/cleanup.py)
+    CLEANUP_CONCURRENCY = int(os.getenv('CLEANUP_CONCURRENCY', '20'))
+    CLEANUP_TIMEOUT = float(os.getenv('CLEANUP_TIMEOUT', '120'))  # Seconds to wait for queued deletes when the run stops
+    # Journal of created/deleted resources that sweep.py replays after a crash (see tests/base/cleanup_journal.py)
+    CLEANUP_JOURNAL = os.getenv('CLEANUP_JOURNAL', 'true').lower() in ('1', 'true', 'yes')
+    CLEANUP_JOURNAL_DIR = os.getenv('CLEANUP_JOURNAL_DIR', '.cleanup_journal')
+    CLEANUP_JOURNAL_SYNC = float(os.getenv('CLEANUP_JOURNAL_SYNC', '1.0'))  # Seconds between fsyncs
+    
+    # Bulk teardown of test entities by name/email prefix (see teardown.py)
+    TEARDOWN_PREFIXES = [prefix for prefix in os.getenv(
+        'TEARDOWN_PREFIXES',
+        'DeleteTest_,TestTeam_,TeamWithMembers_,UpsertTeam_,MinimalTeam_,FullDataTeam_,'
+        'TestGroup_,BasicGroup_,DescGroup_,FullGroup_,LocationGroup_,UpsertGroup_,MinimalGroup_,FullDataGroup_,'
+        'CustomerService_,TechnicalSupport_,SalesTeam_,QualityAssurance_,'
+        'TestIntegration_,PostIntegration_,UpsertIntegration_,MinimalIntegration_,FullDataIntegration_,'
+        'teststaff_,deletestaff_,poststaff_,postemployee_,postsupervisor_,fullstaff_,'
+        'upsertstaff_,upsertemployee_,upsertsupervisor_,minimalstaff_,'
+        'testuser_,postuser_,fulluser_,minimaluser_,upsertuser_,fulldatauser_,loadtest_'
+    ).replace(' ', '').split(',') if prefix]
+    TEARDOWN_CONCURRENCY = int(os.getenv('TEARDOWN_CONCURRENCY', '10'))  # Concurrent requests
+    TEARDOWN_RATE = float(os.getenv('TEARDOWN_RATE', '20'))  # Deletes per second; 0 = unlimited
+    
+    # Run phases (see tests/base/run_phase.py)
+    RUN_WARMUP = float(os.getenv('RUN_WARMUP', '0'))  # Seconds excluded from the stats at the start
+    RUN_DRAIN = float(os.getenv('RUN_DRAIN', '5'))    # Seconds before --run-time ends without new requests
+    
+    # Traffic replay (see tests/base/replay.py and tests/replay/replay_traffic.py)
+    REPLAY_FILE = os.getenv('REPLAY_FILE')  # JSONL request log
+    REPLAY_SPEED = float(os.getenv('REPLAY_SPEED', '1.0'))  # 2 = twice as fast as recorded
+    REPLAY_LOOP = os.getenv('REPLAY_LOOP', 'false').lower() in ('1', 'true', 'yes')
+    REPLAY_REMAP_IDS = os.getenv('REPLAY_REMAP_IDS', 'true').lower() in ('1', 'true', 'yes')
+    
+    # HDR histograms of every request's response time, merged losslessly across workers (see tests/base/latency.py)
+    HDR_HISTOGRAMS = os.getenv('HDR_HISTOGRAMS', 'true').lower() in ('1', 'true', 'yes')
+    # Record latency from each request's intended start alongside the raw response time (see tests/base/latency.py)
+    LATENCY_CORRECTION = os.getenv('LATENCY_CORRECTION', 'true').lower() in ('1', 'true', 'yes')
+    
     # Authentication endpoint
     AUTH_ENDPOINT = '/authorisation/token'
     
     # Token configuration
     DEFAULT_TOKEN_EXPIRY = 3600  # 1 hour in seconds
     TOKEN_REFRESH_BUFFER = 60    # Refresh 1 minute before expiry
+    # Renew the token in the background before the buffer runs out, so no request waits on auth
+    TOKEN_BACKGROUND_REFRESH = os.getenv('TOKEN_BACKGROUND_REFRESH', 'true').lower() in ('1', 'true', 'yes')
+    # Re-authenticate once (process-wide) and retry a request when the API answers 401
+    AUTH_RETRY_ON_401 = os.getenv('AUTH_RETRY_ON_401', 'true').lower() in ('1', 'true', 'yes')
+    # Token pool: spread users over several OAuth clients, each with its own token and refresh
+    # ("id1:secret1,id2:secret2"; unset = CLIENT_ID/CLIENT_SECRET only)
+    CLIENT_CREDENTIALS = [
+        tuple(pair.split(':', 1))
+        for pair in os.getenv('CLIENT_CREDENTIALS', '').replace(' ', '').split(',') if ':' in pair
+    ]
+    TOKEN_ASSIGNMENT = os.getenv('TOKEN_ASSIGNMENT', 'round_robin')  # 'round_robin' or 'hash'
+    # Distributed runs: the master authenticates and sends tokens to workers (see auth/token_broker.py)
+    TOKEN_BROKER = os.getenv('TOKEN_BROKER', 'true').lower() in ('1', 'true', 'yes')
+    TOKEN_BROKER_TIMEOUT = float(os.getenv('TOKEN_BROKER_TIMEOUT', '10'))  # Seconds a worker waits before authenticating itself
     
     @classmethod
     def validate(cls):
         """Validate that all required settings are present"""
-        required_settings = ['API_HOST', 'CLIENT_ID', 'CLIENT_SECRET']
+        required_settings = ['API_HOST'] if cls.CLIENT_CREDENTIALS else ['API_HOST', 'CLIENT_ID', 'CLIENT_SECRET']
         missing = []
         
         for setting in required_settings:
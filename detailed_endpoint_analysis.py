@@ -2,28 +2,30 @@
 """
 Script to get detailed information about specific endpoint PUT operations
 This script provides comprehensive analysis of PUT endpoints for any resource type
+
+The spec is loaded through tests/base/openapi_spec.py: parsed and indexed once, then served
+from the binary cache in SPEC_CACHE_DIR until the JSON file changes.
 """
-import json
+from gevent import monkey
+monkey.patch_all()
+
 import argparse
+from tests.base.openapi_spec import load_spec
 
 def get_detailed_put_info(api_file, endpoint_type):
     """Get detailed information about PUT endpoints for a specific type"""
     try:
-        with open(api_file, 'r', encoding='utf-8') as f:
-            api_data = json.load(f)
+        spec = load_spec(api_file)
     except Exception as e:
         print(f"Error reading API file: {e}")
         return
     
     print(f"=== DETAILED {endpoint_type.upper()} PUT ENDPOINTS ===\n")
     
-    paths = api_data['paths']
-    put_endpoints = []
+    matches = spec.search(endpoint_type)
     
     # Find all PUT endpoints for the specified type
-    for path, methods in paths.items():
-        if endpoint_type.lower() in path.lower() and 'put' in methods:
-            put_endpoints.append((path, methods['put']))
+    put_endpoints = [(path, spec.by_path[path]['PUT'].details) for path in matches.paths if 'PUT' in spec.by_path[path]]
     
     if not put_endpoints:
         print(f"No PUT endpoints found for {endpoint_type}")
@@ -37,7 +39,7 @@ def get_detailed_put_info(api_file, endpoint_type):
         
         # Check request body
         if 'requestBody' in put_info:
-            req_body = put_info['requestBody']
+            req_body = spec.deref(put_info['requestBody'])
             print(f"   Request Body Required: {req_body.get('required', False)}")
             if 'content' in req_body and 'application/json' in req_body['content']:
                 schema = req_body['content']['application/json'].get('schema', {})
@@ -59,72 +61,57 @@ def get_detailed_put_info(api_file, endpoint_type):
     
     # Check what schemas are available for this endpoint type
     print(f"=== AVAILABLE {endpoint_type.upper()} SCHEMAS ===\n")
-    if 'components' in api_data and 'schemas' in api_data['components']:
-        schemas = api_data['components']['schemas']
-        found_schemas = False
-        for schema_name, schema_data in schemas.items():
-            if endpoint_type.lower() in schema_name.lower():
-                found_schemas = True
-                print(f"Schema: {schema_name}")
-                if 'properties' in schema_data:
-                    print("  Properties:")
-                    for prop_name, prop_data in schema_data['properties'].items():
-                        prop_type = prop_data.get('type', 'unknown')
-                        prop_desc = prop_data.get('description', 'No description')
-                        print(f"    - {prop_name} ({prop_type}): {prop_desc}")
-                print()
-        
-        if not found_schemas:
-            print(f"No schemas found for {endpoint_type}")
+    for schema_name in matches.schemas:
+        schema_data = spec.schemas[schema_name]
+        print(f"Schema: {schema_name}")
+        if 'properties' in schema_data:
+            print("  Properties:")
+            for prop_name, prop_data in schema_data['properties'].items():
+                prop_type = prop_data.get('type', 'unknown')
+                prop_desc = prop_data.get('description', 'No description')
+                print(f"    - {prop_name} ({prop_type}): {prop_desc}")
+        print()
+    
+    if not matches.schemas:
+        print(f"No schemas found for {endpoint_type}")
     
     # Check parameters for this endpoint type
     print(f"=== AVAILABLE {endpoint_type.upper()} PARAMETERS ===\n")
-    if 'components' in api_data and 'parameters' in api_data['components']:
-        parameters = api_data['components']['parameters']
-        found_params = False
-        for param_name, param_data in parameters.items():
-            if endpoint_type.lower() in param_name.lower():
-                found_params = True
-                print(f"Parameter: {param_name}")
-                print(f"  Description: {param_data.get('description', 'N/A')}")
-                print(f"  In: {param_data.get('in', 'N/A')}")
-                print(f"  Required: {param_data.get('required', False)}")
-                if 'schema' in param_data:
-                    schema = param_data['schema']
-                    print(f"  Type: {schema.get('type', 'unknown')}")
-                print()
-        
-        if not found_params:
-            print(f"No parameters found for {endpoint_type}")
+    for param_name in matches.parameters:
+        param_data = spec.parameters[param_name]
+        print(f"Parameter: {param_name}")
+        print(f"  Description: {param_data.get('description', 'N/A')}")
+        print(f"  In: {param_data.get('in', 'N/A')}")
+        print(f"  Required: {param_data.get('required', False)}")
+        if 'schema' in param_data:
+            schema = param_data['schema']
+            print(f"  Type: {schema.get('type', 'unknown')}")
+        print()
+    
+    if not matches.parameters:
+        print(f"No parameters found for {endpoint_type}")
     
     # Check for other methods on the same endpoints
     print(f"=== OTHER METHODS FOR {endpoint_type.upper()} ENDPOINTS ===\n")
-    for path, methods in paths.items():
-        if endpoint_type.lower() in path.lower():
-            print(f"Endpoint: {path}")
-            for method, details in methods.items():
-                if method.upper() != 'PUT':
-                    print(f"  {method.upper()}: {details.get('summary', 'N/A')}")
-            print()
+    for path in matches.paths:
+        print(f"Endpoint: {path}")
+        for method, operation in spec.by_path[path].items():
+            if method != 'PUT':
+                print(f"  {method}: {operation.details.get('summary', 'N/A')}")
+        print()
 
 def analyze_all_put_endpoints(api_file):
     """Analyze all PUT endpoints in the API"""
     try:
-        with open(api_file, 'r', encoding='utf-8') as f:
-            api_data = json.load(f)
+        spec = load_spec(api_file)
     except Exception as e:
         print(f"Error reading API file: {e}")
         return
     
     print("=== ALL PUT ENDPOINTS IN API ===\n")
     
-    paths = api_data['paths']
-    put_endpoints = []
-    
     # Find all PUT endpoints
-    for path, methods in paths.items():
-        if 'put' in methods:
-            put_endpoints.append((path, methods['put']))
+    put_endpoints = [(operation.path, operation.details) for operation in spec.by_method.get('PUT', ())]
     
     if not put_endpoints:
         print("No PUT endpoints found in the API")
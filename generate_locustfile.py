@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Locustfile generator - one weighted task per operation of the OpenAPI spec
+
+Reads ``scorebuddy_open_api.json`` through tests/base/openapi_spec.py (the indexes the
+analysis scripts use) and writes a locustfile with one ``CoverageTest`` subclass per resource
+(``ScorecardsCoverage``, ``IntegrationsCoverage``...) and one task per operation, tagged with
+its method and resource. Path parameter binding, disposable targets for mutating operations
+and cleanup are decided at run time by tests/base/coverage.py; operations it cannot send
+safely (the token endpoint, multipart uploads, mutations with nothing disposable to act on)
+are listed in the generated module's docstring instead.
+
+Task weights come from METHOD_WEIGHTS (override per operation with --weight). Each class's
+weight is the sum of its task weights, so an operation's share of the requests is its task
+weight over the total, whichever resource it belongs to. Classes are per resource rather than
+per method so that every resource's writes run even with a few dozen users.
+
+    python generate_locustfile.py                                  # writes tests/generated/api_coverage.py
+    python generate_locustfile.py --resources scorecards,integrations --methods GET
+    python generate_locustfile.py --weight getScores=20 --weight insertStaff=0
+    python generate_locustfile.py --check                          # exit 1 if the output is stale
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from collections import defaultdict
+from tests.base.coverage import UnplannedOperation, plan_operation
+from tests.base.openapi_spec import OPENAPI_SPEC_FILE, load_spec
+
+DEFAULT_OUTPUT = os.path.join('tests', 'generated', 'api_coverage.py')
+
+# Task weight per HTTP method
+METHOD_WEIGHTS = {
+    'GET': 10,
+    'POST': 2,
+    'PUT': 2,
+    'PATCH': 2,
+    'DELETE': 1,
+}
+
+MODULE_TEMPLATE = '''"""
+Full ScoreBuddy API coverage - GENERATED by generate_locustfile.py, do not edit
+
+Source: {spec} (sha1 {digest})
+
+    locust -f {output} --headless -u 50 -r 10 --run-time 10m
+    locust -f {output} --tags scorecards get
+
+One class per resource, one task per operation (tagged with its method and resource); class
+weights are the sums of their task weights. Path parameters, created targets and cleanup are
+handled by tests/base/coverage.py.
+{skipped}"""
+from locust import task, tag
+from tests.base.coverage import CoverageTest
+'''
+
+CLASS_TEMPLATE = '''
+
+class {name}(CoverageTest):
+    """Operations on /{resource}"""
+    weight = {weight}
+'''
+
+TASK_TEMPLATE = '''
+    @task({weight})
+    @tag({tags})
+    def {name}(self):
+        """{method} {path} - {summary}"""
+        self.call_operation({operation_id!r})
+'''
+
+
+def _snake_case(name):
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', name).lower()
+
+
+def _class_name(resource):
+    return f"{''.join(part.title() for part in resource.split('_'))}Coverage"
+
+
+def _summary(operation):
+    summary = (operation.details.get('summary') or operation.operation_id).strip().splitlines()[0]
+    return summary.replace('\\', '/').replace('"', "'")
+
+
+def generate(spec_file, output, resources=None, methods=None, weights=None):
+    """Return (module source, number of tasks, {operationId: reason not covered})"""
+    with open(spec_file, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    spec = load_spec(spec_file)
+    weights = weights or {}
+    classes = defaultdict(list)  # resource -> [(weight, operation), ...]
+    skipped = {}
+    for operation in spec.operations:
+        if resources and operation.resource not in resources:
+            continue
+        if methods and operation.method not in methods:
+            continue
+        if not operation.operation_id:
+            skipped[f"{operation.method} {operation.path}"] = "no operationId"
+            continue
+        try:
+            plan_operation(operation.operation_id)
+        except UnplannedOperation as e:
+            skipped[operation.operation_id] = f"{operation.method} {operation.path} - {e}"
+            continue
+        weight = weights.get(operation.operation_id, METHOD_WEIGHTS.get(operation.method, 1))
+        if weight > 0:
+            classes[operation.resource].append((weight, operation))
+
+    skipped_text = ''
+    if skipped:
+        skipped_text = '\nNot covered:\n' + ''.join(f"    {reason}\n" for reason in skipped.values())
+    parts = [MODULE_TEMPLATE.format(spec=os.path.basename(spec_file), digest=digest,
+                                    output=output.replace(os.sep, '/'), skipped=skipped_text)]
+    task_count = 0
+    for resource, tasks in classes.items():
+        parts.append(CLASS_TEMPLATE.format(name=_class_name(resource), resource=resource,
+                                           weight=sum(weight for weight, _ in tasks)))
+        for weight, operation in tasks:
+            tags = ', '.join(repr(name) for name in (operation.method.lower(), resource, 'coverage'))
+            parts.append(TASK_TEMPLATE.format(weight=weight, tags=tags, name=_snake_case(operation.operation_id),
+                                              method=operation.method, path=operation.path,
+                                              summary=_summary(operation), operation_id=operation.operation_id))
+            task_count += 1
+    return ''.join(parts), task_count, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a locustfile covering every operation of the OpenAPI spec')
+    parser.add_argument('--spec', default=OPENAPI_SPEC_FILE, help='OpenAPI JSON file')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"Locustfile to write (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--resources', help='Comma-separated resources (first path segments) to cover (default: all)')
+    parser.add_argument('--methods', help='Comma-separated HTTP methods to cover (default: all)')
+    parser.add_argument('--weight', action='append', default=[], metavar='OPERATION_ID=WEIGHT',
+                        help='Task weight for one operation (0 leaves it out); repeatable')
+    parser.add_argument('--check', action='store_true', help='Only check that the output is up to date')
+    args = parser.parse_args()
+
+    weights = {}
+    for item in args.weight:
+        operation_id, _, weight = item.partition('=')
+        try:
+            weights[operation_id] = int(weight)
+        except ValueError:
+            parser.error(f"--weight expects OPERATION_ID=WEIGHT, got {item!r}")
+    resources = {resource for resource in (args.resources or '').replace(' ', '').split(',') if resource}
+    methods = {method.upper() for method in (args.methods or '').replace(' ', '').split(',') if method}
+
+    source, task_count, skipped = generate(args.spec, args.output, resources, methods, weights)
+    if args.check:
+        try:
+            with open(args.output, 'r', encoding='utf-8') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{args.output} is out of date - run generate_locustfile.py")
+            return 1
+        print(f"{args.output} is up to date ({task_count} tasks)")
+        return 0
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"Wrote {args.output}: {task_count} tasks, {len(skipped)} operations not covered")
+    for reason in skipped.values():
+        print(f"  not covered: {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
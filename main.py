@@ -1,9 +1,13 @@
-from locust import HttpUser, task
+from locust import task
 from config.settings import settings
 from auth.token_manager import token_manager
+from tests.base.engine import ResourceUser
+from tests.base.log import get_logger
 
+log = get_logger('main')
 
-class LoadTestUser(HttpUser):
+
+class LoadTestUser(ResourceUser):
     """Main Locust user class for load testing"""
     
     def on_start(self):
@@ -25,54 +29,55 @@ class LoadTestUser(HttpUser):
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json"
             })
+            token_manager.register_client(self.client)
         else:
-            print("Failed to get authentication token")
+            log.warning("Failed to get authentication token")
     
     @task(3)  # Weight 3 - most frequent
     def get_scorecard_categories(self):
         """Get scorecard categories - most common operation"""
         response = self.client.get("/scorecards/categories")
         if response.status_code != 200:
-            print(f"Categories API failed: {response.status_code}")
+            log.warning("Categories API failed: %s", response.status_code)
     
     @task(2)  # Weight 2 - frequent
     def get_users(self):
         """Get users list"""
         response = self.client.get("/users")
         if response.status_code != 200:
-            print(f"Users API failed: {response.status_code}")
+            log.warning("Users API failed: %s", response.status_code)
     
     @task(2)  # Weight 2 - frequent
     def get_teams(self):
         """Get teams list"""
         response = self.client.get("/teams")
         if response.status_code != 200:
-            print(f"Teams API failed: {response.status_code}")
+            log.warning("Teams API failed: %s", response.status_code)
     
     @task(1)  # Weight 1 - less frequent
     def get_staff(self):
         """Get staff list"""
         response = self.client.get("/staff")
         if response.status_code != 200:
-            print(f"Staff API failed: {response.status_code}")
+            log.warning("Staff API failed: %s", response.status_code)
     
     @task(1)  # Weight 1 - less frequent
     def get_groups(self):
         """Get groups list"""
         response = self.client.get("/groups")
         if response.status_code != 200:
-            print(f"Groups API failed: {response.status_code}")
+            log.warning("Groups API failed: %s", response.status_code)
     
     @task(1)  # Weight 1 - less frequent
     def get_scores(self):
         """Get scores data"""
         response = self.client.get("/scores")
         if response.status_code != 200:
-            print(f"Scores API failed: {response.status_code}")
+            log.warning("Scores API failed: %s", response.status_code)
     
     @task(1)  # Weight 1 - less frequent
     def get_scorecards(self):
         """Get scorecards list"""
         response = self.client.get("/scorecards")
         if response.status_code != 200:
-            print(f"Scorecards API failed: {response.status_code}")
+            log.warning("Scorecards API failed: %s", response.status_code)
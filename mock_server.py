@@ -0,0 +1,840 @@
+#!/usr/bin/env python3
+"""
+Local ScoreBuddy API stand-in - an in-memory mock of the API for offline benchmarking
+
+Serves every path of ``scorebuddy_open_api.json`` so the load tests can run against
+localhost at full speed, without staging credentials, rate limits or test data left behind:
+
+- ``POST /authorisation/token`` issues bearer tokens (valid for --token-ttl seconds); every
+  other request needs one, and expired or unknown tokens get a 401 like the real API.
+- Staff (and the employee/supervisor views), users, teams, groups, integrations, scores,
+  scorecards and scorecard categories are kept in memory: lists are paginated (``limit``,
+  ``page``, ``total``, ``next_page``) and filtered by item fields, POST/PUT create or upsert
+  (409 on a duplicate name or email), PATCH updates, DELETE soft-deletes (``deleted: true``,
+  still listed and readable) where the API has a ``/hard`` delete and removes otherwise.
+  Fixtures are seeded over the ID registry's fallback ranges (staff 590-638, teams 34-45,
+  scorecards 70-89...).
+- Any other path of the spec answers statelessly with a response built from its schema
+  (nested lists hold NESTED_ITEMS items); paths outside the spec answer 404.
+
+Responses are delayed by a latency distribution (--latency, --write-latency) and a share of
+them can be replaced with injected 401, 409 (writes only) and 429 errors.
+
+With --processes N the listening socket is shared by N forked worker processes, each with
+its own event loop and store. IDs created by one worker are not visible to the others:
+workers answer GET/PATCH/DELETE for IDs that another worker created (IDs from
+CREATED_ID_BASE on) as if the entity existed, so create-then-delete flows keep working
+across connections. Stdlib asyncio only (uvloop is used when installed); unlike the other
+tools this one does not import tests/, whose package imports locust and its gevent patching.
+
+    python mock_server.py                                      # http://127.0.0.1:8080
+    python mock_server.py --processes 4 --latency lognormal:40:0.5 --write-latency uniform:80:200
+    python mock_server.py --error-429 0.02 --error-401 0.001 --token-ttl 300
+    locust -f tests/staff/staff_get.py --host http://127.0.0.1:8080 --headless -u 200 -r 50 -t 5m
+"""
+import argparse
+import asyncio
+import hmac
+import json
+import math
+import multiprocessing
+import os
+import random
+import re
+import secrets
+import signal
+import socket
+import sys
+import time
+from collections import Counter
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from config.settings import settings
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+DEFAULT_SPEC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scorebuddy_open_api.json')
+DEFAULT_PORT = 8080
+
+# Stateful collections: path template -> (store, fields fixed by the view)
+COLLECTIONS = {
+    '/staff': ('staff', {}),
+    '/staff/employees': ('staff', {'role': 'employee'}),
+    '/staff/supervisors': ('staff', {'role': 'supervisor'}),
+    '/users': ('users', {}),
+    '/teams': ('teams', {}),
+    '/groups': ('groups', {}),
+    '/integrations': ('integrations', {}),
+    '/scores': ('scores', {}),
+    '/scorecards': ('scorecards', {}),
+    '/scorecards/categories': ('scorecard_categories', {}),
+}
+
+# Fields unique within a store: POST with a taken value answers 409, PUT updates its owner
+UNIQUE_FIELDS = {
+    'staff': ('email_address', 'external_id'),
+    'users': ('email_address',),
+    'teams': ('team_name',),
+    'groups': ('group_name',),
+    'integrations': ('label',),
+}
+
+# Seeded fixtures per store: (IDs, soft-deleted IDs) - the ID registry's fallback ranges
+FIXTURE_IDS = {
+    'staff': (range(500, 639), range(500, 590)),
+    'users': (range(100, 150), ()),
+    'teams': (range(1, 46), range(1, 34)),
+    'groups': (range(32, 38), ()),
+    'integrations': (range(1, 6), ()),
+    'scorecards': (range(70, 90), ()),
+    'scorecard_categories': ((5, 8, 27, 44, 45, 46), ()),
+}
+
+# Field values of the seeded fixtures, by store (everything else comes from the item schema)
+FIXTURE_FIELDS = {
+    'staff': lambda n: {
+        'first_name': 'Staff', 'last_name': str(n), 'email_address': f"staff{n}@example.com",
+        'external_id': f"staff-{n}", 'role': 'supervisor' if n % 5 == 0 else 'employee',
+        'group_ids': [32 + n % 6], 'team_ids': [34 + n % 12], 'supervisor_id': 590 + 5 * (n % 10),
+    },
+    'users': lambda n: {'first_name': 'User', 'last_name': str(n), 'email_address': f"user{n}@example.com"},
+    'teams': lambda n: {'team_name': f"Team {n}", 'group_id': 32 + n % 6},
+    'groups': lambda n: {'group_name': f"Group {n}"},
+    'integrations': lambda n: {'label': f"Integration {n}"},
+    'scores': lambda n: {
+        'scorecard_id': 70 + n % 20, 'staff_id': 590 + n % 49, 'group_id': 32 + n % 6, 'team_id': 34 + n % 12,
+    },
+    'scorecard_categories': lambda n: {'category': f"Category {n}"},
+}
+
+# First ID of created entities; worker i of N creates IDs i, i + N, i + 2N... from here
+CREATED_ID_BASE = 1000000
+
+# Items in the lists of paths that are not modelled (nested scorecard and integration lists)
+NESTED_ITEMS = 3
+
+# Largest accepted ``limit`` (the spec allows 100 on every list)
+MAX_LIMIT = 100
+
+_PARAM = re.compile(r'\{([^}]+)\}')
+_LIMIT_REF = re.compile(r'query_limit_(\d+)$')
+
+PAGING_PARAMS = ('limit', 'page')
+
+
+def _dumps(obj):
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+class Latency:
+    """Response delay distribution in milliseconds, parsed from ``name[:arg[:arg]]``
+
+    none, fixed:MS, uniform:MIN:MAX, normal:MEAN:STDDEV, lognormal:MEDIAN:SIGMA, exponential:MEAN
+    """
+
+    ARGUMENTS = {'none': 0, 'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2, 'exponential': 1}
+
+    def __init__(self, text):
+        name, *args = (text or 'none').split(':')
+        if name not in self.ARGUMENTS:
+            raise ValueError(f"unknown latency distribution {name!r} (choose from {', '.join(self.ARGUMENTS)})")
+        if len(args) != self.ARGUMENTS[name]:
+            raise ValueError(f"{name} latency takes {self.ARGUMENTS[name]} arguments, got {text!r}")
+        self.name = name
+        self.args = [float(arg) for arg in args]
+
+    def sample(self, rng):
+        """Return one delay in seconds (never negative)"""
+        args = self.args
+        if self.name == 'none':
+            return 0.0
+        if self.name == 'fixed':
+            ms = args[0]
+        elif self.name == 'uniform':
+            ms = rng.uniform(args[0], args[1])
+        elif self.name == 'normal':
+            ms = rng.gauss(args[0], args[1])
+        elif self.name == 'lognormal':
+            ms = rng.lognormvariate(math.log(max(args[0], 1e-3)), args[1])
+        else:
+            ms = rng.expovariate(1.0 / args[0]) if args[0] > 0 else 0.0
+        return max(ms, 0.0) / 1000.0
+
+
+class Spec:
+    """The parts of the OpenAPI document the mock needs: $ref resolution, schemas and examples"""
+
+    def __init__(self, data):
+        self.data = data
+        self.paths = {path: {method.upper(): details for method, details in item.items()
+                             if method != 'parameters' and isinstance(details, dict)}
+                      for path, item in data.get('paths', {}).items()}
+
+    def deref(self, obj):
+        seen = set()
+        while isinstance(obj, dict) and '$ref' in obj and obj['$ref'] not in seen:
+            seen.add(obj['$ref'])
+            target = self.data
+            for part in obj['$ref'].lstrip('#/').split('/'):
+                target = target[part.replace('~1', '/').replace('~0', '~')]
+            obj = target
+        return obj
+
+    def properties(self, schema):
+        """Return the properties of an object schema, merging allOf members"""
+        schema = self.deref(schema)
+        if not isinstance(schema, dict):
+            return {}
+        properties = dict(schema.get('properties', {}))
+        for member in schema.get('allOf', []):
+            properties.update(self.properties(member))
+        return properties
+
+    def response_schema(self, method, path):
+        """Return (status, schema) of an operation's first 2xx response"""
+        responses = self.paths[path][method].get('responses', {})
+        for code, response in responses.items():
+            if code.startswith('2'):
+                content = self.deref(response).get('content', {}).get('application/json', {})
+                return int(code), self.deref(content.get('schema'))
+        return 200, None
+
+    def list_shape(self, path):
+        """Return (list key, item schema) of a GET list response, or (None, None)"""
+        _, schema = self.response_schema('GET', path)
+        for key, value in self.properties(schema).items():
+            value = self.deref(value)
+            if value.get('type') == 'array':
+                return key, self.deref(value.get('items', {}))
+        return None, None
+
+    def wrapper_key(self, method, path):
+        """Return the property wrapping the entity in an operation's response (``staff_member``...)"""
+        _, schema = self.response_schema(method, path)
+        properties = self.properties(schema)
+        return next(iter(properties), None) if len(properties) == 1 else None
+
+    def default_limit(self, path):
+        for parameter in self.paths[path]['GET'].get('parameters', []):
+            match = _LIMIT_REF.search(parameter.get('$ref', ''))
+            if match:
+                return int(match.group(1))
+        return 25
+
+    def example(self, schema, index=1, depth=0):
+        """Return a value matching a schema (spec examples where given, else a typed placeholder)"""
+        schema = self.deref(schema)
+        if not isinstance(schema, dict) or depth > 8:
+            return None
+        for combinator in ('oneOf', 'anyOf'):
+            if schema.get(combinator):
+                return self.example(schema[combinator][0], index, depth + 1)
+        properties = self.properties(schema)
+        if properties:
+            return {name: self.example(value, index, depth + 1) for name, value in properties.items()}
+        if 'example' in schema:
+            return schema['example']
+        if schema.get('enum'):
+            return schema['enum'][0]
+        kind = schema.get('type')
+        if kind == 'object':
+            return {}
+        if kind == 'array':
+            return []
+        if kind == 'integer':
+            return index
+        if kind == 'number':
+            return 0.0
+        if kind == 'boolean':
+            return False
+        if kind == 'string':
+            return {'date-time': '2024-01-01T00:00:00Z', 'date': '2024-01-01'}.get(schema.get('format'), '')
+        return None
+
+
+class Collection:
+    """A stateful collection template (``/staff``, ``/staff/employees``...) and its response shapes"""
+
+    def __init__(self, spec, template, store, fixed):
+        self.template = template
+        self.store = store
+        self.fixed = fixed                                           # Fields set and filtered by the view
+        self.list_key, self.item_schema = spec.list_shape(template)
+        self.item_template = next((path for path in spec.paths if path.startswith(f"{template}/{{")
+                                   and path.count('/') == template.count('/') + 1), None)
+        self.id_field = _PARAM.findall(self.item_template)[-1] if self.item_template else f"{store}_id"
+        self.item_key = (spec.wrapper_key('GET', self.item_template) if self.item_template else None) \
+            or (spec.wrapper_key('POST', template) if 'POST' in spec.paths[template] else None) \
+            or self.list_key
+        self.string_ids = spec.deref(spec.properties(self.item_schema).get(self.id_field, {})).get('type') == 'string'
+        self.soft_delete = bool(self.item_template) and f"{self.item_template}/hard" in spec.paths
+        self.default_limit = spec.default_limit(template)
+
+    def visible(self, item):
+        return all(item.get(field) == value for field, value in self.fixed.items())
+
+    def typed_id(self, key):
+        """Return a store key (or number) as the ID field's type in responses"""
+        if self.string_ids or not str(key).isdigit():
+            return str(key)
+        return int(key)
+
+
+class Store:
+    """Entities of one store by ID key (the path segment), with unique-field indexes"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = {}
+        self.unique_fields = UNIQUE_FIELDS.get(name, ())
+        self.unique = {field: {} for field in self.unique_fields}
+
+    def owner(self, item):
+        """Return the key of an entity holding one of ``item``'s unique values, or None"""
+        for field in self.unique_fields:
+            value = item.get(field)
+            if value is not None and value in self.unique[field]:
+                return self.unique[field][value]
+        return None
+
+    def put(self, key, item):
+        old = self.items.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self.items[key] = item
+        if not item.get('deleted'):
+            for field in self.unique_fields:
+                if item.get(field) is not None:
+                    self.unique[field][item[field]] = key
+
+    def remove(self, key):
+        item = self.items.pop(key, None)
+        if item is not None:
+            self._unindex(key, item)
+        return item
+
+    def _unindex(self, key, item):
+        for field in self.unique_fields:
+            if self.unique[field].get(item.get(field)) == key:
+                del self.unique[field][item[field]]
+
+
+class Route:
+    """One path template: how requests to it are answered"""
+
+    __slots__ = ('template', 'methods', 'kind', 'collection', 'parent', 'regex', 'params')
+
+    def __init__(self, template, methods, kind, collection=None, parent=None):
+        self.template = template
+        self.methods = methods
+        self.kind = kind                # 'token', 'collection', 'item', 'hard' or 'generic'
+        self.collection = collection    # Collection of stateful routes
+        self.parent = parent            # (Collection, param) a generic route hangs below, checked for 404
+        self.params = _PARAM.findall(template)
+        pattern = _PARAM.sub(lambda match: r'([^/]+)', re.escape(template).replace(r'\{', '{').replace(r'\}', '}'))
+        self.regex = re.compile(f"^{pattern}$")
+
+
+class Router:
+    """Maps request paths to Routes: literal paths by dict lookup, the rest by regex per first segment"""
+
+    def __init__(self, routes):
+        self.literal = {}
+        self.patterns = {}
+        for route in routes:
+            if not route.params:
+                self.literal[route.template] = route
+            else:
+                self.patterns.setdefault(route.template.split('/')[1], []).append(route)
+        for candidates in self.patterns.values():
+            # Literal segments win over parameters: /staff/employees before /staff/{staff_id}
+            candidates.sort(key=lambda route: (len(route.params), -len(_PARAM.sub('', route.template))))
+
+    def match(self, path):
+        """Return (Route, {param: value}) or (None, None)"""
+        route = self.literal.get(path)
+        if route is not None:
+            return route, {}
+        for route in self.patterns.get(path.split('/', 2)[1] if path.count('/') else '', ()):
+            match = route.regex.match(path)
+            if match:
+                return route, dict(zip(route.params, match.groups()))
+        return None, None
+
+
+class MockApi:
+    """Request handling of one worker process: auth, routing, the in-memory stores and injected faults"""
+
+    def __init__(self, spec, options, secret, worker=0, workers=1):
+        self.spec = spec
+        self.options = options
+        self.secret = secret
+        self.worker = worker
+        self.workers = workers
+        self.rng = random.Random()
+        self.latency = Latency(options.latency)
+        self.write_latency = Latency(options.write_latency) if options.write_latency else self.latency
+        self.counts = Counter()  # status -> responses
+        self.requests = 0
+        self._next_id = CREATED_ID_BASE + worker
+        self._generic = {}       # (method, template) -> (status, example body)
+
+        self.collections = {template: Collection(spec, template, store, fixed)
+                            for template, (store, fixed) in COLLECTIONS.items() if template in spec.paths}
+        self.stores = {collection.store: Store(collection.store) for collection in self.collections.values()}
+        self.router = Router(self._routes())
+        self._seed()
+
+    # Setup
+
+    def _routes(self):
+        items = {collection.item_template: collection for collection in self.collections.values()
+                 if collection.item_template}
+        routes = []
+        for template, methods in self.spec.paths.items():
+            if template == settings.AUTH_ENDPOINT:
+                routes.append(Route(template, methods, 'token'))
+            elif template in self.collections:
+                routes.append(Route(template, methods, 'collection', self.collections[template]))
+            elif template in items:
+                routes.append(Route(template, methods, 'item', items[template]))
+            elif template.endswith('/hard') and template[:-len('/hard')] in items:
+                routes.append(Route(template, methods, 'hard', items[template[:-len('/hard')]]))
+            else:
+                parent = next(((collection, collection.id_field) for item_template, collection in items.items()
+                               if template.startswith(f"{item_template}/")), None)
+                routes.append(Route(template, methods, 'generic', parent=parent))
+        return routes
+
+    def _seed(self):
+        for collection in self.collections.values():
+            if collection.fixed:
+                continue  # Views share the store of their base collection
+            ids, deleted = FIXTURE_IDS.get(collection.store, (range(1, self.options.scores + 1), ()))
+            deleted = set(deleted)
+            fields = FIXTURE_FIELDS.get(collection.store, lambda n: {})
+            store = self.stores[collection.store]
+            for n in ids:
+                item = self.spec.example(collection.item_schema, n) or {}
+                item.update(fields(n))
+                item[collection.id_field] = collection.typed_id(n)
+                if 'deleted' in item:
+                    item['deleted'] = n in deleted
+                store.put(str(n), item)
+
+    # Auth
+
+    def issue_token(self):
+        expires = int(time.time()) + self.options.token_ttl
+        signature = hmac.new(self.secret, str(expires).encode(), 'sha256').hexdigest()[:32]
+        return f"mock.{expires}.{signature}"
+
+    def token_valid(self, authorization):
+        if not authorization or not authorization.startswith('Bearer '):
+            return False
+        _, _, token = authorization.partition(' ')
+        parts = token.strip().split('.')
+        if len(parts) != 3 or not parts[1].isdigit() or int(parts[1]) < time.time():
+            return False
+        signature = hmac.new(self.secret, parts[1].encode(), 'sha256').hexdigest()[:32]
+        return hmac.compare_digest(signature, parts[2])
+
+    def _token(self, body):
+        try:
+            credentials = json.loads(body) if body else {}
+        except ValueError:
+            credentials = dict(parse_qsl(body.decode('latin-1')))
+        if not isinstance(credentials, dict) or not credentials.get('client_id'):
+            return 401, {'error': 'invalid_client'}
+        if self.options.client_id and (credentials.get('client_id') != self.options.client_id
+                                       or credentials.get('client_secret') != self.options.client_secret):
+            return 401, {'error': 'invalid_client'}
+        return 200, {'token_type': 'Bearer', 'expires_in': self.options.token_ttl, 'access_token': self.issue_token()}
+
+    # Requests
+
+    async def handle(self, method, target, headers, body):
+        """Answer one request: return (status, JSON-serializable body or None, extra headers)"""
+        self.requests += 1
+        path, _, query_string = target.partition('?')
+        path = path.rstrip('/') or '/'
+        writing = method in ('POST', 'PUT', 'PATCH', 'DELETE')
+        delay = (self.write_latency if writing else self.latency).sample(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if path == settings.AUTH_ENDPOINT and method == 'POST':
+            return self._respond(*self._token(body))
+        options = self.options
+        if not self.token_valid(headers.get('authorization')) \
+                or (options.error_401 and self.rng.random() < options.error_401):
+            return self._respond(401, {'error': 'invalid_token', 'message': 'Unauthorized'})
+        if options.error_429 and self.rng.random() < options.error_429:
+            return self._respond(429, {'error': 'Too Many Requests'}, {'Retry-After': str(options.retry_after)})
+
+        route, params = self.router.match(path)
+        if route is None:
+            return self._respond(404, {'error': f"No route for {path}"})
+        if method not in route.methods:
+            return self._respond(405, {'error': f"{method} not allowed on {route.template}"},
+                                 {'Allow': ', '.join(route.methods)})
+        if method in ('POST', 'PUT') and options.error_409 and self.rng.random() < options.error_409:
+            return self._respond(409, {'error': 'Conflict'})
+
+        data = None
+        if body and writing:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                return self._respond(400, {'error': 'Invalid JSON body'})
+        query = dict(parse_qsl(query_string))
+        if route.kind == 'collection':
+            return self._respond(*self._collection(route.collection, method, path, query, data,
+                                                   headers.get('host', '')))
+        if route.kind in ('item', 'hard'):
+            return self._respond(*self._item(route, method, params[route.collection.id_field], data))
+        return self._respond(*self._generic_response(route, method, params))
+
+    def _respond(self, status, payload, extra_headers=None):
+        self.counts[status] += 1
+        return status, payload, extra_headers
+
+    # Stateful collections
+
+    def _collection(self, collection, method, path, query, data, host):
+        store = self.stores[collection.store]
+        if method == 'GET':
+            return 200, self._page(collection, store, path, query, host)
+        if not isinstance(data, dict):
+            return 400, {'error': 'Request body must be a JSON object'}
+        item = dict(data, **collection.fixed)
+        owner = store.owner(item)
+        if owner is not None:
+            if method == 'POST':
+                return 409, {'error': f"{collection.store} already exists",
+                             collection.id_field: collection.typed_id(owner)}
+            existing = store.items[owner]
+            existing.update(item)
+            store.put(owner, existing)
+            return 200, {collection.item_key: existing}
+        number = self._next_id
+        self._next_id += self.workers
+        created = self.spec.example(collection.item_schema, number) or {}
+        created.update(item)
+        created[collection.id_field] = collection.typed_id(number)
+        if 'deleted' in created:
+            created['deleted'] = False
+        store.put(str(number), created)
+        return 201, {collection.item_key: created}
+
+    def _page(self, collection, store, path, query, host):
+        try:
+            limit = min(max(int(query.get('limit', collection.default_limit)), 1), MAX_LIMIT)
+            page = max(int(query.get('page', 1)), 1)
+        except ValueError:
+            limit, page = collection.default_limit, 1
+        item_fields = set(collection.item_schema and self.spec.properties(collection.item_schema) or ())
+        filters = [(field, value) for field, value in query.items()
+                   if field not in PAGING_PARAMS and field in item_fields]
+        items = store.items.values()
+        if collection.fixed or filters:
+            items = [item for item in items if collection.visible(item)
+                     and all(_field_matches(item.get(field), value) for field, value in filters)]
+        total = len(items)
+        start = (page - 1) * limit
+        if isinstance(items, list):
+            page_items = items[start:start + limit]
+        else:
+            page_items = [item for _, item in zip(range(start + limit), items)][start:]
+
+        def page_url(number):
+            return f"http://{host}{path}?{urlencode(dict(query, limit=limit, page=number))}"
+        return {
+            collection.list_key: page_items,
+            'total': total,
+            'next_page': page_url(page + 1) if start + limit < total else None,
+            'previous_page': page_url(page - 1) if page > 1 else None,
+        }
+
+    def _item(self, route, method, key, data):
+        collection = route.collection
+        store = self.stores[collection.store]
+        item = store.items.get(key)
+        if item is None or not collection.visible(item):
+            if self._created_elsewhere(key):
+                return self._foreign_item(route, method, key, data)
+            return 404, {'error': f"{collection.id_field} {key} not found"}
+        if method == 'GET':
+            return 200, {collection.item_key: item}
+        if method == 'DELETE':
+            if route.kind == 'item' and collection.soft_delete:
+                if item.get('deleted'):
+                    return 404, {'error': f"{collection.id_field} {key} already deleted"}
+                item['deleted'] = True
+                store.put(key, item)
+            else:
+                store.remove(key)
+            return 204, None
+        if not isinstance(data, dict):
+            return 400, {'error': 'Request body must be a JSON object'}
+        owner = store.owner(data)
+        if owner is not None and owner != key:
+            return 409, {'error': f"{collection.store} already exists",
+                         collection.id_field: collection.typed_id(owner)}
+        item.update(data)
+        item.update(collection.fixed)
+        item[collection.id_field] = collection.typed_id(key)
+        store.put(key, item)
+        return 200, {collection.item_key: item}
+
+    def _created_elsewhere(self, key):
+        """True if ``key`` is an ID another worker process created (not in this worker's store)"""
+        if self.workers == 1 or not key.isdigit():
+            return False
+        number = int(key)
+        return number >= CREATED_ID_BASE and (number - CREATED_ID_BASE) % self.workers != self.worker
+
+    def _foreign_item(self, route, method, key, data):
+        collection = route.collection
+        if method == 'DELETE':
+            return 204, None
+        item = self.spec.example(collection.item_schema, int(key)) or {}
+        if isinstance(data, dict):
+            item.update(data)
+        item.update(collection.fixed)
+        item[collection.id_field] = collection.typed_id(key)
+        return 200, {collection.item_key: item}
+
+    # Everything else in the spec
+
+    def _generic_response(self, route, method, params):
+        if route.parent is not None:
+            collection, param = route.parent
+            key = params.get(param)
+            item = self.stores[collection.store].items.get(key)
+            if item is None and not self._created_elsewhere(key):
+                return 404, {'error': f"{param} {key} not found"}
+        if method == 'DELETE':
+            return 204, None
+        cached = self._generic.get((method, route.template))
+        if cached is None:
+            cached = self._generic[(method, route.template)] = self._generic_example(route, method)
+        status, payload = cached
+        if not params or not isinstance(payload, dict):
+            return status, payload
+        # Echo the path parameters in the entity (one level down for wrapped responses)
+        payload = dict(payload)
+        for key, value in payload.items():
+            if isinstance(value, dict):
+                payload[key] = _with_params(value, params)
+        return status, _with_params(payload, params)
+
+    def _generic_example(self, route, method):
+        status, schema = self.spec.response_schema(method, route.template)
+        if schema is None:
+            return status, None
+        list_key, item_schema = self.spec.list_shape(route.template) if method == 'GET' else (None, None)
+        if list_key:
+            item_param = next((_PARAM.findall(path)[-1] for path in self.spec.paths
+                               if path.startswith(f"{route.template}/{{")
+                               and path.count('/') == route.template.count('/') + 1), None)
+            items = []
+            for index in range(1, NESTED_ITEMS + 1):
+                item = self.spec.example(item_schema, index) or {}
+                if isinstance(item, dict) and item_param:
+                    id_fields = [field for field in (item_param, f"{item_param}_id") if field in item]
+                    for field in id_fields or [item_param]:
+                        item[field] = index
+                items.append(item)
+            body = self.spec.example(schema) or {}
+            body.update({list_key: items, 'total': len(items), 'next_page': None, 'previous_page': None})
+            return status, body
+        return status, self.spec.example(schema)
+
+
+def _field_matches(value, wanted):
+    if isinstance(value, list):
+        return wanted in {str(member) for member in value}
+    if isinstance(value, bool):
+        return str(value).lower() == wanted.lower()
+    return str(value) == wanted
+
+
+def _with_params(obj, params):
+    updated = None
+    for param, value in params.items():
+        if param in obj and not isinstance(obj[param], (dict, list)):
+            updated = updated or dict(obj)
+            updated[param] = int(value) if value.isdigit() and isinstance(obj[param], int) else value
+    return updated or obj
+
+
+# HTTP/1.1 server
+
+async def _serve_connection(api, reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.LimitOverrunError:
+                await _write(writer, 431, {'error': 'Request header fields too large'}, None, False)
+                return
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, version = lines[0].split(' ', 2)
+            except ValueError:
+                await _write(writer, 400, {'error': 'Malformed request line'}, None, False)
+                return
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+            if 'chunked' in headers.get('transfer-encoding', '').lower():
+                await _write(writer, 411, {'error': 'Chunked request bodies are not supported'}, None, False)
+                return
+            length = int(headers.get('content-length') or 0)
+            body = await reader.readexactly(length) if length else b''
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+            if target.startswith(('http://', 'https://')):
+                target = urlsplit(target)._replace(scheme='', netloc='').geturl()
+
+            status, payload, extra_headers = await api.handle(method.upper(), target, headers, body)
+            await _write(writer, status, payload, extra_headers, keep_alive)
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _write(writer, status, payload, extra_headers, keep_alive):
+    body = _dumps(payload) if payload is not None else b''
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Length: {len(body)}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    if body:
+        lines.append('Content-Type: application/json')
+    for name, value in (extra_headers or {}).items():
+        lines.append(f"{name}: {value}")
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+
+
+async def _report(api, interval):
+    last_requests, last_time = 0, time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        now = time.monotonic()
+        if api.requests != last_requests:
+            statuses = ', '.join(f"{status}: {count}" for status, count in sorted(api.counts.items()))
+            print(f"[worker {api.worker}] {api.requests} requests, "
+                  f"{(api.requests - last_requests) / (now - last_time):.0f}/s ({statuses})", flush=True)
+        last_requests, last_time = api.requests, now
+
+
+async def _watch_parent(server, parent):
+    # Workers must not outlive a parent killed without the chance to terminate them
+    while os.getppid() == parent:
+        await asyncio.sleep(1.0)
+    server.close()
+
+
+async def _serve(api, sock, stats_interval, parent=None):
+    server = await asyncio.start_server(lambda reader, writer: _serve_connection(api, reader, writer),
+                                        sock=sock, backlog=4096)
+    loop = asyncio.get_running_loop()
+    tasks = [loop.create_task(_report(api, stats_interval))] if stats_interval > 0 else []
+    if parent is not None:
+        tasks.append(loop.create_task(_watch_parent(server, parent)))
+    async with server:
+        try:
+            await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+
+
+def run_worker(worker, workers, sock, spec, options, secret, parent=None):
+    """Serve on a listening socket until interrupted (one process of --processes)"""
+    random.seed()  # Forked workers inherit the parent's random state
+    api = MockApi(spec, options, secret, worker, workers)
+    try:
+        (uvloop.run if uvloop else asyncio.run)(_serve(api, sock, options.stats_interval, parent))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='In-memory ScoreBuddy API stand-in for offline benchmarking')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--processes', type=int, default=1, help='Worker processes sharing the port')
+    parser.add_argument('--spec', default=DEFAULT_SPEC, help='OpenAPI JSON file')
+    parser.add_argument('--latency', default='none',
+                        help='Response delay in ms: none, fixed:MS, uniform:MIN:MAX, normal:MEAN:STDDEV, '
+                             'lognormal:MEDIAN:SIGMA or exponential:MEAN')
+    parser.add_argument('--write-latency', help='Delay of POST/PUT/PATCH/DELETE responses (default: --latency)')
+    parser.add_argument('--error-401', type=float, default=0.0, help='Share of requests rejected with 401')
+    parser.add_argument('--error-409', type=float, default=0.0, help='Share of POST/PUT requests rejected with 409')
+    parser.add_argument('--error-429', type=float, default=0.0, help='Share of requests rejected with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds of 429 responses')
+    parser.add_argument('--token-ttl', type=int, default=settings.DEFAULT_TOKEN_EXPIRY,
+                        help='Seconds an issued token stays valid')
+    parser.add_argument('--client-id', help='Only accept this client ID (default: any)')
+    parser.add_argument('--client-secret', help='Client secret required with --client-id')
+    parser.add_argument('--scores', type=int, default=1000, help='Seeded scores')
+    parser.add_argument('--stats-interval', type=float, default=10.0,
+                        help='Seconds between per-worker request counts (0 = quiet)')
+    args = parser.parse_args()
+
+    for name in ('error_401', 'error_409', 'error_429'):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    for name in ('latency', 'write_latency'):
+        try:
+            Latency(getattr(args, name))
+        except ValueError as e:
+            parser.error(f"--{name.replace('_', '-')}: {e}")
+    if args.processes > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        parser.error("--processes needs a platform that can fork")
+
+    with open(args.spec, 'r', encoding='utf-8') as f:
+        spec = Spec(json.load(f))
+    secret = secrets.token_bytes(32)
+    sock = socket.create_server((args.host, args.port), backlog=4096)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    faults = ', '.join(f"{code}: {rate:g}" for code, rate in (('401', args.error_401), ('409', args.error_409),
+                                                              ('429', args.error_429)) if rate) or 'none'
+    print(f"ScoreBuddy mock API on http://{args.host}:{args.port} - {max(args.processes, 1)} processes, "
+          f"{len(spec.paths)} paths, latency {args.latency} (writes {args.write_latency or args.latency}), "
+          f"injected errors {faults}{', uvloop' if uvloop else ''}", flush=True)
+
+    if args.processes <= 1:
+        run_worker(0, 1, sock, spec, args, secret)
+        return 0
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=run_worker, args=(worker, args.processes, sock, spec, args, secret, os.getpid()),
+                               name=f"mock-worker-{worker}", daemon=True)
+               for worker in range(args.processes)]
+    for process in workers:
+        process.start()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in workers:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in workers:
+            process.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""
+Load shape selector - add to any test file to drive it with a shape from tests/base/shapes.py
+
+    LOAD_SHAPE=step locust -f tests/staff/staff_get.py,shape.py --headless
+"""
+from config.settings import settings
+from tests.base.shapes import get_shape
+
+# The only LoadTestShape in this module, so Locust picks it up
+SelectedShape = get_shape(settings.LOAD_SHAPE)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Orphan sweeper - deletes what crashed or interrupted load test runs left behind
+
+Replays the cleanup journals (tests/base/cleanup_journal.py) in CLEANUP_JOURNAL_DIR, collects
+every resource that was created but never deleted, and deletes them concurrently. Staff are
+hard-deleted (``/staff/{staff_id}/hard``) wherever the API has a hard-delete endpoint, so they
+no longer weigh on ``/staff`` list queries. Progress and throughput are printed while it runs.
+
+Each successful delete (or 404 - already gone) is appended to its journal, so an interrupted
+sweep can simply be run again; fully swept journals are removed. Run it while no load test
+is writing journals to the same directory.
+
+    python sweep.py                       # all journals, hosts as recorded
+    python sweep.py --dry-run             # only count the leftovers
+    python sweep.py --concurrency 50 --host https://YOUR_HOST/api/v1
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+import gevent
+from gevent.pool import Pool
+from locust.event import Events
+from config.settings import settings
+from tests.base.cleanup import hard_delete_path, open_session
+from tests.base.cleanup_journal import journal_files, read_journal
+from tests.base.endpoint_names import endpoint_matcher
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 2.0
+
+
+class Sweeper:
+    """Deletes the leftovers of a set of journals with a bounded pool of greenlets"""
+
+    def __init__(self, concurrency, hard=True):
+        self.concurrency = concurrency
+        self.hard = hard
+        self.counts = Counter()  # deleted / gone / failed
+        self.total = 0
+        self._started = None
+        self._journals = {}  # journal path -> open file for appending 'deleted' records
+
+    def sweep(self, host, items):
+        """Delete ``items`` ([(journal, path), ...]) on one host"""
+        session = open_session(host, Events().request, self.concurrency)
+        if session is None:
+            print(f"No authentication token for {host} - skipping {len(items)} resources")
+            self.counts['failed'] += len(items)
+            return
+
+        def delete(item):
+            journal, path = item
+            url = hard_delete_path(path) if self.hard else path
+            response = session.delete(url)
+            if response.status_code in (200, 204, 404):
+                self.counts['deleted' if response.status_code != 404 else 'gone'] += 1
+                self._record_deleted(journal, path)
+            else:
+                self.counts['failed'] += 1
+                print(f"  DELETE {url} failed: {response.status_code} {response.text[:200]}")
+
+        pool = Pool(self.concurrency)
+        for item in items:
+            pool.spawn(delete, item)
+        pool.join()
+
+    def run(self, leftovers):
+        """Sweep {host: [(journal, path), ...]}, printing progress; return the counts"""
+        self.total = sum(len(items) for items in leftovers.values())
+        self._started = time.time()
+        reporter = gevent.spawn(self._report_progress)
+        try:
+            for host, items in leftovers.items():
+                print(f"Sweeping {len(items)} resources on {host}")
+                self.sweep(host, items)
+        finally:
+            reporter.kill()
+            for journal_file in self._journals.values():
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+                journal_file.close()
+        self._print_progress()
+        return self.counts
+
+    def _record_deleted(self, journal, path):
+        journal_file = self._journals.get(journal)
+        if journal_file is None:
+            journal_file = self._journals[journal] = open(journal, 'a', encoding='utf-8')
+        journal_file.write(json.dumps({'event': 'deleted', 'path': path}) + '\n')
+
+    def _report_progress(self):
+        while True:
+            gevent.sleep(PROGRESS_INTERVAL)
+            self._print_progress()
+            for journal_file in self._journals.values():
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def _print_progress(self):
+        done = sum(self.counts.values())
+        elapsed = max(time.time() - self._started, 1e-9)
+        percent = 100.0 * done / self.total if self.total else 100.0
+        print(f"  {done}/{self.total} ({percent:.0f}%) - {self.counts['deleted']} deleted, "
+              f"{self.counts['gone']} already gone, {self.counts['failed']} failed - {done / elapsed:.1f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delete resources left behind by interrupted load test runs')
+    parser.add_argument('journals', nargs='*', help='Journal files (default: all in --dir)')
+    parser.add_argument('--dir', default=settings.CLEANUP_JOURNAL_DIR, help='Journal directory')
+    parser.add_argument('--host', help='API host to use instead of the one recorded in each journal')
+    parser.add_argument('--concurrency', type=int, default=max(settings.CLEANUP_CONCURRENCY, 1),
+                        help='Concurrent DELETE requests')
+    parser.add_argument('--no-hard', action='store_true', help='Never use the /hard delete endpoints')
+    parser.add_argument('--dry-run', action='store_true', help='Only report what would be deleted')
+    args = parser.parse_args()
+
+    journals = args.journals or journal_files(args.dir)
+    leftovers = defaultdict(list)  # host -> [(journal, path), ...]
+    swept = []
+    for journal in journals:
+        host, paths = read_journal(journal)
+        host = args.host or host or settings.API_HOST
+        if not paths:
+            swept.append(journal)
+            continue
+        leftovers[host].extend((journal, path) for path in paths)
+        print(f"{journal}: {len(paths)} leftovers on {host}")
+
+    total = sum(len(items) for items in leftovers.values())
+    if args.dry_run:
+        by_endpoint = Counter(endpoint_matcher.match(path) or path for items in leftovers.values() for _, path in items)
+        for endpoint, count in by_endpoint.most_common():
+            print(f"  {endpoint}: {count}")
+        print(f"{total} resources would be deleted")
+        return 0
+
+    failed = 0
+    if total:
+        failed = Sweeper(args.concurrency, hard=not args.no_hard).run(leftovers)['failed']
+        if failed:
+            print(f"{failed} deletes failed - their journals are kept for another sweep")
+        swept.extend(journal for journal in journals if journal not in swept and not read_journal(journal)[1])
+    else:
+        print(f"Nothing to sweep ({len(journals)} journals)")
+    for journal in swept:
+        os.remove(journal)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Bulk teardown - finds test entities by name/email prefix and deletes them
+
+Load tests name what they create with recognizable prefixes (``TestGroup_``, ``upsertstaff_``,
+``DeleteTest_``... see TEARDOWN_PREFIXES). This tool walks the list endpoints of staff, users,
+teams, groups and integrations - all resources in parallel, the pages of each concurrently -
+and keeps only the entities whose name or email starts with one of the prefixes. Each page is
+filtered as it arrives, so memory holds the matches, not the lists.
+
+Matches are deleted through a pool of TEARDOWN_CONCURRENCY greenlets, paced to TEARDOWN_RATE
+deletes per second so the staging API is not flooded. Staff are hard-deleted; groups go last,
+after the teams that belong to them. Pages are offset-based, so a resource is only deleted
+once it has been fully scanned (deleting earlier would shift the later pages).
+
+Nothing is deleted without --delete:
+
+    python teardown.py                                 # count matches per resource
+    python teardown.py --delete                        # delete them
+    python teardown.py --delete --resources staff,users --prefixes upsertstaff_,postuser_
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import math
+import sys
+import time
+from collections import Counter
+import gevent
+from gevent.pool import Pool
+from locust.event import Events
+from config.settings import settings
+from tests.base.cleanup import hard_delete_path, open_session
+from tests.base.id_registry import ID_SOURCES, _page_index
+
+# Resource -> fields matched against the prefixes
+MATCH_FIELDS = {
+    'staff': ('email_address', 'first_name'),
+    'users': ('email_address',),
+    'teams': ('team_name',),
+    'groups': ('group_name',),
+    'integrations': ('label',),
+}
+
+# Resources whose deletes wait for the earlier stages (groups must lose their teams first)
+DELETE_STAGES = (('staff', 'users', 'integrations', 'teams'), ('groups',))
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 2.0
+
+# Safety net for list endpoints that never stop returning a next_page
+MAX_PAGES = 100000
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across greenlets (rate <= 0: unlimited)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            gevent.sleep(slot - now)
+
+
+class Teardown:
+    """Scans the list endpoints for prefixed entities and deletes them"""
+
+    def __init__(self, session, prefixes, concurrency, rate):
+        self.session = session
+        self.prefixes = tuple(prefixes)
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.scanned = Counter()   # resource -> entities seen
+        self.matches = {}          # resource -> [(id, name), ...]
+        self.counts = Counter()    # deleted / gone / failed
+        self.total = 0
+        self._started = None
+
+    # Scanning
+
+    def scan(self, resource):
+        """Collect the matching (id, name) pairs of one resource from every page of its list"""
+        source = ID_SOURCES[resource]
+        params = {'limit': source.page_size}
+        matches = self.matches[resource] = []
+        data = self._get_page(source, source.endpoint, params)
+        if data is None:
+            return matches
+        items = source.extract_items(data) or []
+        self._filter(resource, source, items)
+
+        next_page = data.get('next_page') if isinstance(data, dict) else None
+        next_index = _page_index(next_page) if next_page else None
+        total = data.get('total') if isinstance(data, dict) else None
+        if next_index is not None and isinstance(total, int) and items:
+            # Page count is known: fetch the remaining pages concurrently
+            page_count = min(math.ceil(total / len(items)), MAX_PAGES)
+            pages = Pool(self.concurrency).imap_unordered(
+                lambda page: self._get_page(source, source.endpoint, dict(params, page=page)),
+                range(next_index, next_index + page_count - 1),
+            )
+            for page_data in pages:
+                self._filter(resource, source, (source.extract_items(page_data) or []) if page_data else [])
+        else:
+            # No page number or total: follow the next_page links one by one
+            for _ in range(MAX_PAGES):
+                if not next_page or not items:
+                    break
+                data = self._get_page(source, next_page, None)
+                items = (source.extract_items(data) or []) if data else []
+                self._filter(resource, source, items)
+                next_page = data.get('next_page') if isinstance(data, dict) else None
+        return matches
+
+    def _get_page(self, source, url, params):
+        response = self.session.get(url, params=params, name=f"{source.endpoint} [teardown]")
+        if response.status_code != 200:
+            print(f"  GET {url} failed: {response.status_code}")
+            return None
+        return response.json()
+
+    def _filter(self, resource, source, items):
+        self.scanned[resource] += len(items)
+        matches = self.matches[resource]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for field in MATCH_FIELDS[resource]:
+                value = item.get(field)
+                if isinstance(value, str) and value.startswith(self.prefixes):
+                    # Not source.extract_ids: its valid_ids allow-lists only cover the fixture range
+                    item_id = next((item[id_field] for id_field in source.id_fields if id_field in item), None)
+                    if item_id is not None:
+                        matches.append((item_id, value))
+                    break
+
+    # Deleting
+
+    def delete_all(self, resources):
+        """Delete the matches of ``resources`` stage by stage, printing progress"""
+        self.total = sum(len(self.matches.get(resource, ())) for resource in resources)
+        self._started = time.time()
+        reporter = gevent.spawn(self._report_progress)
+        try:
+            for stage in DELETE_STAGES:
+                pool = Pool(self.concurrency)
+                for resource in stage:
+                    if resource not in resources:
+                        continue
+                    endpoint = ID_SOURCES[resource].endpoint
+                    for item_id, _ in self.matches.get(resource, ()):
+                        pool.spawn(self._delete, hard_delete_path(f"{endpoint}/{item_id}"))
+                pool.join()
+        finally:
+            reporter.kill()
+        self._print_progress()
+        return self.counts
+
+    def _delete(self, path):
+        self.limiter.wait()
+        response = self.session.delete(path)
+        if response.status_code in (200, 204):
+            self.counts['deleted'] += 1
+        elif response.status_code == 404:
+            self.counts['gone'] += 1
+        else:
+            self.counts['failed'] += 1
+            print(f"  DELETE {path} failed: {response.status_code} {response.text[:200]}")
+
+    def _report_progress(self):
+        while True:
+            gevent.sleep(PROGRESS_INTERVAL)
+            self._print_progress()
+
+    def _print_progress(self):
+        done = sum(self.counts.values())
+        elapsed = max(time.time() - self._started, 1e-9)
+        percent = 100.0 * done / self.total if self.total else 100.0
+        print(f"  {done}/{self.total} ({percent:.0f}%) - {self.counts['deleted']} deleted, "
+              f"{self.counts['gone']} already gone, {self.counts['failed']} failed - {done / elapsed:.1f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find test entities by name/email prefix and delete them')
+    parser.add_argument('--host', default=settings.API_HOST, help='API host (default: API_HOST)')
+    parser.add_argument('--resources', default=','.join(MATCH_FIELDS),
+                        help=f"Comma-separated resources (default: {','.join(MATCH_FIELDS)})")
+    parser.add_argument('--prefixes', help='Comma-separated name/email prefixes (default: TEARDOWN_PREFIXES)')
+    parser.add_argument('--concurrency', type=int, default=max(settings.TEARDOWN_CONCURRENCY, 1),
+                        help='Concurrent page and DELETE requests')
+    parser.add_argument('--rate', type=float, default=settings.TEARDOWN_RATE,
+                        help='Deletes per second (0 = unlimited)')
+    parser.add_argument('--delete', action='store_true', help='Delete the matches (default: only count them)')
+    args = parser.parse_args()
+
+    resources = [resource for resource in args.resources.replace(' ', '').split(',') if resource]
+    unknown = [resource for resource in resources if resource not in MATCH_FIELDS]
+    if unknown:
+        parser.error(f"unknown resources: {', '.join(unknown)} (choose from {', '.join(MATCH_FIELDS)})")
+    prefixes = [prefix for prefix in (args.prefixes or '').replace(' ', '').split(',') if prefix] \
+        or settings.TEARDOWN_PREFIXES
+    if not args.host:
+        parser.error("no API host - pass --host or set API_HOST")
+
+    session = open_session(args.host, Events().request, args.concurrency)
+    if session is None:
+        print(f"No authentication token for {args.host} - check CLIENT_ID and CLIENT_SECRET")
+        return 1
+
+    teardown = Teardown(session, prefixes, args.concurrency, args.rate)
+    started = time.time()
+    scans = [gevent.spawn(teardown.scan, resource) for resource in resources]
+    gevent.joinall(scans)
+    print(f"Scanned {sum(teardown.scanned.values())} entities in {time.time() - started:.1f}s")
+    for resource in resources:
+        matches = teardown.matches.get(resource, [])
+        examples = ', '.join(name for _, name in matches[:3])
+        print(f"  {resource}: {len(matches)} of {teardown.scanned[resource]} match"
+              + (f" (e.g. {examples})" if examples else ""))
+
+    if not args.delete:
+        print("Dry run - pass --delete to delete the matches")
+        return 0
+    counts = teardown.delete_all(resources)
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Open-model (constant arrival rate) scheduling for ScoreBuddy API load tests
+
+By default every Locust user runs its tasks back to back, so offered load drops as soon as the
+API slows down (a closed model). In arrival-rate mode each user instead dispatches tasks on a
+clock - Poisson (exponential gaps) or fixed intervals - into a bounded greenlet pool, without
+waiting for earlier requests to finish. The target rate is shared by all running users of the
+class (and divided by the number of connected workers, see run_phase.py), so it does not depend on user count or
+response times.
+
+Rates are set per user class, either in total with the ``@task`` weights as the mix::
+
+    class StaffGetTest(BaseResourceTest):
+        arrival_rate = 50  # requests/second
+
+or per task (``task_arrival_rates = {'get_staff_list': 20, 'get_staff_by_id': 30}``). The
+ARRIVAL_RATE / ARRIVAL_TASK_RATES settings override the class attributes for every class.
+
+A dispatch is *late* when it starts more than ARRIVAL_LATE_THRESHOLD seconds after its
+scheduled time and *missed* when ARRIVAL_MAX_IN_FLIGHT requests of the class are already in
+flight (it is dropped). Both are reported per class when Locust quits and, with ``--csv``,
+written to ``<prefix>_arrivals.csv``.
+"""
+import csv
+import logging
+import random
+import time
+import traceback
+import gevent
+from gevent.pool import Pool
+from locust import events
+from locust.runners import WorkerRunner
+from locust.user.users import LOCUST_STATE_STOPPING
+from config.settings import settings
+from tests.base.latency import set_intended_start
+from tests.base.log import get_logger
+from tests.base.run_phase import run_clock
+
+log = get_logger('arrival')
+# Locust prints its summary tables through this logger
+console = logging.getLogger('locust.stats_logger')
+
+CSV_COLUMNS = ['User Class', 'Dispatched', 'Late', 'Missed', 'Max Lag (ms)']
+
+ARRIVAL_PROCESSES = ('poisson', 'fixed')
+
+
+def task_rates(user_class):
+    """Return {task function: requests/second} for a user class, or None in closed-model mode"""
+    tasks = [task for task in user_class.tasks if callable(task) and hasattr(task, '__name__')]
+    if not tasks:
+        return None
+
+    per_task = settings.ARRIVAL_TASK_RATES or getattr(user_class, 'task_arrival_rates', None)
+    if per_task:
+        rates = {}
+        for task in tasks:
+            if per_task.get(task.__name__):
+                rates[task] = float(per_task[task.__name__])
+        if rates:
+            return rates
+
+    total = settings.ARRIVAL_RATE or getattr(user_class, 'arrival_rate', None)
+    if not total:
+        return None
+    # user_class.tasks repeats each task once per @task weight
+    rates = {}
+    for task in tasks:
+        rates[task] = rates.get(task, 0.0) + float(total) / len(tasks)
+    return rates
+
+
+class ArrivalStats:
+    """Dispatch counters keyed by user class name"""
+
+    def __init__(self):
+        self.classes = {}  # class name -> {'dispatched', 'late', 'missed', 'max_lag'}
+
+    def _entry(self, name):
+        entry = self.classes.get(name)
+        if entry is None:
+            entry = self.classes[name] = {'dispatched': 0, 'late': 0, 'missed': 0, 'max_lag': 0.0}
+        return entry
+
+    def log_dispatch(self, name, lag, missed):
+        entry = self._entry(name)
+        if missed:
+            entry['missed'] += 1
+            return
+        entry['dispatched'] += 1
+        if lag > settings.ARRIVAL_LATE_THRESHOLD:
+            entry['late'] += 1
+        if lag > entry['max_lag']:
+            entry['max_lag'] = lag
+
+    def merge(self, classes):
+        """Add counters serialized by another process (see snapshot())"""
+        for name, other in classes.items():
+            entry = self._entry(name)
+            for key in ('dispatched', 'late', 'missed'):
+                entry[key] += other[key]
+            entry['max_lag'] = max(entry['max_lag'], other['max_lag'])
+
+    def snapshot(self, reset=False):
+        classes = {name: dict(entry) for name, entry in self.classes.items()}
+        if reset:
+            self.classes = {}
+        return classes
+
+    def rows(self):
+        for name in sorted(self.classes):
+            entry = self.classes[name]
+            yield [name, entry['dispatched'], entry['late'], entry['missed'], round(entry['max_lag'] * 1000, 1)]
+
+
+arrival_stats = ArrivalStats()
+
+_pools = {}        # class name -> Pool of in-flight dispatched tasks
+_live_users = {}   # class name -> users currently running the scheduler in this process
+
+
+def _pool(name):
+    pool = _pools.get(name)
+    if pool is None:
+        pool = _pools[name] = Pool(settings.ARRIVAL_MAX_IN_FLIGHT)
+    return pool
+
+
+def _execute(user, task, intended_start):
+    # The task's first request is measured from its scheduled time (see latency.py)
+    set_intended_start(intended_start)
+    try:
+        task(user)
+    except gevent.GreenletExit:
+        raise
+    except Exception as e:
+        user.environment.events.user_error.fire(user_instance=user, exception=e, tb=e.__traceback__)
+        log.error("%s\n%s", e, traceback.format_exc())
+
+
+def run_arrivals(user):
+    """Task that replaces a user's task loop in arrival-rate mode (see BaseResourceTest.__init__)
+
+    Runs until the user is stopped, dispatching tasks at this user's share of the class rate.
+    """
+    user_class = type(user)
+    name = user_class.__name__
+    rates = task_rates(user_class)
+    tasks = list(rates)
+    weights = [rates[task] for task in tasks]
+    class_rate = sum(weights)
+    fixed = settings.ARRIVAL_PROCESS == 'fixed'
+    pool = _pool(name)
+
+    _live_users[name] = _live_users.get(name, 0) + 1
+    try:
+        user_rate = class_rate / run_clock.worker_count / _live_users[name]
+        # Random phase so users of a fixed clock don't fire in lockstep
+        next_at = time.time() + (random.uniform(0, 1 / user_rate) if fixed else random.expovariate(user_rate))
+        while user._state != LOCUST_STATE_STOPPING:
+            delay = next_at - time.time()
+            if delay > 0:
+                gevent.sleep(delay)
+                continue
+
+            missed = pool.full()
+            arrival_stats.log_dispatch(name, -delay, missed)
+            if not missed:
+                pool.spawn(_execute, user, random.choices(tasks, weights)[0], next_at)
+
+            # The share is recomputed as users ramp up or down and workers join or leave
+            user_rate = class_rate / run_clock.worker_count / _live_users[name]
+            next_at += 1 / user_rate if fixed else random.expovariate(user_rate)
+    finally:
+        _live_users[name] -= 1
+
+
+def write_csv(path, stats=None):
+    """Write per-class dispatch stats to a CSV file; returns the path or None on error"""
+    stats = stats or arrival_stats
+    try:
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(stats.rows())
+    except OSError as e:
+        log.warning("Could not write arrival stats %s: %s", path, e)
+        return None
+    return path
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    if settings.ARRIVAL_PROCESS not in ARRIVAL_PROCESSES:
+        log.warning("Unknown ARRIVAL_PROCESS %r - using poisson", settings.ARRIVAL_PROCESS)
+    arrival_stats.snapshot(reset=True)
+
+
+@events.test_stop.add_listener
+def _on_test_stop(environment, **kwargs):
+    # Dispatched tasks don't belong to the users' greenlet group, so stop them here
+    for pool in _pools.values():
+        pool.kill(block=False)
+
+
+@events.reset_stats.add_listener
+def _on_reset_stats(**kwargs):
+    arrival_stats.snapshot(reset=True)
+
+
+@events.report_to_master.add_listener
+def _on_report_to_master(client_id, data, **kwargs):
+    classes = arrival_stats.snapshot(reset=True)
+    if classes:
+        data['arrivals'] = classes
+
+
+@events.worker_report.add_listener
+def _on_worker_report(client_id, data, **kwargs):
+    classes = data.get('arrivals')
+    if classes:
+        arrival_stats.merge(classes)
+
+
+@events.quitting.add_listener
+def _on_quitting(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or not arrival_stats.classes:
+        return
+
+    console.info("%-30s %12s %10s %10s %14s", 'Arrival-rate class', '# dispatched', '# late', '# missed', 'Max lag (ms)')
+    for name, dispatched, late, missed, max_lag in arrival_stats.rows():
+        console.info("%-30s %12d %10d %10d %14.1f", name, dispatched, late, missed, max_lag)
+
+    csv_prefix = getattr(environment.parsed_options, 'csv_prefix', None)
+    if csv_prefix:
+        write_csv(f"{csv_prefix}_arrivals.csv")
@@ -1,15 +1,61 @@
 """
 Base test class for all ScoreBuddy API load tests
 """
-from locust import HttpUser, task, tag
+import random
+from locust import task, tag
 from config.settings import settings
 from auth.token_manager import token_manager
+from auth import token_broker  # noqa: F401 - master/worker token distribution
+from tests.base.engine import ResourceUser
+from tests.base.id_registry import id_registry
+from tests.base import discovery  # noqa: F401 - registers the test_start discovery hook
+from tests.base import client_stats  # noqa: F401 - registers the per-OAuth-client stats listeners
+from tests.base.arrival import run_arrivals, task_rates
+from tests.base.cleanup import cleanup_queue
+from tests.base.cleanup_journal import cleanup_journal
+from tests.base.latency import Pace, pop_intended_start
+from tests.base.log import get_logger
+from tests.base.payloads import payload_factory
+from tests.base.payload_pool import body_kwargs, get_pool
 
+# Resource type -> create operation used by get_sample_data()
+SAMPLE_DATA_OPERATIONS = {
+    'users': 'insertUser',
+    'teams': 'insertTeam',
+    'staff': 'insertStaff',
+    'groups': 'insertGroup',
+    'integrations': 'insertIntegration',
+}
 
-class BaseResourceTest(HttpUser):
+
+class BaseResourceTest(ResourceUser):
     """Base class for all resource tests with common functionality"""
     abstract = True
     
+    # Open-model mode (see tests/base/arrival.py): target requests/second for the class, mixed by
+    # @task weights, or per task name. None = closed model (tasks run back to back)
+    arrival_rate = None
+    task_arrival_rates = None
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rate-limited, batched logger (see tests/base/log.py) - use instead of print()
+        self.log = get_logger(self.__class__.__name__)
+        # Closed-model users correct their latency by their own request pace (see tests/base/latency.py)
+        self._latency_pace = Pace()
+        if task_rates(type(self)):
+            # Dispatch tasks on the arrival clock instead of running them back to back
+            self.tasks = [run_arrivals]
+            self._latency_pace = None
+    
+    def context(self):
+        """Tag every request with its OAuth client (client_stats.py) and intended start (latency.py)"""
+        return {
+            "oauth_client": getattr(self.client, 'oauth_client_id', None),
+            "intended_start": pop_intended_start(),
+            "latency_pace": self._latency_pace,
+        }
+    
     def on_start(self):
         """Called when a user starts. Set up authentication."""
         # Respect --host parameter from Locust command line
@@ -32,8 +78,10 @@ class BaseResourceTest(HttpUser):
                 "Content-Type": "application/json",
                 "Accept": "application/json"
             })
+            # Background token refreshes update this session's Authorization header
+            token_manager.register_client(self.client)
         else:
-            print("Failed to get authentication token - check CLIENT_ID, CLIENT_SECRET, and API_HOST in .env file")
+            self.log.warning("Failed to get authentication token - check CLIENT_ID, CLIENT_SECRET, and API_HOST in .env file")
     
     def _ensure_headers_set(self):
         """Ensure authentication headers are set before making requests"""
@@ -46,17 +94,35 @@ class BaseResourceTest(HttpUser):
                     "Content-Type": "application/json",
                     "Accept": "application/json"
                 })
+                token_manager.register_client(self.client)
             else:
-                print("⚠ Warning: No authentication token available - requests will fail")
+                self.log.warning("⚠ Warning: No authentication token available - requests will fail")
                 return False
         return True
     
+    def get_cached_ids(self, resource):
+        """Return existing IDs for a resource type from the shared, process-wide ID registry"""
+        self._ensure_headers_set()
+        return id_registry.get_ids(self.client, resource)
+    
+    def choose_cached_id(self, resource):
+        """Return a random existing ID for a resource type (uniform or skewed per ID_SAMPLING_SKEW), or None"""
+        self._ensure_headers_set()
+        return id_registry.choose_id(self.client, resource)
+    
+    def sample_cached_ids(self, resource, count=1):
+        """Return up to ``count`` distinct random existing IDs for a resource type"""
+        ids = self.get_cached_ids(resource)
+        if count >= len(ids):
+            return list(ids)
+        return random.sample(ids, count)
+    
     def get_resource(self, endpoint, resource_name="resource"):
         """Generic GET request handler"""
         self._ensure_headers_set()
         response = self.client.get(endpoint)
         if response.status_code != 200:
-            print(f"{resource_name} GET failed: {response.status_code} - {response.text}")
+            self.log.warning("%s GET failed: %s - %s", resource_name, response.status_code, response.text)
         return response
     
     def get_resource_with_params(self, endpoint, params, resource_name="resource"):
@@ -69,17 +135,25 @@ class BaseResourceTest(HttpUser):
     def post_resource(self, endpoint, data, resource_name="resource"):
         """Generic POST request handler"""
         self._ensure_headers_set()
-        response = self.client.post(endpoint, json=data)
+        response = self.client.post(endpoint, **body_kwargs(data))
         if response.status_code not in [200, 201]:
-            print(f"{resource_name} POST failed: {response.status_code} - {response.text}")
+            self.log.warning("%s POST failed: %s - %s", resource_name, response.status_code, response.text)
         return response
     
     def put_resource(self, endpoint, data, resource_name="resource"):
         """Generic PUT request handler"""
         self._ensure_headers_set()
-        response = self.client.put(endpoint, json=data)
+        response = self.client.put(endpoint, **body_kwargs(data))
         if response.status_code not in [200, 201, 204]:
-            print(f"{resource_name} PUT failed: {response.status_code} - {response.text}")
+            self.log.warning("%s PUT failed: %s - %s", resource_name, response.status_code, response.text)
+        return response
+    
+    def patch_resource(self, endpoint, data, resource_name="resource"):
+        """Generic PATCH request handler"""
+        self._ensure_headers_set()
+        response = self.client.patch(endpoint, **body_kwargs(data))
+        if response.status_code not in [200, 201, 204]:
+            self.log.warning("%s PATCH failed: %s - %s", resource_name, response.status_code, response.text)
         return response
     
     def delete_resource(self, endpoint, resource_name="resource"):
@@ -87,35 +161,46 @@ class BaseResourceTest(HttpUser):
         self._ensure_headers_set()
         response = self.client.delete(endpoint)
         if response.status_code not in [200, 204]:
-            print(f"{resource_name} DELETE failed: {response.status_code} - {response.text}")
+            self.log.warning("%s DELETE failed: %s - %s", resource_name, response.status_code, response.text)
+        return response
+    
+    def schedule_delete(self, endpoint):
+        """Queue a DELETE of a created resource for the cleanup greenlets (tests/base/cleanup.py)"""
+        cleanup_queue.submit(endpoint)
+    
+    def journal_created(self, endpoint):
+        """Journal a resource the test deletes itself (see delete_created), so sweep.py finds it if the run dies first"""
+        if settings.CLEANUP_JOURNAL:
+            cleanup_journal.created(endpoint)
+    
+    def delete_created(self, endpoint, resource_name="resource"):
+        """DELETE a resource recorded with journal_created and mark it deleted in the journal once it is gone"""
+        response = self.delete_resource(endpoint, resource_name)
+        if settings.CLEANUP_JOURNAL and response.status_code in (200, 204, 404):
+            cleanup_journal.deleted(endpoint)
         return response
     
+    def build_payload(self, operation_id, fields=None, **overrides):
+        """Return a spec-accurate request body for an OpenAPI operation (see tests/base/payloads.py)
+        
+        ID fields are filled with existing IDs from the ID registry; ``fields`` limits the body to
+        those properties and ``overrides`` set specific values.
+        """
+        return payload_factory.build(operation_id, self.sample_cached_ids, fields, **overrides)
+    
+    def prepared_payload(self, operation_id, fields=None, **overrides):
+        """Like build_payload, but taken pre-serialized from a pool when PAYLOAD_POOL_SIZE is set
+        
+        Returns JSON bytes in that case (see tests/base/payload_pool.py), so only pass the result
+        to post_resource/put_resource; use build_payload for a body the test modifies.
+        """
+        if settings.PAYLOAD_POOL_SIZE > 0:
+            return get_pool(operation_id, fields, overrides, self.sample_cached_ids).take(overrides)
+        return self.build_payload(operation_id, fields, **overrides)
+    
     def get_sample_data(self, resource_type):
         """Return sample data for POST/PUT requests based on resource type"""
-        sample_data = {
-            "users": {
-                "name": "Test User",
-                "email": "test@example.com",
-                "role": "user"
-            },
-            "teams": {
-                "team_name": "Test Team",
-                "group_id": 35,
-                "deleted": False
-            },
-            "staff": {
-                "name": "Test Staff",
-                "email": "staff@example.com",
-                "position": "Developer"
-            },
-            "groups": {
-                "name": "Test Group",
-                "description": "Test group description"
-            },
-            "integrations": {
-                "name": "Test Integration",
-                "type": "webhook",
-                "url": "https://example.com/webhook"
-            }
-        }
-        return sample_data.get(resource_type, {})
+        operation_id = SAMPLE_DATA_OPERATIONS.get(resource_type)
+        if operation_id is None:
+            return {}
+        return self.build_payload(operation_id)
@@ -0,0 +1,177 @@
+"""
+Asynchronous cleanup of resources created by ScoreBuddy API load tests
+
+Create/upsert tasks used to delete each new entity inline - inside the measured task - and
+the staff tests deleted their leftovers one by one in on_stop, which is what made a long
+``--stop-timeout`` necessary. Tasks now call ``BaseResourceTest.schedule_delete(path)``
+instead, which puts the DELETE path on a process-wide queue and returns at once.
+
+CLEANUP_CONCURRENCY dedicated greenlets drain the queue with their own session. Their
+requests are reported as ``<endpoint> [cleanup]``, apart from the DELETE stats of the load
+itself (the *_delete.py tests). When the whole run stops, a test_stop listener waits once for
+the queue to drain, for at most CLEANUP_TIMEOUT seconds, then logs how many deletes
+succeeded - users stopped by a ramp-down or load shape don't wait. Queued and completed
+deletes are also written to a crash-safe journal (cleanup_journal.py), from which
+``sweep.py`` removes whatever a crashed run left behind.
+"""
+import logging
+from gevent.lock import Semaphore
+from gevent.pool import Group
+from gevent.queue import JoinableQueue
+from requests.adapters import HTTPAdapter
+from locust import events
+from locust.runners import MasterRunner
+from config.settings import settings
+from auth.token_manager import token_manager
+from tests.base.cleanup_journal import cleanup_journal
+from tests.base.endpoint_names import endpoint_matcher, endpoint_name
+from tests.base.engine import ResourceHttpSession
+from tests.base.log import get_logger
+
+log = get_logger('cleanup')
+console = logging.getLogger('locust.stats_logger')
+
+# Stats name suffix for cleanup requests
+CLEANUP_SUFFIX = " [cleanup]"
+
+
+class CleanupQueue:
+    """Process-wide queue of DELETE paths, drained by a bounded pool of greenlets"""
+
+    def __init__(self, concurrency):
+        self.concurrency = max(concurrency, 1)
+        self.deleted = 0
+        self.failed = 0
+        self._queue = JoinableQueue()
+        self._workers = Group()
+        self._environment = None
+        self._session = None
+        self._session_lock = Semaphore()
+
+    def bind(self, environment):
+        """Send deletes to this environment's host and report them on its request event"""
+        self._environment = environment
+        self._session = None
+
+    def submit(self, path):
+        """Queue a DELETE of ``path``; workers are started on demand, up to the concurrency"""
+        if settings.CLEANUP_JOURNAL:
+            cleanup_journal.created(path)
+        self._queue.put(path)
+        if len(self._workers) < self.concurrency:
+            self._workers.spawn(self._work)
+
+    def pending(self):
+        """Number of deletes queued or in flight"""
+        return self._queue.unfinished_tasks
+
+    def join(self, timeout=None):
+        """Wait until every queued delete has been sent; False if ``timeout`` ran out first"""
+        return self._queue.join(timeout)
+
+    def reset_counts(self):
+        self.deleted = 0
+        self.failed = 0
+
+    def _work(self):
+        while True:
+            path = self._queue.get()
+            try:
+                self._delete(path)
+            except Exception as e:
+                self.failed += 1
+                log.error("Error deleting %s: %s", path, e)
+            finally:
+                self._queue.task_done()
+
+    def _delete(self, path):
+        session = self._get_session()
+        if session is None:
+            self.failed += 1
+            return
+        response = session.delete(path, name=f"{endpoint_name(path) or path}{CLEANUP_SUFFIX}")
+        if response.status_code in (200, 204, 404):
+            # 404: already gone, nothing left to sweep
+            if settings.CLEANUP_JOURNAL:
+                cleanup_journal.deleted(path)
+        if response.status_code in (200, 204):
+            self.deleted += 1
+        else:
+            self.failed += 1
+            log.warning("Cleanup DELETE %s failed: %s - %s", path, response.status_code, response.text[:200])
+
+    def _get_session(self):
+        """The workers' shared session, authenticated on first use (None without a token)"""
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._new_session()
+            return self._session
+
+    def _new_session(self):
+        environment = self._environment
+        if environment is None:
+            log.warning("Cleanup queue used before test_start - cannot delete created resources")
+            return None
+        session = open_session(environment.host or settings.API_HOST, environment.events.request, self.concurrency)
+        if session is None:
+            log.warning("No authentication token - cannot delete created resources")
+        return session
+
+
+def open_session(host, request_event, concurrency):
+    """Return an authenticated session with a connection per concurrent request, or None without a token"""
+    session = ResourceHttpSession(base_url=host, request_event=request_event, user=None)
+    session.trust_env = False
+    session.timeout = 30
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    token = token_manager.get_shared_token(session)
+    if not token:
+        return None
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    })
+    # Background token refreshes update this session's Authorization header
+    token_manager.register_client(session)
+    return session
+
+
+def hard_delete_path(path):
+    """Return the hard-delete URL for a path where the API has one (``/staff/8123/hard``), else the path"""
+    hard_path = f"{path}/hard"
+    return hard_path if endpoint_matcher.match(hard_path) else path
+
+
+cleanup_queue = CleanupQueue(settings.CLEANUP_CONCURRENCY)
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    cleanup_queue.bind(environment)
+    cleanup_queue.reset_counts()
+    if settings.CLEANUP_JOURNAL and not isinstance(environment.runner, MasterRunner):
+        cleanup_journal.start(environment.host or settings.API_HOST)
+
+
+@events.test_stop.add_listener
+def _on_test_stop(environment, **kwargs):
+    if isinstance(environment.runner, MasterRunner):
+        return
+    pending = cleanup_queue.pending()
+    if pending:
+        console.info("Waiting for %s queued cleanup deletes...", pending)
+        if not cleanup_queue.join(settings.CLEANUP_TIMEOUT):
+            console.warning("%s cleanup deletes still queued after CLEANUP_TIMEOUT (%ss)",
+                            cleanup_queue.pending(), settings.CLEANUP_TIMEOUT)
+    if cleanup_queue.deleted or cleanup_queue.failed:
+        console.info("Cleanup: %s deleted, %s failed", cleanup_queue.deleted, cleanup_queue.failed)
+    cleanup_journal.close()
+
+
+@events.quitting.add_listener
+def _on_quitting(environment, **kwargs):
+    # In case test_stop never ran: sync what was recorded for the sweeper
+    cleanup_journal.close()
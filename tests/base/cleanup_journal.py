@@ -0,0 +1,145 @@
+"""
+Crash-safe journal of resources created by ScoreBuddy API load tests
+
+The cleanup queue (cleanup.py) only lives in memory: a killed worker or a Ctrl-C in the
+middle of a run leaves every created-but-not-yet-deleted entity behind. So each process also
+appends what it creates and what it has deleted to a JSONL journal under CLEANUP_JOURNAL_DIR,
+one file per process and run::
+
+    {"event": "open", "host": "https://.../api/v1", "pid": 4242, "time": 1760000000.0}
+    {"event": "created", "path": "/staff/8123"}
+    {"event": "deleted", "path": "/staff/8123"}
+
+Writes are buffered and a background greenlet flushes and fsyncs them every
+CLEANUP_JOURNAL_SYNC seconds, so at most that much is lost on a crash. When a run ends with
+nothing left to delete, its journal is removed; otherwise the sweeper (``sweep.py``) replays
+it and deletes the leftovers. A torn last line (crash mid-write) is ignored on replay.
+"""
+import json
+import os
+import time
+import gevent
+from config.settings import settings
+from tests.base.log import get_logger
+
+log = get_logger('cleanup_journal')
+
+JOURNAL_SUFFIX = '.jsonl'
+
+
+class CleanupJournal:
+    """Append-only journal of created and deleted resource paths for one process"""
+
+    def __init__(self, directory, sync_interval):
+        self.directory = directory
+        self.sync_interval = sync_interval
+        self.path = None
+        self._host = None
+        self._file = None
+        self._dirty = False
+        self._syncer = None
+        self._outstanding = set()  # Paths created and not yet deleted
+
+    def start(self, host):
+        """Journal this run's resources for ``host`` (the file is created on the first record)"""
+        self.close()
+        self._host = host
+
+    def created(self, path):
+        self._outstanding.add(path)
+        self._append({'event': 'created', 'path': path})
+
+    def deleted(self, path):
+        if path in self._outstanding:
+            self._outstanding.discard(path)
+            self._append({'event': 'deleted', 'path': path})
+
+    def sync(self):
+        """Flush and fsync pending records"""
+        if self._file is None or not self._dirty:
+            return
+        self._dirty = False
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            log.warning("Could not sync cleanup journal %s: %s", self.path, e)
+
+    def close(self):
+        """Sync and close the journal; remove it if nothing created is left to delete"""
+        if self._syncer is not None:
+            self._syncer.kill(block=False)
+            self._syncer = None
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+        if self._outstanding:
+            log.warning("%s created resources were not deleted - run sweep.py to remove them (journal %s)",
+                        len(self._outstanding), self.path)
+        else:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        self._outstanding = set()
+
+    def _append(self, record):
+        if self._file is None and not self._open():
+            return
+        self._file.write(json.dumps(record) + '\n')
+        self._dirty = True
+
+    def _open(self):
+        self.path = os.path.join(self.directory, f"{int(time.time() * 1000)}-{os.getpid()}{JOURNAL_SUFFIX}")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        except OSError as e:
+            log.warning("Could not open cleanup journal %s: %s", self.path, e)
+            self._file = None
+            return False
+        self._file.write(json.dumps({'event': 'open', 'host': self._host, 'pid': os.getpid(),
+                                     'time': time.time()}) + '\n')
+        self._dirty = True
+        self._syncer = gevent.spawn(self._sync_loop)
+        return True
+
+    def _sync_loop(self):
+        while True:
+            gevent.sleep(self.sync_interval)
+            self.sync()
+
+
+def read_journal(path):
+    """Return (host, [path, ...]) for a journal: its host and the paths created but not deleted"""
+    host = None
+    outstanding = {}  # Insertion-ordered, so leftovers are deleted in creation order
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn write at the end of a crashed run
+            event = record.get('event')
+            if event == 'open':
+                host = record.get('host')
+            elif event == 'created':
+                outstanding[record['path']] = True
+            elif event == 'deleted':
+                outstanding.pop(record['path'], None)
+    return host, list(outstanding)
+
+
+def journal_files(directory=None):
+    """Return the journal files in a directory (default CLEANUP_JOURNAL_DIR), oldest first"""
+    directory = directory or settings.CLEANUP_JOURNAL_DIR
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(JOURNAL_SUFFIX))
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in names]
+
+
+cleanup_journal = CleanupJournal(settings.CLEANUP_JOURNAL_DIR, settings.CLEANUP_JOURNAL_SYNC)
@@ -0,0 +1,132 @@
+"""
+Per-OAuth-client request statistics for ScoreBuddy API load tests
+
+When the token pool (auth/token_manager.py) spreads users over several OAuth clients, every
+request is tagged with the client whose token it carried (``BaseResourceTest.context()``).
+This module aggregates requests, failures, 429 responses and response times per client,
+merges worker numbers on the master, and when Locust quits prints a summary table next to
+Locust's own and - with ``--csv <prefix>`` - writes ``<prefix>_oauth_clients.csv``.
+
+Nothing is reported for runs that use a single client.
+"""
+import csv
+import logging
+from locust import events
+from locust.runners import WorkerRunner
+from tests.base.log import get_logger
+
+log = get_logger('client_stats')
+# Locust prints its summary tables through this logger
+console = logging.getLogger('locust.stats_logger')
+
+CSV_COLUMNS = ['OAuth Client', 'Requests', 'Failures', '429s', 'Average Response Time', 'Max Response Time']
+
+
+class OAuthClientStats:
+    """Request counters keyed by OAuth client ID"""
+
+    def __init__(self):
+        self.clients = {}  # client_id -> {'requests', 'failures', 'throttled', 'total_time', 'max_time'}
+
+    def _entry(self, client_id):
+        entry = self.clients.get(client_id)
+        if entry is None:
+            entry = self.clients[client_id] = {
+                'requests': 0, 'failures': 0, 'throttled': 0, 'total_time': 0.0, 'max_time': 0.0,
+            }
+        return entry
+
+    def log_request(self, client_id, response_time, failed, status_code):
+        entry = self._entry(client_id)
+        entry['requests'] += 1
+        entry['total_time'] += response_time
+        if response_time > entry['max_time']:
+            entry['max_time'] = response_time
+        if failed:
+            entry['failures'] += 1
+        if status_code == 429:
+            entry['throttled'] += 1
+
+    def merge(self, clients):
+        """Add counters serialized by another process (see snapshot())"""
+        for client_id, other in clients.items():
+            entry = self._entry(client_id)
+            for key in ('requests', 'failures', 'throttled', 'total_time'):
+                entry[key] += other[key]
+            entry['max_time'] = max(entry['max_time'], other['max_time'])
+
+    def snapshot(self, reset=False):
+        clients = {client_id: dict(entry) for client_id, entry in self.clients.items()}
+        if reset:
+            self.clients = {}
+        return clients
+
+    def rows(self):
+        for client_id in sorted(self.clients):
+            entry = self.clients[client_id]
+            average = entry['total_time'] / entry['requests'] if entry['requests'] else 0.0
+            yield [client_id, entry['requests'], entry['failures'], entry['throttled'],
+                   round(average, 2), round(entry['max_time'], 2)]
+
+
+client_stats = OAuthClientStats()
+
+
+def write_csv(path, stats=None):
+    """Write per-client stats to a CSV file; returns the path or None on error"""
+    stats = stats or client_stats
+    try:
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(stats.rows())
+    except OSError as e:
+        log.warning("Could not write OAuth client stats %s: %s", path, e)
+        return None
+    return path
+
+
+@events.request.add_listener
+def _on_request(context, response_time, exception, response=None, **kwargs):
+    client_id = context.get('oauth_client') if context else None
+    if client_id is not None:
+        client_stats.log_request(client_id, response_time, exception is not None,
+                                 getattr(response, 'status_code', None))
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    client_stats.snapshot(reset=True)
+
+
+@events.reset_stats.add_listener
+def _on_reset_stats(**kwargs):
+    client_stats.snapshot(reset=True)
+
+
+@events.report_to_master.add_listener
+def _on_report_to_master(client_id, data, **kwargs):
+    clients = client_stats.snapshot(reset=True)
+    if clients:
+        data['oauth_clients'] = clients
+
+
+@events.worker_report.add_listener
+def _on_worker_report(client_id, data, **kwargs):
+    clients = data.get('oauth_clients')
+    if clients:
+        client_stats.merge(clients)
+
+
+@events.quitting.add_listener
+def _on_quitting(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or len(client_stats.clients) < 2:
+        return
+
+    console.info("%-20s %10s %10s %8s %10s %10s", 'OAuth client', '# reqs', '# fails', '# 429', 'Avg', 'Max')
+    for client_id, requests, failures, throttled, average, maximum in client_stats.rows():
+        console.info("%-20s %10d %10d %8d %10.0f %10.0f", client_id, requests, failures, throttled, average, maximum)
+
+    csv_prefix = getattr(environment.parsed_options, 'csv_prefix', None)
+    if csv_prefix:
+        write_csv(f"{csv_prefix}_oauth_clients.csv")
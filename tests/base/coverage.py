@@ -0,0 +1,288 @@
+"""
+Runtime support for the generated full-API-coverage locustfile (see generate_locustfile.py)
+
+Every generated task is one line - ``self.call_operation("<operationId>")`` - and this module
+works out, once per operation, how to send it (``plan_operation``):
+
+- Path parameters are bound to existing fixtures. A parameter whose parent list endpoint is
+  an ID registry source (``/staff/{staff_id}``, ``/groups/{group_id}``...) takes registry IDs
+  (replay.PATH_PARAM_RESOURCES). Nested ones (``/scorecards/{scorecard_id}/versions/{version}``)
+  take IDs read from their parent's list endpoint, which are cached in the ID registry under
+  the concrete list path (``/scorecards/75/versions``) and refreshed like any other resource.
+- Mutating operations never modify fixtures. PATCH/PUT/DELETE on ``<collection>/{id}``, and
+  operations below it such as ``PUT /users/{user_id}/password``, first create their target
+  through ``POST <collection>`` and run against that. Operations with no such creator are
+  not planned.
+- POST/PUT to a collection create a new entity. Every created entity is queued for deletion
+  (cleanup.py), unless the operation deleted it itself.
+- JSON bodies come from the payload factory (``prepared_payload``); operations with other
+  bodies (multipart file uploads) are not planned.
+
+A task whose parameters cannot be bound at run time (no fixtures on the host) skips its
+request and logs it at DEBUG level.
+"""
+import re
+from config.settings import settings
+from tests.base.base_test import BaseResourceTest
+from tests.base.id_registry import ID_SOURCES, ResourceIdSource, id_registry
+from tests.base.log import get_logger
+from tests.base.openapi_spec import load_spec
+from tests.base.payloads import payload_factory
+from tests.base.replay import PATH_PARAM_RESOURCES
+from tests.base.run_phase import run_clock
+
+log = get_logger('coverage')
+
+_PARAM = re.compile(r'\{([^}]+)\}')
+
+MUTATING_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+# Response fields that may hold a created entity's ID, after the path parameter's own name
+CREATED_ID_FIELDS = ('id',)
+
+
+class FixtureBinding:
+    """Where the values of one path parameter come from: an ID registry resource or a parent list"""
+
+    __slots__ = ('param', 'prefix', 'resource', 'list_keys', 'id_fields')
+
+    def __init__(self, param, prefix, resource=None, list_keys=(), id_fields=()):
+        self.param = param
+        self.prefix = prefix          # Path template before ``/{param}`` (the parent list)
+        self.resource = resource      # ID registry resource, or None to read the parent list
+        self.list_keys = list_keys
+        self.id_fields = id_fields
+
+
+class OperationPlan:
+    """How to send one operation: which parameters are fixtures and which entity it creates or targets"""
+
+    __slots__ = ('operation', 'params', 'fixtures', 'target', 'creator', 'creates', 'cleanup', 'has_body')
+
+    def __init__(self, operation, params, fixtures, target=None, creator=None, creates=None, cleanup=None,
+                 has_body=False):
+        self.operation = operation
+        self.params = params          # Path parameters, in path order
+        self.fixtures = fixtures      # param -> FixtureBinding
+        self.target = target          # Parameter bound to an entity created first (mutating operations)
+        self.creator = creator        # OperationPlan of the POST that creates the target
+        self.creates = creates        # Parameter of the entity a collection POST/PUT creates
+        self.cleanup = cleanup        # DELETE path template of the created entity, if the API has one
+        self.has_body = has_body
+
+
+class UnplannedOperation(Exception):
+    """An operation the coverage tests cannot send safely (the message says why)"""
+
+
+def _split(path, param):
+    """Return the template before ``/{param}`` and the remainder after it"""
+    prefix, _, rest = path.partition(f"/{{{param}}}")
+    return prefix, rest
+
+
+def _item_param(spec, path):
+    """Return the parameter of ``<path>/{param}`` when the path is a collection, else None"""
+    for candidate in spec.by_path:
+        if candidate.startswith(f"{path}/{{") and candidate.count('/') == path.count('/') + 1:
+            return _PARAM.match(candidate[len(path) + 1:]).group(1)
+    return None
+
+
+def _cleanup_path(spec, path, param):
+    template = f"{path}/{{{param}}}"
+    return template if spec.operation('DELETE', template) else None
+
+
+def _list_shape(spec, list_operation, param):
+    """Return (list keys, ID fields) for the items of a list operation's 200 response"""
+    list_keys = []
+    item_fields = []
+    response = spec.deref(list_operation.details.get('responses', {}).get('200', {}))
+    schema = spec.deref(response.get('content', {}).get('application/json', {}).get('schema', {}))
+    for key, value in schema.get('properties', {}).items():
+        value = spec.deref(value)
+        if value.get('type') == 'array':
+            list_keys.append(key)
+            items = spec.deref(value.get('items', {}))
+            for member in [items] + items.get('allOf', []):
+                item_fields.extend(spec.deref(member).get('properties', {}))
+    id_fields = [param] + ([] if param.endswith('_id') else [f"{param}_id"])
+    id_fields += [field for field in item_fields if field.endswith('_id')][:1] + ['id']
+    return tuple(list_keys), tuple(dict.fromkeys(id_fields))
+
+
+def _bind_fixture(spec, path, param):
+    prefix, _ = _split(path, param)
+    resource = PATH_PARAM_RESOURCES.get(param)
+    list_operation = spec.operation('GET', prefix)
+    if resource and (list_operation is None or ID_SOURCES[resource].endpoint == prefix):
+        return FixtureBinding(param, prefix, resource=resource)
+    if list_operation is not None:
+        list_keys, id_fields = _list_shape(spec, list_operation, param)
+        return FixtureBinding(param, prefix, list_keys=list_keys, id_fields=id_fields)
+    raise UnplannedOperation(f"no fixtures for {{{param}}} (no GET {prefix})")
+
+
+def _json_body(spec, operation):
+    """True if the operation takes a JSON body the payload factory can build; raise for other bodies"""
+    request_body = spec.deref(operation.details.get('requestBody', {}))
+    content = request_body.get('content', {})
+    if not content:
+        return False
+    if 'application/json' not in content:
+        raise UnplannedOperation(f"{', '.join(content)} request body")
+    if operation.operation_id not in payload_factory.operations():
+        raise UnplannedOperation("no request body factory")
+    return True
+
+
+_plans = {}  # operationId -> OperationPlan or UnplannedOperation
+
+
+def plan_operation(operation_id):
+    """Return the OperationPlan for an operation; raise UnplannedOperation if it cannot be sent safely"""
+    plan = _plans.get(operation_id)
+    if plan is None:
+        try:
+            plan = _plan(load_spec(), operation_id)
+        except UnplannedOperation as e:
+            plan = e
+        _plans[operation_id] = plan
+    if isinstance(plan, UnplannedOperation):
+        raise plan
+    return plan
+
+
+def _plan(spec, operation_id):
+    operation = spec.by_operation_id.get(operation_id)
+    if operation is None:
+        raise UnplannedOperation(f"unknown operation {operation_id!r}")
+    if operation.path == settings.AUTH_ENDPOINT:
+        raise UnplannedOperation("authentication endpoint (covered by the token manager)")
+    has_body = _json_body(spec, operation)
+    params = _PARAM.findall(operation.path)
+    if operation.method not in MUTATING_METHODS:
+        fixtures = {param: _bind_fixture(spec, operation.path, param) for param in params}
+        return OperationPlan(operation, params, fixtures)
+
+    creates = _item_param(spec, operation.path) if operation.method in ('POST', 'PUT') else None
+    if creates:
+        # POST/PUT to a collection: a new entity below fixture parents
+        fixtures = {param: _bind_fixture(spec, operation.path, param) for param in params}
+        return OperationPlan(operation, params, fixtures, creates=creates,
+                             cleanup=_cleanup_path(spec, operation.path, creates), has_body=has_body)
+    if not params:
+        raise UnplannedOperation("no disposable target")
+
+    # Anything else acts on an entity: create it first so no fixture is modified
+    target = params[-1]
+    prefix, _ = _split(operation.path, target)
+    creator = spec.operation('POST', prefix)
+    if creator is None or creator.path == operation.path:
+        raise UnplannedOperation(f"would modify a fixture (no POST {prefix} to create {{{target}}})")
+    creator_plan = plan_operation(creator.operation_id)
+    fixtures = {param: _bind_fixture(spec, operation.path, param) for param in params[:-1]}
+    return OperationPlan(operation, params, fixtures, target=target, creator=creator_plan,
+                         cleanup=_cleanup_path(spec, prefix, target), has_body=has_body)
+
+
+def _fill(template, values):
+    return _PARAM.sub(lambda match: str(values[match.group(1)]), template)
+
+
+def _find_id(data, fields):
+    """Return the first of ``fields`` in a response body or in the objects it wraps"""
+    if not isinstance(data, dict):
+        return None
+    for field in fields:
+        if data.get(field) is not None:
+            return data[field]
+    for value in data.values():
+        if isinstance(value, dict):
+            for field in fields:
+                if value.get(field) is not None:
+                    return value[field]
+    return None
+
+
+class CoverageTest(BaseResourceTest):
+    """Base class of the generated coverage tests: sends any planned operation of the spec"""
+    abstract = True
+
+    def call_operation(self, operation_id):
+        """Send one operation with its path parameters bound (see plan_operation); return the response or None"""
+        plan = plan_operation(operation_id)
+        if plan.operation.method in MUTATING_METHODS and run_clock.draining:
+            return None
+        values = {}
+        for param in plan.params:
+            if param == plan.target:
+                created = self._create(plan.creator, param, values)
+                if created is None:
+                    self.log.debug("%s skipped: could not create its {%s}", operation_id, param)
+                    return None
+                values[param] = created
+            else:
+                value = self._fixture(plan.fixtures[param], values)
+                if value is None:
+                    self.log.debug("%s skipped: no fixtures for {%s}", operation_id, param)
+                    return None
+                values[param] = value
+
+        response = self._send(plan, _fill(plan.operation.path, values))
+        if plan.creates:
+            created = self._created_id(response, plan.creates) if response.status_code in (200, 201) else None
+            if created is not None and plan.cleanup:
+                self.schedule_delete(_fill(plan.cleanup, dict(values, **{plan.creates: created})))
+        elif plan.target and plan.cleanup and not (plan.operation.method == 'DELETE'
+                                                   and response.status_code in (200, 204)):
+            # Queue the created target for deletion, unless this request (soft or /hard DELETE) removed it
+            self.schedule_delete(_fill(plan.cleanup, values))
+        return response
+
+    def _send(self, plan, path):
+        operation = plan.operation
+        name = operation.operation_id
+        if operation.method == 'GET':
+            return self.get_resource(path, name)
+        if operation.method == 'DELETE':
+            return self.delete_resource(path, name)
+        data = self.prepared_payload(operation.operation_id) if plan.has_body else {}
+        if operation.method == 'POST':
+            return self.post_resource(path, data, name)
+        if operation.method == 'PUT':
+            return self.put_resource(path, data, name)
+        return self.patch_resource(path, data, name)
+
+    def _create(self, creator, param, values):
+        """Create a disposable entity with a creator plan (parents bound from ``values``); return its ID"""
+        creator_values = dict(values)
+        for parent in creator.params:
+            if parent not in creator_values:
+                value = self._fixture(creator.fixtures[parent], creator_values)
+                if value is None:
+                    return None
+                creator_values[parent] = value
+        data = self.prepared_payload(creator.operation.operation_id) if creator.has_body else {}
+        response = self.post_resource(_fill(creator.operation.path, creator_values), data, creator.operation.operation_id)
+        if response.status_code not in (200, 201):
+            return None
+        return self._created_id(response, param)
+
+    def _created_id(self, response, param):
+        try:
+            return _find_id(response.json(), (param,) + CREATED_ID_FIELDS)
+        except ValueError:
+            return None
+
+    def _fixture(self, binding, values):
+        """Return an existing value for a path parameter (parents bound from ``values``), or None"""
+        if binding.resource:
+            return self.choose_cached_id(binding.resource)
+        list_path = _fill(binding.prefix, values)
+        id_registry.add_source(list_path, ResourceIdSource(
+            list_path, binding.list_keys, binding.id_fields, name=binding.prefix,
+        ))
+        self._ensure_headers_set()
+        return id_registry.choose_id(self.client, list_path)
@@ -0,0 +1,85 @@
+"""
+Fixture discovery phase for ScoreBuddy API load tests
+
+Hooked into Locust's ``test_start`` event: before any user is spawned, each worker (or the
+local runner) walks the paginated list endpoints for DISCOVERY_RESOURCES concurrently and
+fills the shared ID registry (id_registry.py). GET-by-ID tasks then sample from the full
+population instead of the first page of each list.
+
+Discovered IDs are persisted per host (fixture_cache.py), so later runs within
+FIXTURE_CACHE_TTL start without crawling. Set DISCOVERY_ENABLED=false to skip discovery;
+the registry then fetches each resource lazily on first use.
+"""
+import time
+import gevent
+from locust import events
+from locust.runners import MasterRunner
+from config.settings import settings
+from auth.token_manager import token_manager
+from tests.base.engine import ResourceHttpSession
+from tests.base.fixture_cache import load_fixtures, save_fixtures
+from tests.base.id_registry import id_registry
+from tests.base.log import get_logger
+
+log = get_logger('discovery')
+
+
+def discover_ids(environment, resources=None):
+    """Load the ID registry for the given resources (default DISCOVERY_RESOURCES) concurrently
+
+    Resources found in a fresh on-disk fixture cache (fixture_cache.py) are loaded from it;
+    the rest are fetched from the API and the cache is rewritten.
+    """
+    host = environment.host or settings.API_HOST
+    if not host:
+        log.warning("No API host configured - skipping fixture discovery")
+        return False
+
+    resources = [resource for resource in (resources or settings.DISCOVERY_RESOURCES) if resource]
+    unknown = [resource for resource in resources if resource not in id_registry.sources]
+    if unknown:
+        log.warning("Ignoring unknown DISCOVERY_RESOURCES: %s", ", ".join(unknown))
+        resources = [resource for resource in resources if resource not in unknown]
+
+    started = time.time()
+    cached = (load_fixtures(host) if settings.FIXTURE_CACHE_ENABLED else None) or {}
+    for resource, (ids, _) in cached.items():
+        if resource in id_registry.sources:
+            id_registry.set_ids(host, resource, ids)
+    missing = [resource for resource in resources if resource not in cached]
+    if not missing:
+        log.info("Fixture discovery loaded from cache in %.3fs", time.time() - started)
+        return True
+
+    session = ResourceHttpSession(base_url=host, request_event=environment.events.request, user=None)
+    session.trust_env = False
+    session.timeout = 30
+    token = token_manager.get_shared_token(session)
+    if not token:
+        log.warning("No authentication token - skipping fixture discovery")
+        return False
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    })
+
+    jobs = [gevent.spawn(id_registry.load, session, resource) for resource in missing]
+    gevent.joinall(jobs)
+    counts = {resource: len(job.value) if job.successful() else 0 for resource, job in zip(missing, jobs)}
+    log.info("Fixture discovery finished in %.1fs: %s", time.time() - started,
+             ", ".join(f"{resource}={count}" for resource, count in counts.items()))
+
+    if settings.FIXTURE_CACHE_ENABLED:
+        # Resources loaded from the cache keep their discovery time, so they still expire
+        created = {resource: discovered for resource, (_, discovered) in cached.items()}
+        save_fixtures(host, id_registry.snapshot(host), created=created)
+    return True
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    """Run discovery before users spawn (the master does not run users, so it skips it)"""
+    if not settings.DISCOVERY_ENABLED or isinstance(environment.runner, MasterRunner):
+        return
+    discover_ids(environment)
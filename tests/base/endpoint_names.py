@@ -0,0 +1,79 @@
+"""
+Stats name templating for ScoreBuddy API load tests
+
+Collapses concrete request URLs such as ``/scores/1234`` or ``/staff/650`` to their
+OpenAPI path template (``/scores/{score_id}``, ``/staff/{staff_id}``) so Locust keeps
+one stats entry per endpoint instead of one per ID.
+"""
+from tests.base.log import get_logger
+from tests.base.openapi_spec import OPENAPI_SPEC_FILE, load_spec
+
+log = get_logger('endpoint_names')
+
+# Trie key used for a {path_parameter} segment
+_PARAM = '{}'
+
+
+class EndpointNameMatcher:
+    """Precompiled path-segment trie that maps concrete URLs to OpenAPI path templates"""
+
+    def __init__(self, templates):
+        self._literal_paths = set()
+        self._root = {}
+        for template in templates:
+            if '{' not in template:
+                self._literal_paths.add(template)
+            node = self._root
+            for segment in template.strip('/').split('/'):
+                key = _PARAM if segment.startswith('{') else segment
+                node = node.setdefault(key, {})
+            node[None] = template  # Leaf marker holding the template
+
+    @classmethod
+    def from_spec_file(cls, spec_file=OPENAPI_SPEC_FILE):
+        """Build a matcher from the paths in an OpenAPI JSON file"""
+        return cls(load_spec(spec_file).paths)
+
+    def match(self, url):
+        """Return the path template for a relative URL, or None if it is not in the spec"""
+        path = url.split('?', 1)[0]
+        # Fast path: list endpoints and other IDs-free URLs are already templates
+        if path in self._literal_paths:
+            return path
+        segments = path.strip('/').split('/')
+        return self._match_segments(self._root, segments, 0)
+
+    def _match_segments(self, node, segments, index):
+        """Walk the trie, preferring literal segments (/scores/reviews) over parameters (/scores/{score_id})"""
+        if index == len(segments):
+            return node.get(None)
+        segment = segments[index]
+        literal_child = node.get(segment)
+        if literal_child is not None:
+            template = self._match_segments(literal_child, segments, index + 1)
+            if template:
+                return template
+        param_child = node.get(_PARAM)
+        if param_child is not None and segment:
+            return self._match_segments(param_child, segments, index + 1)
+        return None
+
+
+def _load_default_matcher():
+    """Load the matcher for the bundled spec, or an empty one if the spec is missing"""
+    try:
+        return EndpointNameMatcher.from_spec_file()
+    except (OSError, ValueError) as e:
+        log.warning("Could not load OpenAPI spec for stats names (%s), using raw URLs", e)
+        return EndpointNameMatcher([])
+
+
+endpoint_matcher = _load_default_matcher()
+
+
+def endpoint_name(url):
+    """Return the stats name for a request URL (its OpenAPI template), or None to keep Locust's default"""
+    if not isinstance(url, str) or not url.startswith('/'):
+        # Absolute URLs (e.g. the token endpoint) keep Locust's default naming
+        return None
+    return endpoint_matcher.match(url)
@@ -0,0 +1,170 @@
+"""
+HTTP engine selection for ScoreBuddy API load tests
+
+Resource test classes inherit from ``ResourceUser``, which is either Locust's
+python-requests based ``HttpUser`` (default) or a geventhttpclient based
+``FastHttpUser`` when ``HTTP_ENGINE=fast`` is set in the environment / .env file.
+
+Both engines name requests by their OpenAPI path template (see endpoint_names.py)
+unless the caller passes an explicit ``name=``, and recover from 401 responses by
+re-authenticating once and retrying the request (see AuthRetryMixin).
+"""
+from locust import HttpUser, User
+from locust.clients import HttpSession
+from locust.exception import StopTest
+from locust.contrib.fasthttp import FastHttpSession, FastHttpUser
+from config.settings import settings
+from auth.token_manager import token_manager
+from tests.base.endpoint_names import endpoint_name
+
+# Stats name suffix for requests rejected with 401 and retried after re-authentication
+AUTH_RETRY_SUFFIX = " [401 auth retry]"
+
+
+class TemplatedNameMixin:
+    """Session mixin that defaults the stats name to the endpoint's OpenAPI path template"""
+
+    def request(self, method, url, name=None, **kwargs):
+        if name is None and not self.request_name:
+            path = url
+            if self.base_url and isinstance(url, str) and url.startswith(self.base_url):
+                # Absolute URLs on the API host (e.g. the token endpoint) are named like relative ones
+                path = url[len(self.base_url):]
+            name = endpoint_name(path)
+        return super().request(method, url, name=name, **kwargs)
+
+
+class AuthRetryMixin:
+    """Session mixin: on a 401, re-authenticate once for the whole process and retry the request once
+
+    The rejected attempt is reported as ``<name> [401 auth retry]`` so endpoint stats only
+    contain the retried result. Disabled with AUTH_RETRY_ON_401=false.
+    """
+
+    def request(self, method, url, **kwargs):
+        request_headers = kwargs.get("headers") or {}
+        authorization = request_headers.get("Authorization") or self.headers.get("Authorization", "")
+        if (not settings.AUTH_RETRY_ON_401 or not authorization
+                or (isinstance(url, str) and url.endswith(settings.AUTH_ENDPOINT))):
+            return super().request(method, url, **kwargs)
+
+        # Hold back reporting of the first attempt until we know whether it will be retried
+        caller_catches_response = kwargs.get("catch_response", False)
+        response = super().request(method, url, **dict(kwargs, catch_response=True))
+        if response.status_code == 401:
+            token = token_manager.reauthenticate(self, rejected_token=authorization[len("Bearer "):])
+            if token:
+                response.request_meta["name"] = f"{response.request_meta['name']}{AUTH_RETRY_SUFFIX}"
+                response.__exit__(None, None, None)
+                self.headers["Authorization"] = f"Bearer {token}"
+                if "Authorization" in request_headers:
+                    kwargs["headers"] = dict(request_headers, Authorization=f"Bearer {token}")
+                return super().request(method, url, **kwargs)
+        if not caller_catches_response:
+            # Report it now, as the session would have without catch_response
+            response.__exit__(None, None, None)
+        return response
+
+
+class ResourceHttpSession(AuthRetryMixin, TemplatedNameMixin, HttpSession):
+    """HttpSession with templated stats names and 401 recovery"""
+
+
+class ResourceFastHttpSession(AuthRetryMixin, TemplatedNameMixin, FastHttpSession):
+    """FastHttpSession with templated stats names, 401 recovery and a mutable ``headers`` dict, like requests.Session
+
+    BaseResourceTest and TokenManager update ``client.headers`` after login, so the
+    fast engine needs the same session-level headers that HttpSession provides.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers = {}
+        self.timeout = None  # Kept for parity with HttpSession; FastHttpUser timeouts are class attributes
+
+    def request(self, method, url, name=None, headers=None, **kwargs):
+        """Send a request with the session headers merged under the per-request headers"""
+        if self.headers:
+            merged_headers = dict(self.headers)
+            if headers:
+                merged_headers.update(headers)
+            headers = merged_headers
+        return super().request(method, url, name=name, headers=headers, **kwargs)
+
+
+def _resolve_host(user):
+    """Fall back to settings.API_HOST when --host was not given"""
+    if not user.host:
+        user.host = settings.API_HOST
+    if not user.host:
+        raise StopTest(
+            "No API host configured - pass --host or set API_HOST in .env file"
+        )
+
+
+class HttpResourceUser(HttpUser):
+    """HttpUser variant using ResourceHttpSession"""
+    abstract = True
+
+    def __init__(self, environment):
+        _resolve_host(self)
+        # Skip HttpUser.__init__ so the session is only built once
+        User.__init__(self, environment)
+        self.client = ResourceHttpSession(
+            base_url=self.host,
+            request_event=self.environment.events.request,
+            user=self,
+            pool_manager=self.pool_manager,
+        )
+        self.client.trust_env = False
+
+
+class FastResourceUser(FastHttpUser):
+    """FastHttpUser variant that behaves like HttpUser for BaseResourceTest"""
+    abstract = True
+
+    # Same 10s timeout BaseResourceTest applies to the HttpUser client
+    network_timeout = 10.0
+    connection_timeout = 10.0
+
+    def __init__(self, environment):
+        _resolve_host(self)
+        # Skip FastHttpUser.__init__ so the session is only built once, with header support
+        User.__init__(self, environment)
+        self.client = ResourceFastHttpSession(
+            base_url=self.host,
+            request_event=self.environment.events.request,
+            network_timeout=self.network_timeout,
+            connection_timeout=self.connection_timeout,
+            max_redirects=self.max_redirects,
+            max_retries=self.max_retries,
+            insecure=self.insecure,
+            concurrency=self.concurrency,
+            user=self,
+            client_pool=self.client_pool,
+            ssl_context_factory=self.ssl_context_factory,
+            headers=self.default_headers,
+            proxy_host=self.proxy_host,
+            proxy_port=self.proxy_port,
+        )
+
+
+# Available engines, keyed by the HTTP_ENGINE setting value
+HTTP_ENGINES = {
+    "http": HttpResourceUser,
+    "fast": FastResourceUser,
+}
+
+
+def get_engine_user_class(engine=None):
+    """Return the Locust user base class for the given engine name (defaults to settings.HTTP_ENGINE)"""
+    engine = (engine or settings.HTTP_ENGINE or "http").lower()
+    if engine not in HTTP_ENGINES:
+        raise ValueError(
+            f"Unknown HTTP_ENGINE '{engine}'. Valid values: {', '.join(HTTP_ENGINES)}"
+        )
+    return HTTP_ENGINES[engine]
+
+
+# Base class used by BaseResourceTest and main.LoadTestUser
+ResourceUser = get_engine_user_class()
@@ -0,0 +1,136 @@
+"""
+On-disk fixture cache for ScoreBuddy API load tests
+
+Discovered resource IDs (see discovery.py) are written to one file per API host under
+FIXTURE_CACHE_DIR, so the next run within FIXTURE_CACHE_TTL can skip re-crawling the list
+endpoints. The file is memory-mapped on load and the ID arrays are copied straight out of it.
+
+File layout::
+
+    b'SBFX' | header length (uint32, little endian) | JSON header | raw int64 ID arrays
+
+The header holds the schema version, host, byte order and, per resource, its discovery
+time and the offset and count of its array (or an ``ids`` list for non-integer IDs). Files
+with a different schema version, host or byte order are ignored, as are resources older than
+the TTL. Rewriting the file keeps the discovery time of resources that came from it, so
+a resource that keeps being rediscovered does not renew the others.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from config.settings import settings
+from tests.base.log import get_logger
+
+log = get_logger('fixture_cache')
+
+# Bump when the file layout or the meaning of cached resources changes
+FIXTURE_CACHE_SCHEMA = 2
+
+_MAGIC = b'SBFX'
+_HEADER_LENGTH = struct.Struct('<I')
+
+
+def cache_path(host, cache_dir=None):
+    """Return the cache file path for an API host"""
+    digest = hashlib.sha1(host.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir or settings.FIXTURE_CACHE_DIR, f"{digest}.fixtures")
+
+
+def save_fixtures(host, fixtures, cache_dir=None, created=None):
+    """Write {resource: IDs} for a host; the file is replaced atomically
+
+    ``created`` maps resources to their original discovery time (resources loaded from the
+    cache); the others are stamped now.
+    """
+    now = time.time()
+    created = created or {}
+    header = {
+        'schema': FIXTURE_CACHE_SCHEMA,
+        'host': host,
+        'byteorder': sys.byteorder,
+        'resources': {},
+    }
+    blobs = []
+    offset = 0
+    for resource, ids in fixtures.items():
+        if isinstance(ids, array) and ids.typecode == 'q':
+            data = ids
+        else:
+            try:
+                data = array('q', ids)
+            except (TypeError, OverflowError):
+                header['resources'][resource] = {'created': created.get(resource, now), 'ids': list(ids)}
+                continue
+        blob = data.tobytes()
+        header['resources'][resource] = {'created': created.get(resource, now), 'offset': offset, 'count': len(data)}
+        blobs.append(blob)
+        offset += len(blob)
+
+    path = cache_path(host, cache_dir)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning("Could not write fixture cache %s: %s", path, e)
+        return None
+    log.info("Saved fixture cache %s (%s)", path, ", ".join(f"{r}={len(ids)}" for r, ids in fixtures.items()))
+    return path
+
+
+def load_fixtures(host, cache_dir=None, ttl=None):
+    """Return {resource: (IDs, discovery time)} of a host's fresh resources, or None if there is no compatible cache file"""
+    path = cache_path(host, cache_dir)
+    ttl = settings.FIXTURE_CACHE_TTL if ttl is None else ttl
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(_MAGIC)] != _MAGIC:
+                log.warning("Ignoring fixture cache %s: not a fixture cache file", path)
+                return None
+            header_start = len(_MAGIC) + _HEADER_LENGTH.size
+            (header_length,) = _HEADER_LENGTH.unpack(data[len(_MAGIC):header_start])
+            header = json.loads(data[header_start:header_start + header_length])
+            if (header.get('schema') != FIXTURE_CACHE_SCHEMA or header.get('host') != host
+                    or header.get('byteorder') != sys.byteorder):
+                log.info("Ignoring fixture cache %s: schema/host mismatch", path)
+                return None
+
+            now = time.time()
+            blob_start = header_start + header_length
+            fixtures = {}
+            stale = []
+            for resource, entry in header.get('resources', {}).items():
+                created = entry.get('created', 0)
+                if now - created > ttl:
+                    stale.append(resource)
+                    continue
+                if 'ids' in entry:
+                    fixtures[resource] = (tuple(entry['ids']), created)
+                    continue
+                ids = array('q')
+                start = blob_start + entry['offset']
+                ids.frombytes(data[start:start + entry['count'] * ids.itemsize])
+                fixtures[resource] = (ids, created)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        log.warning("Ignoring unreadable fixture cache %s: %s", path, e)
+        return None
+    if stale:
+        log.info("Fixture cache %s: ignoring %s (older than FIXTURE_CACHE_TTL=%ss)", path, ", ".join(stale), ttl)
+    if fixtures:
+        log.info("Loaded fixture cache %s (%s, oldest %.0fs old)", path, ", ".join(fixtures),
+                 now - min(created for _, created in fixtures.values()))
+    return fixtures
@@ -0,0 +1,149 @@
+"""
+HDR-style latency histogram for ScoreBuddy API load tests
+
+Values (integers, e.g. microseconds) are counted in log-linear buckets: exact below 256,
+then 128 sub-buckets per power of two, so every recorded value is kept to within 1/128
+(< 1%) of its true value at any magnitude. Counts are stored sparsely, so a histogram costs
+memory only for the ranges actually seen, and two histograms merge by adding counts - with no
+loss, unlike averaging percentiles.
+
+Snapshots are serialized compactly (to_bytes): delta-encoded bucket indexes and counts as
+varints, zlib-compressed - typically a few hundred bytes per endpoint - for worker reports.
+"""
+import math
+import zlib
+
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS      # 256: values below this are counted exactly
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1      # 128 sub-buckets per power of two above it
+
+
+def bucket_index(value):
+    """Return the bucket index for a non-negative integer value"""
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def bucket_range(index):
+    """Return the (lowest, highest) values counted in a bucket"""
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = index // SUB_BUCKET_HALF - 1
+    lowest = (index - shift * SUB_BUCKET_HALF) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class HdrHistogram:
+    """Sparse log-linear histogram of non-negative integers"""
+
+    __slots__ = ('counts', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = {}  # bucket index -> count
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value, count=1):
+        value = int(value) if value > 0 else 0
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def record_corrected(self, value, expected_interval, max_extra=10000):
+        """Record a value plus the samples a stalled closed-loop client failed to issue
+
+        As in HdrHistogram's recordValueWithExpectedInterval: a value larger than the expected
+        interval between requests also records value - interval, value - 2 * interval, ...
+        down to the interval (at most ``max_extra`` extra samples).
+        """
+        self.record(value)
+        if expected_interval <= 0:
+            return
+        missing = value - expected_interval
+        while missing >= expected_interval and max_extra > 0:
+            self.record(missing)
+            missing -= expected_interval
+            max_extra -= 1
+
+    def merge(self, other):
+        """Add the counts of another histogram"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def percentile(self, percent):
+        """Return the value at a percentile (0-100), as the highest value of its bucket, or None"""
+        if not self.total:
+            return None
+        if percent >= 100:
+            return self.max
+        rank = max(math.ceil(self.total * percent / 100.0), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_range(index)[1], self.max)
+        return self.max
+
+    def mean(self):
+        if not self.total:
+            return None
+        return sum(sum(bucket_range(index)) / 2.0 * count for index, count in self.counts.items()) / self.total
+
+    def to_bytes(self):
+        """Serialize as zlib-compressed varints: min, max, then (index delta, count) per bucket"""
+        data = bytearray()
+        _write_varint(data, self.min or 0)
+        _write_varint(data, self.max or 0)
+        previous = 0
+        for index in sorted(self.counts):
+            _write_varint(data, index - previous)
+            _write_varint(data, self.counts[index])
+            previous = index
+        return zlib.compress(bytes(data))
+
+    @classmethod
+    def from_bytes(cls, blob):
+        data = zlib.decompress(blob)
+        histogram = cls()
+        histogram.min, position = _read_varint(data, 0)
+        histogram.max, position = _read_varint(data, position)
+        index = 0
+        while position < len(data):
+            delta, position = _read_varint(data, position)
+            count, position = _read_varint(data, position)
+            index += delta
+            histogram.counts[index] = count
+            histogram.total += count
+        if not histogram.total:
+            histogram.min = histogram.max = None
+        return histogram
+
+
+def _write_varint(data, value):
+    while value >= 0x80:
+        data.append((value & 0x7f) | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def _read_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
@@ -0,0 +1,318 @@
+"""
+Process-wide resource ID registry for ScoreBuddy API load tests
+
+GET tests pick random existing IDs (scores, staff, scorecards, ...) for their
+``/resource/{id}`` requests. Instead of every user fetching its own list on first use,
+the registry fetches each resource list once per worker process and API host, shares the
+result with all users and refreshes it in the background once ID_REGISTRY_TTL expires.
+
+List endpoints are walked page by page (``limit``/``page``, see query_limit_* and query_page
+in the OpenAPI spec) so tasks sample the whole population rather than the first page.
+Pages after the first are fetched concurrently. The discovery phase (discovery.py) fills the
+registry at test start, before any user is spawned.
+
+Reads are lock-free: the IDs for a (host, resource) key live in an immutable pool that is
+swapped atomically when a refresh completes.
+"""
+import bisect
+import math
+import random
+import threading
+import time
+from array import array
+from itertools import accumulate
+from urllib.parse import parse_qs, urlsplit
+from gevent.pool import Pool
+from config.settings import settings
+from tests.base.log import get_logger
+
+log = get_logger('id_registry')
+
+
+class ResourceIdSource:
+    """Describes where the IDs for one resource type come from"""
+
+    def __init__(self, endpoint, list_keys, id_fields, params=None, page_size=None, fallback_ids=(), valid_ids=None,
+                 name=None):
+        self.endpoint = endpoint
+        self.name = name or endpoint      # Stats name of the list requests
+        self.list_keys = list_keys        # Keys that may hold the list in a dict response
+        self.id_fields = id_fields        # ID field names, in order of preference
+        self.params = params              # Extra query parameters for the list request
+        self.page_size = page_size        # 'limit' per page; None fetches a single unpaged list
+        self.fallback_ids = tuple(fallback_ids)  # Used when the list cannot be fetched
+        self.valid_ids = frozenset(valid_ids) if valid_ids is not None else None  # Optional allow-list
+
+    def extract_items(self, data):
+        """Return the list of objects in a list response (either a bare list or a dict wrapping one)"""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            for key in self.list_keys:
+                if isinstance(data.get(key), list):
+                    return data[key]
+        return None
+
+    def extract_ids(self, items):
+        """Extract the IDs from a list of objects, skipping IDs outside valid_ids"""
+        ids = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for field in self.id_fields:
+                if field in item:
+                    item_id = item[field]
+                    if self.valid_ids is None or item_id in self.valid_ids:
+                        ids.append(item_id)
+                    break
+        return ids
+
+
+# ID sources per resource type (page sizes are the query_limit_* maximums from the OpenAPI spec;
+# fallbacks and valid ranges are the known-good staging IDs)
+ID_SOURCES = {
+    'scores': ResourceIdSource('/scores', ('scores',), ('score_id', 'id'), page_size=10),
+    'staff': ResourceIdSource(
+        '/staff', ('staff',), ('staff_id', 'id'),
+        page_size=25,
+        fallback_ids=[590, 595, 600, 605, 610, 615, 620, 625, 630, 635],
+        valid_ids=range(590, 639),  # IDs before 590 are soft-deleted
+    ),
+    'users': ResourceIdSource(
+        '/users', ('users',), ('user_id', 'id'),
+        page_size=25,
+        fallback_ids=[100, 101, 102, 103, 104, 105],
+    ),
+    'teams': ResourceIdSource(
+        '/teams', ('teams',), ('team_id', 'id'),
+        page_size=100,
+        fallback_ids=range(34, 46),
+        valid_ids=range(34, 46),  # Visible in UI, not soft deleted
+    ),
+    'groups': ResourceIdSource(
+        '/groups', ('groups',), ('id', 'group_id'),
+        page_size=100,
+        fallback_ids=[32, 33, 34, 35, 36, 37],
+    ),
+    'integrations': ResourceIdSource(
+        '/integrations', ('integrations',), ('integration_id', 'id'),
+        page_size=25,
+        fallback_ids=[1, 2, 3, 4, 5],
+    ),
+    'scorecards': ResourceIdSource(
+        '/scorecards', ('scorecard', 'scorecards'), ('scorecard_id',),
+        page_size=100,  # Spec says 5, but the API accepts 100 (covers the 70-89 UI range in one page)
+        fallback_ids=range(70, 90),
+    ),
+    'scorecard_categories': ResourceIdSource(
+        '/scorecards/categories', ('categories',), ('category_id',),
+        page_size=100,
+        fallback_ids=[5, 8, 27, 44, 45, 46],
+    ),
+}
+
+
+class IdPool:
+    """Immutable set of IDs for one (host, resource) key, with optional skewed sampling
+
+    With ``skew`` > 0, IDs are drawn from a Zipf-like distribution (weight 1 / rank ** skew)
+    over a shuffled order, so a random subset of the population is "hot" - closer to real
+    traffic than uniform sampling, without always hitting the first page.
+    """
+
+    __slots__ = ('ids', 'cum_weights', 'fallback')
+
+    def __init__(self, ids, skew=0.0, fallback=False):
+        ids = list(ids)
+        cum_weights = None
+        if skew > 0 and len(ids) > 1:
+            random.shuffle(ids)
+            cum_weights = array('d', accumulate(1.0 / (rank ** skew) for rank in range(1, len(ids) + 1)))
+        self.ids = _compact(ids)
+        self.cum_weights = cum_weights
+        self.fallback = fallback  # True when these are the hardcoded fallback IDs, not fetched ones
+
+    def __len__(self):
+        return len(self.ids)
+
+    def choose(self):
+        """Return a random ID (None if the pool is empty)"""
+        if not self.ids:
+            return None
+        if self.cum_weights is None:
+            return random.choice(self.ids)
+        index = bisect.bisect(self.cum_weights, random.random() * self.cum_weights[-1])
+        return self.ids[min(index, len(self.ids) - 1)]
+
+
+def _compact(ids):
+    """Store integer IDs in a flat array (8 bytes per ID); anything else in a tuple"""
+    if all(type(item_id) is int for item_id in ids):
+        try:
+            return array('q', ids)
+        except OverflowError:
+            pass
+    return tuple(ids)
+
+
+class IdRegistry:
+    """Shared (host, resource) -> IDs cache with TTL-based background refresh"""
+
+    def __init__(self, sources=None, ttl=None, retry_interval=None, skew=None):
+        self.sources = dict(sources if sources is not None else ID_SOURCES)
+        self.ttl = settings.ID_REGISTRY_TTL if ttl is None else ttl
+        self.retry_interval = settings.ID_REGISTRY_RETRY_INTERVAL if retry_interval is None else retry_interval
+        self.skew = settings.ID_SAMPLING_SKEW if skew is None else skew
+        self._pools = {}        # (host, resource) -> IdPool
+        self._expires_at = {}   # (host, resource) -> epoch seconds
+        self._refreshing = set()
+        self._load_locks = {}   # (host, resource) -> Lock held during the first fetch
+
+    def get_ids(self, client, resource):
+        """Return the IDs for a resource type (fetching them on first use for this host)"""
+        return self._get_pool(client, resource).ids
+
+    def choose_id(self, client, resource):
+        """Return a random ID for a resource type (uniform or skewed, see ID_SAMPLING_SKEW), or None"""
+        return self._get_pool(client, resource).choose()
+
+    def add_source(self, resource, source):
+        """Register where the IDs of an extra resource come from (kept if already registered)"""
+        return self.sources.setdefault(resource, source)
+
+    def set_ids(self, host, resource, ids, ttl=None, fallback=False):
+        """Store IDs for a (host, resource) key (e.g. loaded from the fixture cache)"""
+        key = (host, resource)
+        self._pools[key] = IdPool(ids, self.skew, fallback)
+        self._expires_at[key] = time.time() + (self.ttl if ttl is None else ttl)
+
+    def load(self, client, resource):
+        """Fetch the IDs for a resource now unless they are already cached (used by the discovery phase)"""
+        return self._get_pool(client, resource)
+
+    def snapshot(self, host):
+        """Return {resource: IDs} of everything fetched from the API for a host (fallbacks excluded)"""
+        return {
+            resource: pool.ids
+            for (pool_host, resource), pool in list(self._pools.items())
+            if pool_host == host and not pool.fallback and len(pool)
+        }
+
+    def clear(self):
+        """Forget all cached IDs (useful for testing)"""
+        self._pools.clear()
+        self._expires_at.clear()
+
+    def _get_pool(self, client, resource):
+        key = (client.base_url, resource)
+        pool = self._pools.get(key)
+        if pool is None:
+            return self._load(client, key)
+        if time.time() >= self._expires_at.get(key, 0) and key not in self._refreshing:
+            self._refreshing.add(key)
+            threading.Thread(target=self._refresh, args=(client, key), daemon=True).start()
+        return pool
+
+    def _load(self, client, key):
+        """First fetch for a key - concurrent callers wait for the first one instead of fetching again"""
+        with self._load_locks.setdefault(key, threading.Lock()):
+            pool = self._pools.get(key)
+            if pool is None:
+                self._fetch(client, key)
+                pool = self._pools[key]
+        return pool
+
+    def _refresh(self, client, key):
+        """Background refresh; users keep reading the previous pool meanwhile"""
+        try:
+            self._fetch(client, key)
+        finally:
+            self._refreshing.discard(key)
+
+    def _fetch(self, client, key):
+        """Fetch all pages of the list endpoint and swap in the new IDs"""
+        host, resource = key
+        source = self.sources[resource]
+        started = time.time()
+        try:
+            ids = self._fetch_ids(client, resource, source)
+        except Exception as e:
+            log.error("Error fetching %s IDs for ID registry: %s", resource, e)
+            ids = None
+
+        if ids:
+            self.set_ids(host, resource, ids)
+            log.info("Cached %s %s IDs for %s in %.1fs", len(ids), resource, host, time.time() - started)
+        elif self._pools.get(key):
+            # Keep serving the last good IDs and try again soon
+            self._expires_at[key] = time.time() + self.retry_interval
+        else:
+            self.set_ids(host, resource, source.fallback_ids, ttl=self.retry_interval, fallback=True)
+            log.info("No %s IDs from API, using %s fallback IDs", resource, len(source.fallback_ids))
+
+    def _get_page(self, client, resource, source, url, params):
+        """GET one list page and return its decoded JSON, or None on failure"""
+        # Separate stats name so registry fetches don't skew the endpoint's own numbers
+        response = client.get(url, params=params, name=f"{source.name} [id registry]")
+        if response.status_code != 200:
+            log.warning("Failed to fetch %s list for ID registry: %s", resource, response.status_code)
+            return None
+        return response.json()
+
+    def _fetch_ids(self, client, resource, source):
+        """Collect IDs from every page of a list endpoint (None if the first page fails)"""
+        params = dict(source.params or {})
+        if source.page_size:
+            params['limit'] = source.page_size
+        data = self._get_page(client, resource, source, source.endpoint, params or None)
+        if data is None:
+            return None
+        items = source.extract_items(data)
+        if items is None:
+            log.warning("Unexpected %s response format, using fallback IDs", resource)
+            return None
+        ids = source.extract_ids(items)
+
+        next_page = data.get('next_page') if isinstance(data, dict) else None
+        if not source.page_size or not next_page or not items:
+            return ids
+
+        max_pages = settings.DISCOVERY_MAX_PAGES
+        next_index = _page_index(next_page)
+        total = data.get('total')
+        if next_index is not None and isinstance(total, int):
+            # Page count is known: fetch the remaining pages concurrently
+            page_count = min(math.ceil(total / len(items)), max_pages)
+            pool = Pool(settings.DISCOVERY_CONCURRENCY)
+            pages = pool.imap_unordered(
+                lambda page: self._get_page(client, resource, source, source.endpoint, dict(params, page=page)),
+                range(next_index, next_index + page_count - 1),
+            )
+            for page_data in pages:
+                page_items = source.extract_items(page_data) if page_data is not None else None
+                if page_items:
+                    ids.extend(source.extract_ids(page_items))
+        else:
+            # No page number or total: follow the next_page links one by one
+            for _ in range(max_pages - 1):
+                page_data = self._get_page(client, resource, source, next_page, None)
+                page_items = source.extract_items(page_data) if page_data is not None else None
+                if not page_items:
+                    break
+                ids.extend(source.extract_ids(page_items))
+                next_page = page_data.get('next_page') if isinstance(page_data, dict) else None
+                if not next_page:
+                    break
+        return ids
+
+
+def _page_index(url):
+    """Return the integer ``page`` query parameter of a next_page URL, or None"""
+    try:
+        return int(parse_qs(urlsplit(url).query)['page'][0])
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+# Global ID registry instance shared by all users in this process
+id_registry = IdRegistry()
@@ -0,0 +1,216 @@
+"""
+Coordinated-omission-corrected latency for ScoreBuddy API load tests
+
+Locust's response time starts when a request is actually sent. When the API stalls, a
+back-to-back user simply sends fewer requests, so a 5 second stall shows up as one slow
+request instead of the hundreds that were delayed. This module records, per endpoint, latency
+measured from each request's *intended* start in an HDR histogram (hdr.py), next to Locust's
+raw response time:
+
+- Arrival-rate mode (arrival.py): the first request of a dispatched task is measured from its
+  scheduled dispatch time, so scheduler lag and a full in-flight pool are included
+- Closed model: each user's typical interval between requests is tracked (moving average of
+  its response times); a request slower than that also records the requests the user would
+  have issued meanwhile (HdrHistogram's expected-interval correction)
+
+Raw response times of every request (any user class) are recorded the same way, so
+percentiles are accurate to 1% instead of Locust's rounded buckets. Workers send compact
+histogram snapshots (``HdrHistogram.to_bytes``) with each stats report and the master merges
+them losslessly, so cluster-wide p99.9 is exact rather than approximated.
+
+Percentiles per endpoint and in aggregate are printed when Locust quits and, with
+``--csv <prefix>``, written to ``<prefix>_latency.csv``. HDR_HISTOGRAMS=false disables the
+recorder; LATENCY_CORRECTION=false keeps only the raw histograms.
+"""
+import csv
+import logging
+import time
+from gevent.local import local
+from locust import events
+from locust.runners import WorkerRunner
+from config.settings import settings
+from tests.base.hdr import HdrHistogram
+from tests.base.log import get_logger
+
+log = get_logger('latency')
+# Locust prints its summary tables through this logger
+console = logging.getLogger('locust.stats_logger')
+
+PERCENTILES = (50, 90, 99, 99.9, 99.99)
+CSV_COLUMNS = (['Type', 'Name', 'Requests', 'Corrected Samples']
+               + [f"Raw {p}%" for p in PERCENTILES] + [f"Corrected {p}%" for p in PERCENTILES]
+               + ['Corrected Max'])
+
+# Weight of the newest response time in a user's moving-average request interval
+PACE_SMOOTHING = 0.1
+
+_task = local()  # Per-greenlet intended start of the running task
+
+
+def set_intended_start(timestamp):
+    """Mark the scheduled start time of the task running in this greenlet"""
+    _task.intended_start = timestamp
+
+
+def pop_intended_start():
+    """Return the running task's intended start time once (for its first request), or None"""
+    timestamp = getattr(_task, 'intended_start', None)
+    if timestamp is not None:
+        _task.intended_start = None
+    return timestamp
+
+
+class Pace:
+    """A user's moving-average interval between back-to-back requests, in microseconds"""
+
+    __slots__ = ('interval',)
+
+    def __init__(self):
+        self.interval = None
+
+    def update(self, value):
+        if self.interval is None:
+            self.interval = value
+        else:
+            self.interval += (value - self.interval) * PACE_SMOOTHING
+
+
+class LatencyRecorder:
+    """Raw and corrected HDR histograms (microseconds) keyed by (request type, name)"""
+
+    def __init__(self):
+        self.raw = {}
+        self.corrected = {}
+
+    def _histograms(self, key):
+        raw = self.raw.get(key)
+        if raw is None:
+            raw = self.raw[key] = HdrHistogram()
+            self.corrected[key] = HdrHistogram()
+        return raw, self.corrected[key]
+
+    def record(self, key, response_time, intended_start=None, pace=None):
+        raw, corrected = self._histograms(key)
+        value = response_time * 1000
+        raw.record(value)
+        if not settings.LATENCY_CORRECTION:
+            return
+        if intended_start is not None:
+            corrected.record(max((time.time() - intended_start) * 1000000, value))
+        elif pace is not None:
+            if pace.interval is None:
+                corrected.record(value)
+            else:
+                corrected.record_corrected(int(value), int(pace.interval))
+            pace.update(value)
+        else:
+            corrected.record(value)
+
+    def merge(self, data):
+        """Add histograms serialized by another process (see snapshot())"""
+        for request_type, name, raw, corrected in data:
+            own_raw, own_corrected = self._histograms((request_type, name))
+            own_raw.merge(HdrHistogram.from_bytes(raw))
+            own_corrected.merge(HdrHistogram.from_bytes(corrected))
+
+    def snapshot(self, reset=False):
+        """Serialize as ``[[type, name, raw bytes, corrected bytes], ...]`` (for worker reports)"""
+        data = [[key[0], key[1], self.raw[key].to_bytes(), self.corrected[key].to_bytes()] for key in self.raw]
+        if reset:
+            self.reset()
+        return data
+
+    def reset(self):
+        self.raw = {}
+        self.corrected = {}
+
+    def aggregated(self):
+        """Return (raw, corrected) histograms over all endpoints"""
+        raw, corrected = HdrHistogram(), HdrHistogram()
+        for key in self.raw:
+            raw.merge(self.raw[key])
+            corrected.merge(self.corrected[key])
+        return raw, corrected
+
+    def rows(self):
+        entries = [(key[0], key[1], self.raw[key], self.corrected[key]) for key in sorted(self.raw)]
+        if len(entries) > 1:
+            entries.append(('', 'Aggregated') + self.aggregated())
+        for request_type, name, raw, corrected in entries:
+            yield ([request_type, name, raw.total, corrected.total]
+                   + [_ms(raw.percentile(p)) for p in PERCENTILES]
+                   + [_ms(corrected.percentile(p)) for p in PERCENTILES]
+                   + [_ms(corrected.max)])
+
+
+def _ms(microseconds):
+    return None if microseconds is None else round(microseconds / 1000.0, 1)
+
+
+latency_recorder = LatencyRecorder()
+
+
+def write_csv(path, recorder=None):
+    """Write raw and corrected percentiles (ms) to a CSV file; returns the path or None on error"""
+    recorder = recorder or latency_recorder
+    try:
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(recorder.rows())
+    except OSError as e:
+        log.warning("Could not write latency stats %s: %s", path, e)
+        return None
+    return path
+
+
+@events.request.add_listener
+def _on_request(request_type, name, response_time, context, **kwargs):
+    if not settings.HDR_HISTOGRAMS:
+        return
+    context = context or {}
+    latency_recorder.record((request_type, name), response_time,
+                            context.get('intended_start'), context.get('latency_pace'))
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    latency_recorder.reset()
+
+
+@events.reset_stats.add_listener
+def _on_reset_stats(**kwargs):
+    latency_recorder.reset()
+
+
+@events.report_to_master.add_listener
+def _on_report_to_master(client_id, data, **kwargs):
+    histograms = latency_recorder.snapshot(reset=True)
+    if histograms:
+        data['latency'] = histograms
+
+
+@events.worker_report.add_listener
+def _on_worker_report(client_id, data, **kwargs):
+    histograms = data.get('latency')
+    if histograms:
+        latency_recorder.merge(histograms)
+
+
+@events.quitting.add_listener
+def _on_quitting(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner) or not latency_recorder.raw:
+        return
+
+    console.info("HDR latency percentiles, ms (corrected = from intended start, see tests/base/latency.py)")
+    console.info("%-8s %-46s %9s %9s %9s %9s %9s %13s %13s", 'Type', 'Name', '# reqs',
+                 'p50', 'p99', 'p99.9', 'p99.99', 'corr. p99', 'corr. p99.9')
+    raw_columns = [4 + PERCENTILES.index(p) for p in (50, 99, 99.9, 99.99)]
+    corrected_columns = [4 + len(PERCENTILES) + PERCENTILES.index(p) for p in (99, 99.9)]
+    for row in latency_recorder.rows():
+        console.info("%-8s %-46s %9d %9s %9s %9s %9s %13s %13s", row[0], row[1][:46], row[2],
+                     *('-' if row[c] is None else row[c] for c in raw_columns + corrected_columns))
+
+    csv_prefix = getattr(environment.parsed_options, 'csv_prefix', None)
+    if csv_prefix:
+        write_csv(f"{csv_prefix}_latency.csv")
@@ -0,0 +1,171 @@
+"""
+Logging for ScoreBuddy API load tests
+
+Resource tests log through ``self.log`` (a standard ``logging.Logger``) instead of print():
+- Levels: LOG_LEVEL (default WARNING, so load runs stay quiet)
+- Sampling/rate limiting: each message template may be emitted LOG_RATE_LIMIT times per
+  LOG_RATE_INTERVAL seconds; DEBUG/INFO messages are additionally sampled with LOG_SAMPLE_RATE
+- Output: a background writer batches lines to LOG_FILE (or stderr when unset), so tasks
+  never block on terminal or disk writes
+
+Use %-style arguments (``self.log.debug("Retrieved %s scores", count)``) so messages that are
+filtered out are never formatted; the template doubles as the rate-limit key.
+"""
+import atexit
+import logging
+import random
+import sys
+import threading
+import time
+from collections import deque
+from config.settings import settings
+
+LOGGER_NAME = 'loadtest'
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+
+class RateLimitFilter(logging.Filter):
+    """Per-message-key rate limiting and sampling
+
+    The key is ``record.key`` when passed via ``extra={'key': ...}``, otherwise the unformatted
+    message template, so ``"Deleting staff %s..."`` is limited as one message for every ID.
+    """
+
+    def __init__(self, max_per_interval, interval, sample_rate=1.0):
+        super().__init__()
+        self.max_per_interval = max_per_interval
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self._windows = {}  # key -> [window_start, emitted, suppressed]
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+        if self.max_per_interval <= 0:
+            return True
+
+        key = getattr(record, 'key', None) or record.msg
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            # New window: report how many messages the previous one swallowed
+            record.suppressed = window[2] if window else 0
+            self._windows[key] = [now, 1, 0]
+            return True
+        if window[1] < self.max_per_interval:
+            window[1] += 1
+            record.suppressed = 0
+            return True
+        window[2] += 1
+        return False
+
+
+class SuppressedCountFormatter(logging.Formatter):
+    """Formatter that appends the number of rate-limited repeats of a message"""
+
+    def format(self, record):
+        line = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            line = f"{line} [{suppressed} similar messages suppressed]"
+        return line
+
+
+class BackgroundBatchHandler(logging.Handler):
+    """Queue formatted records and write them in batches from a background thread
+
+    Under Locust the thread is a gevent greenlet (threading is monkey-patched), so the
+    task greenlet only pays for formatting and a deque append.
+    """
+
+    def __init__(self, log_file=None, batch_size=200, flush_interval=1.0):
+        super().__init__()
+        self.log_file = log_file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stream = open(log_file, 'a', encoding='utf-8') if log_file else sys.stderr
+        self._pending = deque()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='loadtest-log-writer', daemon=True)
+        self._writer.start()
+
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._pending) >= self.batch_size or record.levelno >= logging.ERROR:
+            self._wake.set()
+
+    def _run(self):
+        """Writer loop: flush whenever a batch fills up or flush_interval elapses"""
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._write_pending()
+
+    def _write_pending(self):
+        """Write all queued lines in a single call"""
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+        if lines:
+            try:
+                self._stream.write("\n".join(lines) + "\n")
+                self._stream.flush()
+            except (OSError, ValueError):
+                pass  # Stream closed or disk full - drop the batch rather than break the test
+
+    def flush(self):
+        self._write_pending()
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self._write_pending()
+        if self.log_file:
+            self._stream.close()
+        super().close()
+
+
+def configure_logging(level=None, log_file=None, rate_limit=None, rate_interval=None,
+                      sample_rate=None, batch_size=None, flush_interval=None):
+    """(Re)configure the load test logger; arguments default to the LOG_* settings"""
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel((level or settings.LOG_LEVEL).upper())
+    logger.propagate = False
+
+    handler = BackgroundBatchHandler(
+        log_file=settings.LOG_FILE if log_file is None else log_file,
+        batch_size=batch_size or settings.LOG_BATCH_SIZE,
+        flush_interval=flush_interval or settings.LOG_FLUSH_INTERVAL,
+    )
+    # Filter on the handler (not the logger) so it also applies to child loggers
+    handler.addFilter(RateLimitFilter(
+        max_per_interval=settings.LOG_RATE_LIMIT if rate_limit is None else rate_limit,
+        interval=settings.LOG_RATE_INTERVAL if rate_interval is None else rate_interval,
+        sample_rate=settings.LOG_SAMPLE_RATE if sample_rate is None else sample_rate,
+    ))
+    handler.setFormatter(SuppressedCountFormatter(LOG_FORMAT))
+    logger.addHandler(handler)
+    return logger
+
+
+def get_logger(name=None):
+    """Return the load test logger, or a child logger such as 'loadtest.auth'"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def _shutdown():
+    """Flush queued lines on interpreter exit"""
+    for handler in list(logging.getLogger(LOGGER_NAME).handlers):
+        handler.close()
+
+
+configure_logging()
+atexit.register(_shutdown)
@@ -0,0 +1,231 @@
+"""
+Indexed, cached OpenAPI spec for ScoreBuddy API load tests and tools
+
+``scorebuddy_open_api.json`` is parsed once per process by ``load_spec()`` into an
+``OpenApiSpec`` that answers the questions tests and analysis scripts ask with dictionary
+lookups instead of scans over the whole document:
+
+- operations by ``operationId``, by path and method, by resource (first path segment),
+  by HTTP method and by parameter name (``group_id`` -> every operation that takes it)
+- component schemas and parameters by name
+- ``search(term)`` - paths, schemas, parameters and operation texts (summary, description,
+  operationId) containing a term; precomputed for every resource and tag, memoized for others
+- ``resolve(ref)`` - ``$ref`` targets, all resolved and memoized while indexing
+
+The indexed form is pickled to SPEC_CACHE_DIR under the SHA-1 of the spec file, so later
+processes load it without parsing JSON or rebuilding indexes; editing the spec changes the
+key and the cache is rebuilt on the next load. The cache is a local, trusted file - delete
+the directory or set SPEC_CACHE_ENABLED=false to bypass it.
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+from collections import defaultdict, namedtuple
+from config.settings import settings
+from tests.base.log import get_logger
+
+log = get_logger('openapi_spec')
+
+# OpenAPI spec shipped at the repository root
+OPENAPI_SPEC_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'scorebuddy_open_api.json'
+)
+
+# Bump when OpenApiSpec's indexes change, so older cache files are rebuilt
+SPEC_CACHE_SCHEMA = 1
+
+_MAGIC = b'SBSP'
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+# Operation fields searched by search()
+TEXT_FIELDS = ('summary', 'description', 'operationId')
+
+# One operation of the spec; ``details`` is the raw operation object
+Operation = namedtuple('Operation', 'method path operation_id resource details')
+
+# search() result: paths, schema names, parameter names and (operation, field) text hits
+SpecMatches = namedtuple('SpecMatches', 'paths schemas parameters mentions')
+
+
+def _resource(path):
+    return path.lstrip('/').split('/', 1)[0]
+
+
+class OpenApiSpec:
+    """An OpenAPI document with its lookup indexes"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.paths = spec.get('paths', {})
+        components = spec.get('components', {})
+        self.schemas = components.get('schemas', {})
+        self.parameters = components.get('parameters', {})
+        self.tags = tuple(tag['name'] for tag in spec.get('tags', []) if 'name' in tag)
+        self._refs = {}
+        self._collect_refs(spec)
+
+        self.operations = []
+        self.by_operation_id = {}
+        self.by_path = {}
+        self.by_resource = defaultdict(list)
+        self.by_method = defaultdict(list)
+        self.by_parameter = defaultdict(list)
+        for path, item in self.paths.items():
+            methods = self.by_path[path] = {}
+            shared_parameters = item.get('parameters', [])
+            for method, details in item.items():
+                if method not in HTTP_METHODS or not isinstance(details, dict):
+                    continue
+                operation = Operation(method.upper(), path, details.get('operationId'), _resource(path), details)
+                self.operations.append(operation)
+                methods[operation.method] = operation
+                self.by_resource[operation.resource].append(operation)
+                self.by_method[operation.method].append(operation)
+                if operation.operation_id:
+                    self.by_operation_id[operation.operation_id] = operation
+                for parameter in shared_parameters + details.get('parameters', []):
+                    name = self.deref(parameter).get('name')
+                    if name:
+                        self.by_parameter[name].append(operation)
+        self.by_resource = dict(self.by_resource)
+        self.by_method = dict(self.by_method)
+        self.by_parameter = dict(self.by_parameter)
+
+        self._matches = {}
+        for term in set(self.by_resource) | set(self.tags):
+            self.search(term)
+
+    # $ref resolution
+
+    def resolve(self, ref):
+        """Return the object a local ``$ref`` (``#/components/schemas/groups``) points to"""
+        target = self._refs.get(ref)
+        if target is None:
+            target = self.spec
+            for part in ref.lstrip('#/').split('/'):
+                target = target[part.replace('~1', '/').replace('~0', '~')]
+            self._refs[ref] = target
+        return target
+
+    def deref(self, obj):
+        """Follow ``$ref`` until a concrete object (cycles stop at the repeated reference)"""
+        seen = set()
+        while isinstance(obj, dict) and '$ref' in obj and obj['$ref'] not in seen:
+            seen.add(obj['$ref'])
+            obj = self.resolve(obj['$ref'])
+        return obj
+
+    def _collect_refs(self, node):
+        # Resolve every reference up front, so the cached form carries them all
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                try:
+                    self.resolve(ref)
+                except (KeyError, TypeError):
+                    log.warning("Unresolvable $ref in OpenAPI spec: %s", ref)
+            for value in node.values():
+                self._collect_refs(value)
+        elif isinstance(node, list):
+            for value in node:
+                self._collect_refs(value)
+
+    # Queries
+
+    def operation(self, method, path):
+        """Return the Operation for a METHOD and path template, or None"""
+        return self.by_path.get(path, {}).get(method.upper())
+
+    def resources(self):
+        """Return the resources (first path segments), sorted"""
+        return sorted(self.by_resource)
+
+    def search(self, term):
+        """Return the SpecMatches whose names or texts contain ``term`` (case-insensitive)"""
+        term = term.lower()
+        matches = self._matches.get(term)
+        if matches is None:
+            mentions = []
+            for operation in self.operations:
+                for field in TEXT_FIELDS:
+                    value = operation.details.get(field)
+                    if isinstance(value, str) and term in value.lower():
+                        mentions.append((operation, field))
+            matches = self._matches[term] = SpecMatches(
+                tuple(path for path in self.paths if term in path.lower()),
+                tuple(name for name in self.schemas if term in name.lower()),
+                tuple(name for name in self.parameters if term in name.lower()),
+                tuple(mentions),
+            )
+        return matches
+
+
+def _cache_path(digest, cache_dir=None):
+    return os.path.join(cache_dir or settings.SPEC_CACHE_DIR, f"{digest[:16]}.spec")
+
+
+def _load_cache(path, digest):
+    try:
+        with open(path, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                return None
+            schema, cached_digest, spec = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Ignoring unreadable OpenAPI spec cache %s: %s", path, e)
+        return None
+    if schema != SPEC_CACHE_SCHEMA or cached_digest != digest:
+        return None
+    return spec
+
+
+def _save_cache(path, digest, spec):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_MAGIC)
+            pickle.dump((SPEC_CACHE_SCHEMA, digest, spec), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning("Could not write OpenAPI spec cache %s: %s", path, e)
+
+
+_loaded = {}  # (absolute spec path, mtime in ns, size) -> OpenApiSpec
+
+
+def load_spec(spec_file=OPENAPI_SPEC_FILE, cache_dir=None):
+    """Return the indexed OpenApiSpec for a JSON spec file (once per process and file version)
+
+    Repeated calls cost one stat(); the file is only read and hashed when it is new or changed.
+    Raises OSError if the file cannot be read and ValueError if it is not valid JSON.
+    """
+    started = time.time()
+    path = os.path.abspath(spec_file)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    spec = _loaded.get(key)
+    if spec is not None:
+        return spec
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+
+    cache_path = _cache_path(digest, cache_dir) if settings.SPEC_CACHE_ENABLED else None
+    spec = _load_cache(cache_path, digest) if cache_path else None
+    if spec is None:
+        spec = OpenApiSpec(json.loads(data))
+        if cache_path:
+            _save_cache(cache_path, digest, spec)
+        log.info("Indexed OpenAPI spec %s (%s operations) in %.1fms", spec_file, len(spec.operations),
+                 (time.time() - started) * 1000)
+    else:
+        log.info("Loaded OpenAPI spec %s from cache %s in %.1fms", spec_file, cache_path, (time.time() - started) * 1000)
+    _loaded[key] = spec
+    return spec
@@ -0,0 +1,107 @@
+"""
+Pre-serialized request body pools for ScoreBuddy API load tests
+
+Generating a body (payloads.py) and serializing it with ``json.dumps`` on every request shows up
+in worker CPU profiles at high request rates. With PAYLOAD_POOL_SIZE > 0, each operation gets a
+process-wide pool of bodies generated and serialized ahead of time:
+
+- Fields the caller sets per request (unique email, external_id, chosen IDs...) are left as slots
+  in the serialized bytes; taking a body only JSON-encodes those values and joins the pieces
+- A background greenlet refills the pool in small batches once it falls below half full; when it
+  runs dry, bodies are built inline (and a warning suggests a larger pool)
+- Bodies are sent as-is with ``data=`` and a JSON content type (see ``body_kwargs``)
+
+A pool is keyed by operation, ``fields`` and the set of overridden fields, and draws IDs through
+the ID source of the user that created it.
+"""
+import json
+import re
+from collections import deque
+import gevent
+from config.settings import settings
+from tests.base.log import get_logger
+from tests.base.payloads import payload_factory
+
+log = get_logger('payload_pool')
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Bodies generated per refill batch before yielding to other greenlets
+REFILL_BATCH = 50
+
+_SLOT = '@@slot:%s@@'
+_SLOT_PATTERN = re.compile(rb'"@@slot:(\w+)@@"')
+_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def body_kwargs(body):
+    """Request keyword arguments for a body: pooled bytes go as ``data=``, dicts as ``json=``"""
+    if isinstance(body, bytes):
+        return {'data': body, 'headers': JSON_HEADERS}
+    return {'json': body}
+
+
+class PayloadPool:
+    """Serialized bodies of one operation with slots for per-request fields"""
+
+    def __init__(self, operation_id, fields, slots, ids, size):
+        self.operation_id = operation_id
+        self.fields = fields
+        self.slots = slots
+        self.ids = ids
+        self.size = size
+        self.misses = 0
+        self._primed = False  # Filled up once; misses before that are just the warm-up
+        self._templates = deque()
+        self._refiller = None
+        self._refill_async()
+
+    def _template(self):
+        """Generate and serialize one body: (literal pieces, slot names between them)"""
+        body = payload_factory.build(self.operation_id, self.ids, self.fields,
+                                     **{slot: _SLOT % slot for slot in self.slots})
+        pieces = _SLOT_PATTERN.split(_dumps(body).encode('utf-8'))
+        return tuple(pieces[0::2]), tuple(name.decode('ascii') for name in pieces[1::2])
+
+    def take(self, values):
+        """Return a ready-to-send body with the slots set from ``values``"""
+        if self._templates:
+            literals, names = self._templates.popleft()
+        else:
+            if self._primed and not self.misses:
+                log.warning("Payload pool for %s ran dry - consider a larger PAYLOAD_POOL_SIZE (now %s)",
+                            self.operation_id, self.size)
+            if self._primed:
+                self.misses += 1
+            literals, names = self._template()
+        if len(self._templates) < self.size // 2:
+            self._refill_async()
+
+        parts = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            parts.append(_dumps(values[name]).encode('utf-8'))
+            parts.append(literal)
+        return b''.join(parts)
+
+    def _refill_async(self):
+        if self._refiller is None or self._refiller.dead:
+            self._refiller = gevent.spawn(self._refill)
+
+    def _refill(self):
+        while len(self._templates) < self.size:
+            for _ in range(min(REFILL_BATCH, self.size - len(self._templates))):
+                self._templates.append(self._template())
+            gevent.sleep(0)
+        self._primed = True
+
+
+_pools = {}  # (operationId, fields, slots) -> PayloadPool
+
+
+def get_pool(operation_id, fields, slots, ids):
+    """Return the process-wide pool for an operation and set of per-request fields"""
+    key = (operation_id, tuple(fields) if fields is not None else None, tuple(sorted(slots)))
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = PayloadPool(operation_id, key[1], key[2], ids, settings.PAYLOAD_POOL_SIZE)
+    return pool
@@ -0,0 +1,260 @@
+"""
+Request bodies generated from the OpenAPI spec for ScoreBuddy API load tests
+
+Every JSON request body schema in ``scorebuddy_open_api.json`` is compiled once per process
+(on first use) into a factory per operation: ``$ref``/``allOf`` are resolved and each property
+becomes a small closure, so building a body is a handful of function calls - no schema walking
+per request. Values follow the schema:
+
+- ``enum`` - a random member; ``boolean`` - random
+- ``integer``/``number`` - random within ``minimum``/``maximum`` (around the example otherwise)
+- ``string`` - by ``format`` (email - unique, see unique_ids.py; date, date-time, time, url,
+  hexadecimal, html); patterned strings use the spec's example; other strings the example (or
+  field name) plus a random suffix, cut to ``maxLength``
+- ``array`` - ``minItems``..``maxItems`` items (1-3 when unbounded); ``object`` - all properties
+- FIXED_VALUES fields (``deleted``) - always the fixed value
+- ID fields (BODY_ID_FIELDS) - existing IDs from the caller's ID source (the ID registry in
+  BaseResourceTest.build_payload), falling back to the spec's example
+
+Nullable values are never generated as null, so bodies are valid rather than merely well-formed.
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from tests.base.log import get_logger
+from tests.base.openapi_spec import OPENAPI_SPEC_FILE, load_spec
+from tests.base.unique_ids import unique_ids
+
+log = get_logger('payloads')
+
+# Request body field -> ID registry resource (single IDs or lists of IDs)
+BODY_ID_FIELDS = {
+    'staff_id': 'staff',
+    'supervisor_id': 'staff',
+    'user_id': 'users',
+    'team_id': 'teams',
+    'team_ids': 'teams',
+    'group_id': 'groups',
+    'group_ids': 'groups',
+    'scorecard_id': 'scorecards',
+}
+
+# Fields generated with a fixed value instead of a random one (a random ``deleted: true``
+# would soft-delete what the test just created)
+FIXED_VALUES = {
+    'deleted': False,
+}
+
+BODY_METHODS = ('post', 'put', 'patch')
+
+# Default array length when the schema does not bound it
+DEFAULT_MIN_ITEMS = 1
+DEFAULT_MAX_ITEMS = 3
+
+
+def _suffix():
+    return '%08x' % random.getrandbits(32)
+
+
+def _clip(value, schema):
+    max_length = schema.get('maxLength')
+    return value[:max_length] if max_length else value
+
+
+def _email(ids):
+    return unique_ids.email('loadtest')
+
+
+def _date_time(ids):
+    moment = datetime.now(timezone.utc) - timedelta(seconds=random.randint(0, 30 * 86400))
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _date(ids):
+    return (datetime.now(timezone.utc) - timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d')
+
+
+def _time(ids):
+    return f"{random.randint(0, 23):02d}:{random.randint(0, 59):02d}"
+
+
+def _url(ids):
+    return f"https://example.com/loadtest/{_suffix()}"
+
+
+class PayloadFactory:
+    """Per-operation request body factories compiled from an OpenAPI spec"""
+
+    def __init__(self, spec_file=OPENAPI_SPEC_FILE):
+        self.spec_file = spec_file
+        self._spec = None
+        self._operations = None  # operationId -> (method, path, body schema)
+        self._factories = {}     # (operationId, fields) -> compiled factory
+
+    def _load(self):
+        if self._operations is not None:
+            return
+        started = time.time()
+        self._spec = load_spec(self.spec_file)
+        self._operations = {}
+        for method in BODY_METHODS:
+            for operation in self._spec.by_method.get(method.upper(), ()):
+                if not operation.operation_id:
+                    continue
+                request_body = self._spec.deref(operation.details.get('requestBody', {}))
+                schema = request_body.get('content', {}).get('application/json', {}).get('schema')
+                if schema is not None:
+                    self._operations[operation.operation_id] = (operation.method, operation.path, schema)
+        for operation_id in self._operations:
+            self.factory(operation_id)
+        log.info("Compiled %s request body factories in %.1fms", len(self._operations),
+                 (time.time() - started) * 1000)
+
+    def operations(self):
+        """Return {operationId: (METHOD, path)} for every operation with a JSON request body"""
+        self._load()
+        return {operation_id: entry[:2] for operation_id, entry in self._operations.items()}
+
+    def factory(self, operation_id, fields=None):
+        """Return the compiled ``factory(ids=None) -> dict`` for an operation
+
+        ``fields`` limits the body to those properties (compiled separately, once). ``ids`` is
+        ``ids(resource, count) -> [id, ...]`` for ID fields.
+        """
+        self._load()
+        key = (operation_id, tuple(fields) if fields is not None else None)
+        compiled = self._factories.get(key)
+        if compiled is None:
+            try:
+                schema = self._operations[operation_id][2]
+            except KeyError:
+                raise ValueError(f"No JSON request body for operation {operation_id!r} in {self.spec_file}") from None
+            schema, seen = self._resolve(schema)
+            compiled = self._factories[key] = self._compile_object(schema, fields, seen)
+        return compiled
+
+    def build(self, operation_id, ids=None, fields=None, **overrides):
+        """Return a new request body for an operation; ``overrides`` replace generated fields"""
+        body = self.factory(operation_id, fields)(ids)
+        body.update(overrides)
+        return body
+
+    # Compilation
+
+    def _resolve(self, schema, seen=()):
+        """Return the schema with ``$ref`` followed and ``allOf`` members merged, and the ref chain
+
+        ``seen`` holds the refs followed on the way down to this schema; a ref repeating one of
+        them resolves to an empty object, so self-referencing schemas end.
+        """
+        ref = schema.get('$ref')
+        if ref:
+            if ref in seen:
+                return {'type': 'object', 'properties': {}}, seen
+            return self._resolve(self._spec.resolve(ref), seen + (ref,))
+        if 'allOf' in schema:
+            merged = {key: value for key, value in schema.items() if key != 'allOf'}
+            properties = dict(merged.get('properties', {}))
+            chain = seen
+            for member in schema['allOf']:
+                member, member_seen = self._resolve(member, seen)
+                chain += tuple(ref for ref in member_seen if ref not in chain)
+                properties.update(member.get('properties', {}))
+                for key, value in member.items():
+                    merged.setdefault(key, value)
+            merged['properties'] = properties
+            return merged, chain
+        for key in ('oneOf', 'anyOf'):
+            if schema.get(key):
+                return self._resolve(schema[key][0], seen)
+        return schema, seen
+
+    def _compile(self, schema, name, seen=()):
+        if name in FIXED_VALUES:
+            value = FIXED_VALUES[name]
+            return lambda ids: value
+        schema, seen = self._resolve(schema, seen)
+        if 'enum' in schema:
+            values = tuple(schema['enum'])
+            return lambda ids: random.choice(values)
+
+        schema_type = schema.get('type') or ('object' if 'properties' in schema else None)
+        resource = BODY_ID_FIELDS.get(name)
+        if schema_type == 'object':
+            return self._compile_object(schema, seen=seen)
+        if schema_type == 'array':
+            return self._compile_array(schema, name, resource, seen)
+        if schema_type == 'boolean':
+            return lambda ids: random.random() < 0.5
+        if schema_type == 'integer':
+            if resource:
+                example = schema.get('example', 1)
+
+                def make_id(ids):
+                    chosen = ids(resource, 1) if ids else None
+                    return chosen[0] if chosen else example
+                return make_id
+            low, high = self._bounds(schema)
+            return lambda ids: random.randint(low, high)
+        if schema_type == 'number':
+            low, high = self._bounds(schema)
+            return lambda ids: round(random.uniform(low, high), 2)
+        if schema_type == 'string':
+            return self._compile_string(schema, name)
+        example = schema.get('example')
+        return lambda ids: example
+
+    def _compile_object(self, schema, fields=None, seen=()):
+        properties = schema.get('properties', {})
+        names = [name for name in properties if fields is None or name in fields]
+        compiled = tuple((name, self._compile(properties[name], name, seen)) for name in names)
+        return lambda ids=None: {name: make(ids) for name, make in compiled}
+
+    def _compile_array(self, schema, name, resource, seen=()):
+        low = schema.get('minItems', DEFAULT_MIN_ITEMS)
+        high = max(schema.get('maxItems', max(low, DEFAULT_MAX_ITEMS)), low)
+        items, seen = self._resolve(schema.get('items', {}), seen)
+        if resource:
+            example = items.get('example', 1)
+
+            def make_ids(ids):
+                count = random.randint(max(low, 1), high)
+                return (ids(resource, count) if ids else None) or [example]
+            return make_ids
+        make_item = self._compile(items, name, seen)
+        return lambda ids: [make_item(ids) for _ in range(random.randint(low, high))]
+
+    def _compile_string(self, schema, name):
+        string_format = schema.get('format')
+        example = schema.get('example')
+        if string_format == 'email':
+            return _email
+        if string_format == 'date-time':
+            return _date_time
+        if string_format == 'date':
+            return _date
+        if string_format == 'time':
+            return _time
+        if string_format == 'url':
+            return _url
+        if string_format == 'hexadecimal':
+            length = len(example) if example else 24
+            return lambda ids: '%0*x' % (length, random.getrandbits(4 * length))
+        if schema.get('pattern') or string_format in ('binary', 'filename'):
+            # Patterned strings (IDs, slugs, passwords) keep the spec's own valid example
+            return lambda ids: example
+        text = str(example) if example is not None else name.replace('_', ' ').capitalize()
+        if string_format == 'html':
+            return lambda ids: f"<p>{text} {_suffix()}</p>"
+        return lambda ids: _clip(f"{text} {_suffix()}", schema)
+
+    @staticmethod
+    def _bounds(schema):
+        low = schema.get('minimum', 0)
+        example = schema.get('example')
+        default_high = max(low, example * 2 if isinstance(example, (int, float)) else 0, low + 100)
+        high = schema.get('maximum', default_high)
+        return low, max(low, high)
+
+
+payload_factory = PayloadFactory()
@@ -0,0 +1,161 @@
+"""
+Traffic replay for ScoreBuddy API load tests
+
+Reads a JSONL request log (REPLAY_FILE), one request per line::
+
+    {"timestamp": 0.0, "method": "GET", "path": "/staff/8123", "query": {"limit": 25}}
+    {"timestamp": 0.35, "method": "PUT", "path": "/teams", "body": {"name": "...", "group_ids": [912]}}
+
+``timestamp`` is in seconds (relative to the start of the log, or absolute - only differences
+matter); ``query`` may be a dict or a query string, ``body`` any JSON value.
+
+The log is streamed line by line (never loaded whole) through a generator, and each
+worker replays every N-th line (N = the connected worker count broadcast by the master, see
+run_phase.py), so workers share one log without further coordination. Requests are due at their original offsets divided by REPLAY_SPEED
+(2 = twice as fast). Production IDs in paths and in common body fields are mapped onto IDs
+that exist on the target host (ID registry), consistently: the same production ID always
+becomes the same target ID.
+"""
+import json
+import time
+import zlib
+from config.settings import settings
+from tests.base.endpoint_names import endpoint_matcher
+from tests.base.id_registry import id_registry
+from tests.base.log import get_logger
+from tests.base.payloads import BODY_ID_FIELDS
+from tests.base.run_phase import run_clock
+
+log = get_logger('replay')
+
+# OpenAPI path parameter -> ID registry resource
+PATH_PARAM_RESOURCES = {
+    'score_id': 'scores',
+    'staff_id': 'staff',
+    'user_id': 'users',
+    'team_id': 'teams',
+    'group_id': 'groups',
+    'integration_id': 'integrations',
+    'scorecard_id': 'scorecards',
+    'category_id': 'scorecard_categories',
+}
+
+
+def read_replay_log(path, shard_index=0, shard_count=1):
+    """Yield (timestamp, entry) for this shard's lines of a JSONL request log, skipping bad lines"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f):
+            if line_number % shard_count != shard_index or not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                timestamp = float(entry.get('timestamp', 0))
+                if not entry.get('method') or not entry.get('path'):
+                    raise ValueError("method and path are required")
+            except (ValueError, TypeError, AttributeError) as e:
+                log.warning("Skipping replay log line %s: %s", line_number + 1, e)
+                continue
+            yield timestamp, entry
+
+
+class ReplayStream:
+    """A process's schedule over the replay log: hands out (due time, entry) in log order"""
+
+    def __init__(self, path, speed=1.0, loop=False, shard_index=0, shard_count=1):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._entries = read_replay_log(path, shard_index, shard_count)
+        self._started_at = None   # Wall clock time of the first entry
+        self._first_timestamp = None
+        self._last_offset = 0.0
+        self.finished = False
+
+    def next(self):
+        """Return (due time, entry) for the next request, or None when the log is exhausted"""
+        while True:
+            item = next(self._entries, None)
+            if item is not None:
+                break
+            # Only start over after a pass that yielded something, else an empty shard spins
+            if not self.loop or self._first_timestamp is None:
+                self.finished = True
+                return None
+            # Start over, continuing the clock after the last entry
+            self._entries = read_replay_log(self.path, self.shard_index, self.shard_count)
+            self._started_at += self._last_offset
+            self._first_timestamp = None
+        timestamp, entry = item
+
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+            if self._started_at is None:
+                self._started_at = time.time()
+        self._last_offset = max((timestamp - self._first_timestamp) / self.speed, 0.0)
+        return self._started_at + self._last_offset, entry
+
+
+class IdRemapper:
+    """Maps production IDs onto existing IDs of the target host, stably"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def map_id(self, resource, value):
+        ids = id_registry.get_ids(self.client, resource)
+        if not ids:
+            return value
+        return ids[zlib.crc32(str(value).encode('utf-8')) % len(ids)]
+
+    def path(self, path):
+        template = endpoint_matcher.match(path)
+        if not template or '{' not in template:
+            return path
+        segments = path.split('/')
+        template_segments = template.split('/')
+        if len(segments) != len(template_segments):
+            return path
+        for i, template_segment in enumerate(template_segments):
+            resource = PATH_PARAM_RESOURCES.get(template_segment.strip('{}'))
+            if resource and segments[i].isdigit():
+                segments[i] = str(self.map_id(resource, segments[i]))
+        return '/'.join(segments)
+
+    def body(self, body):
+        if not isinstance(body, dict):
+            return body
+        mapped = dict(body)
+        for field, resource in BODY_ID_FIELDS.items():
+            value = mapped.get(field)
+            if isinstance(value, int) and not isinstance(value, bool):
+                mapped[field] = self.map_id(resource, value)
+            elif isinstance(value, list):
+                mapped[field] = [self.map_id(resource, v) if isinstance(v, int) else v for v in value]
+        return mapped
+
+
+_streams = {}  # path -> ReplayStream for the current run
+
+
+def replay_stream():
+    """Return this process's ReplayStream (sharded by worker index), creating it on first use
+
+    The shard is fixed when the stream is created, from the worker count and index the master
+    sent before the users were spawned.
+    """
+    stream = _streams.get(settings.REPLAY_FILE)
+    if stream is None:
+        shard_count = max(run_clock.worker_count, 1)
+        shard_index = run_clock.worker_index % shard_count
+        stream = _streams[settings.REPLAY_FILE] = ReplayStream(
+            settings.REPLAY_FILE, settings.REPLAY_SPEED, settings.REPLAY_LOOP, shard_index, shard_count)
+        log.info("Replaying %s (shard %s/%s) at %sx", settings.REPLAY_FILE, shard_index + 1, shard_count,
+                 settings.REPLAY_SPEED)
+    return stream
+
+
+def reset_streams():
+    """Forget replay progress so the next run starts from the top of the log"""
+    _streams.clear()
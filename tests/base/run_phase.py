@@ -0,0 +1,164 @@
+"""
+Run phases for ScoreBuddy API load tests
+
+One clock per process tracks where the run is, so users no longer time the test themselves:
+
+- ``warmup`` - the first RUN_WARMUP seconds (default 0: none); when it ends the stats are
+  reset as with the web UI's Reset Stats, so results cover steady state only
+- ``steady`` - normal load
+- ``drain`` - the last RUN_DRAIN seconds of ``--run-time`` (default 5): tasks stop starting
+  new requests so in-flight work finishes before Locust stops the users
+- ``cleanup`` - from test_stopping on, while queued deletes of created resources finish
+  (cleanup.py)
+
+Transitions are driven by Locust events. The master (or local runner) plans them from
+``--run-time`` at test_start and broadcasts each one to the workers, which are not told the
+run time - so the whole swarm drains at the same moment, however late its users were spawned.
+Tasks check ``run_clock.draining``, a plain attribute. Without ``--run-time`` (e.g. with a
+load shape) there is no drain phase: the run goes from steady to cleanup when it stops.
+
+The master also tells each worker how many workers are connected and its place among them
+(``run_clock.worker_count`` / ``worker_index``) at test_start and after each rebalance, so per-worker shares (arrival.py, replay.py) follow the real swarm rather
+than ``--expect-workers``, which only gates the start.
+"""
+import logging
+import time
+import gevent
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+from config.settings import settings
+
+# Phase changes are reported next to Locust's own status output
+console = logging.getLogger('locust.stats_logger')
+
+IDLE = 'idle'
+WARMUP = 'warmup'
+STEADY = 'steady'
+DRAIN = 'drain'
+CLEANUP = 'cleanup'
+
+PHASE_MESSAGE = 'run_phase'
+WORKERS_MESSAGE = 'run_workers'
+
+
+class RunClock:
+    """The current run phase of this process"""
+
+    def __init__(self):
+        self.phase = IDLE
+        self.draining = False   # True in drain and cleanup: don't start new requests
+        self.started_at = None  # Wall clock time of test_start (on the master)
+        self.worker_count = 1   # Processes sharing the load (connected workers; 1 on a local runner)
+        self.worker_index = 0   # This worker's place among them, 0 .. worker_count - 1
+        self._timers = []
+
+    def elapsed(self):
+        """Seconds since the run started (0 before it has)"""
+        return time.time() - self.started_at if self.started_at else 0.0
+
+    def set_phase(self, phase, started_at=None):
+        if started_at is not None:
+            self.started_at = started_at
+        if phase == self.phase:
+            return
+        console.info("Run phase %s -> %s (%.1fs elapsed)", self.phase, phase, self.elapsed())
+        self.phase = phase
+        self.draining = phase in (DRAIN, CLEANUP)
+
+    def start(self, environment):
+        """Enter the first phase and schedule the rest from --run-time (master or local runner)"""
+        self.cancel()
+        self.started_at = time.time()
+        run_time = getattr(environment.parsed_options, 'run_time', None)
+        warmup = max(settings.RUN_WARMUP, 0)
+        drain_at = max(run_time - settings.RUN_DRAIN, 0) if run_time else None
+
+        if drain_at == 0:
+            _advance(environment, DRAIN)
+            return
+        if warmup and (drain_at is None or warmup < drain_at):
+            _advance(environment, WARMUP)
+            self._timers.append(gevent.spawn_later(warmup, _end_warmup, environment))
+        else:
+            _advance(environment, STEADY)
+        if drain_at is not None:
+            self._timers.append(gevent.spawn_later(drain_at, _advance, environment, DRAIN))
+
+    def cancel(self):
+        """Drop pending transitions"""
+        gevent.killall(self._timers, block=False)
+        self._timers = []
+
+
+run_clock = RunClock()
+
+
+def _advance(environment, phase):
+    """Enter a phase here and, on the master, on every worker"""
+    run_clock.set_phase(phase)
+    if isinstance(environment.runner, MasterRunner):
+        environment.runner.send_message(PHASE_MESSAGE, {'phase': phase, 'started_at': run_clock.started_at})
+
+
+def _end_warmup(environment):
+    # Same as the web UI's Reset Stats; workers report deltas, so resetting here is enough
+    environment.events.reset_stats.fire()
+    environment.runner.stats.reset_all()
+    environment.runner.exceptions = {}
+    console.info("Warm-up finished after %ss - stats reset", settings.RUN_WARMUP)
+    _advance(environment, STEADY)
+
+
+def _broadcast_workers(environment):
+    """Send every connected worker the worker count and its index (master only)"""
+    runner = environment.runner
+    client_ids = sorted(
+        node.id for node in runner.clients.ready + runner.clients.spawning + runner.clients.running)
+    if not client_ids:
+        return
+    if len(client_ids) != run_clock.worker_count:
+        expected = getattr(environment.parsed_options, 'expect_workers', 1) or 1
+        if len(client_ids) != expected:
+            console.warning("%s workers connected, --expect-workers is %s - per-worker shares use %s",
+                            len(client_ids), expected, len(client_ids))
+        run_clock.worker_count = len(client_ids)
+    for index, client_id in enumerate(client_ids):
+        runner.send_message(WORKERS_MESSAGE, {'index': index, 'count': len(client_ids)}, client_id=client_id)
+
+
+def _on_phase_message(environment, msg, **kwargs):
+    run_clock.set_phase(msg.data['phase'], msg.data.get('started_at'))
+
+
+def _on_workers_message(environment, msg, **kwargs):
+    run_clock.worker_count = max(msg.data['count'], 1)
+    run_clock.worker_index = msg.data['index']
+
+
+@events.init.add_listener
+def _on_init(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message(PHASE_MESSAGE, _on_phase_message)
+        environment.runner.register_message(WORKERS_MESSAGE, _on_workers_message)
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    # Workers follow the master's broadcasts, which arrive before their users are spawned
+    if isinstance(environment.runner, MasterRunner):
+        _broadcast_workers(environment)
+    if not isinstance(environment.runner, WorkerRunner):
+        run_clock.start(environment)
+
+
+@events.spawning_complete.add_listener
+def _on_spawning_complete(environment, **kwargs):
+    # Again after every rebalance, e.g. when a worker joins, quits or goes missing mid-run
+    if isinstance(environment.runner, MasterRunner):
+        _broadcast_workers(environment)
+
+
+@events.test_stopping.add_listener
+def _on_test_stopping(environment, **kwargs):
+    run_clock.cancel()
+    run_clock.set_phase(CLEANUP)
@@ -0,0 +1,156 @@
+"""
+Load shapes for ScoreBuddy API load tests
+
+Custom LoadTestShape classes, selectable by name with LOAD_SHAPE for any test file::
+
+    LOAD_SHAPE=step locust -f tests/staff/staff_get.py,shape.py --headless
+    LOAD_SHAPE=ramp_to_break locust -f tests/scores/scores_get.py,shape.py --headless --csv results/run
+
+``shape.py`` (repo root) exposes the selected class to Locust; a shape replaces
+``--users/--spawn-rate/--run-time``. Parameters come from the SHAPE_* settings:
+
+- ``step`` - SHAPE_STEPS steps of SHAPE_STEP_USERS more users, each held SHAPE_STEP_DURATION seconds
+- ``spike`` - SHAPE_BASE_USERS for SHAPE_DURATION seconds, jumping to SHAPE_PEAK_USERS at
+  SHAPE_SPIKE_AT for SHAPE_SPIKE_DURATION seconds
+- ``soak`` - a diurnal (cosine) cycle between SHAPE_BASE_USERS and SHAPE_PEAK_USERS with a
+  period of SHAPE_PERIOD seconds, for SHAPE_DURATION seconds
+- ``ramp_to_break`` - from SHAPE_BASE_USERS, add SHAPE_STEP_USERS every SHAPE_STEP_DURATION
+  seconds until the p95 response time exceeds SHAPE_MAX_P95 ms or the error rate of the step
+  exceeds SHAPE_MAX_ERROR_RATE (or SHAPE_PEAK_USERS is reached); the last healthy user count
+  is logged as the saturation point and the test stops
+"""
+import logging
+import math
+from locust import LoadTestShape
+from config.settings import settings
+from tests.base.log import get_logger
+
+log = get_logger('shapes')
+# Ramp progress is reported next to Locust's own status output
+console = logging.getLogger('locust.stats_logger')
+
+
+class StepLoadShape(LoadTestShape):
+    """Increase the user count in equal steps"""
+
+    step_users = settings.SHAPE_STEP_USERS
+    step_duration = settings.SHAPE_STEP_DURATION
+    steps = settings.SHAPE_STEPS
+    spawn_rate = settings.SHAPE_SPAWN_RATE
+
+    def tick(self):
+        step = int(self.get_run_time() // self.step_duration)
+        if step >= self.steps:
+            return None
+        return (step + 1) * self.step_users, self.spawn_rate
+
+
+class SpikeShape(LoadTestShape):
+    """Steady base load with one short spike"""
+
+    base_users = settings.SHAPE_BASE_USERS
+    peak_users = settings.SHAPE_PEAK_USERS
+    spike_at = settings.SHAPE_SPIKE_AT
+    spike_duration = settings.SHAPE_SPIKE_DURATION
+    duration = settings.SHAPE_DURATION
+    # Reach the spike within a couple of seconds, whatever its size
+    spike_spawn_rate = max(settings.SHAPE_SPAWN_RATE, settings.SHAPE_PEAK_USERS / 2.0)
+
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time >= self.duration:
+            return None
+        if self.spike_at <= run_time < self.spike_at + self.spike_duration:
+            return self.peak_users, self.spike_spawn_rate
+        return self.base_users, self.spike_spawn_rate
+
+
+class SoakShape(LoadTestShape):
+    """Long run following a daily traffic cycle: trough at the start, peak half a period later"""
+
+    base_users = settings.SHAPE_BASE_USERS
+    peak_users = settings.SHAPE_PEAK_USERS
+    period = settings.SHAPE_PERIOD
+    duration = settings.SHAPE_DURATION
+    spawn_rate = settings.SHAPE_SPAWN_RATE
+
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time >= self.duration:
+            return None
+        level = (1 - math.cos(2 * math.pi * run_time / self.period)) / 2
+        return round(self.base_users + (self.peak_users - self.base_users) * level), self.spawn_rate
+
+
+class RampToBreakShape(LoadTestShape):
+    """Add users step by step until latency or errors break the thresholds"""
+
+    base_users = settings.SHAPE_BASE_USERS
+    step_users = settings.SHAPE_STEP_USERS
+    step_duration = settings.SHAPE_STEP_DURATION
+    max_users = settings.SHAPE_PEAK_USERS
+    max_p95 = settings.SHAPE_MAX_P95
+    max_error_rate = settings.SHAPE_MAX_ERROR_RATE
+    spawn_rate = settings.SHAPE_SPAWN_RATE
+
+    def __init__(self):
+        super().__init__()
+        self._reset_ramp()
+
+    def reset_time(self):
+        super().reset_time()
+        self._reset_ramp()
+
+    def _reset_ramp(self):
+        self.users = self.base_users
+        self.step = 0
+        self.step_requests = 0
+        self.step_failures = 0
+        self.saturation_users = None
+
+    def tick(self):
+        step = int(self.get_run_time() // self.step_duration)
+        if step > self.step:
+            if self._step_broke():
+                return None
+            self.step = step
+            if self.users >= self.max_users:
+                log.warning("Reached SHAPE_PEAK_USERS=%s without breaking the thresholds", self.max_users)
+                return None
+            self.users = min(self.users + self.step_users, self.max_users)
+        return self.users, self.spawn_rate
+
+    def _step_broke(self):
+        """Check the step that just ended against the thresholds"""
+        total = self.runner.environment.stats.total
+        requests = total.num_requests - self.step_requests
+        failures = total.num_failures - self.step_failures
+        self.step_requests, self.step_failures = total.num_requests, total.num_failures
+        error_rate = failures / requests if requests else 0.0
+        # Locust's rolling window of recent response times (CURRENT_RESPONSE_TIME_PERCENTILE_WINDOW)
+        p95 = total.get_current_response_time_percentile(0.95) or 0
+        console.info("Ramp step at %s users: p95=%sms, errors=%.1f%% (%s requests)",
+                     self.users, p95, error_rate * 100, requests)
+        if p95 <= self.max_p95 and error_rate <= self.max_error_rate:
+            self.saturation_users = self.users
+            return False
+        console.info("Thresholds broken at %s users (SHAPE_MAX_P95=%sms, SHAPE_MAX_ERROR_RATE=%s) - "
+                     "saturation point: %s users", self.users, self.max_p95, self.max_error_rate,
+                     self.saturation_users if self.saturation_users is not None else f"fewer than {self.users}")
+        return True
+
+
+SHAPES = {
+    'step': StepLoadShape,
+    'spike': SpikeShape,
+    'soak': SoakShape,
+    'ramp_to_break': RampToBreakShape,
+}
+
+
+def get_shape(name):
+    """Return the LoadTestShape class registered under a name"""
+    try:
+        return SHAPES[name]
+    except KeyError:
+        raise ValueError(f"Unknown LOAD_SHAPE {name!r} - choose one of: {', '.join(SHAPES)}") from None
@@ -0,0 +1,75 @@
+"""
+Collision-free unique identifiers for entities created by ScoreBuddy API load tests
+
+Names, emails and external IDs of created users, staff, groups, teams and integrations must
+not collide, or the API answers 409 and the conflict shows up as a test error. Timestamps,
+``id(self)`` and random numbers do not guarantee that: ``id()`` values repeat between worker
+processes and two users can draw the same random number in the same millisecond.
+
+Identifiers are built snowflake-style instead, from three parts that are unique together::
+
+    <prefix>_<run>_<node>_<sequence>      e.g. TestGroup_mf3k2x1a_2_1f
+
+- ``run`` - the test start time in milliseconds (base 36), so runs never reuse identifiers
+  left behind by earlier ones
+- ``node`` - the worker index (0 for a local run), unique within the swarm
+- ``sequence`` - a per-process counter (base 36)
+
+Taking an identifier is a counter increment and a string format - no clock or random calls.
+The prefix is kept first so leftovers can still be found by prefix search.
+"""
+import itertools
+import time
+from locust import events
+from locust.runners import WorkerRunner
+
+EMAIL_DOMAIN = 'example.com'
+
+_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def _base36(number):
+    digits = []
+    while True:
+        number, digit = divmod(number, 36)
+        digits.append(_DIGITS[digit])
+        if not number:
+            return ''.join(reversed(digits))
+
+
+class UniqueIds:
+    """Hands out identifiers unique across processes, workers and runs"""
+
+    def __init__(self):
+        self.node = 0
+        self._run = _base36(int(time.time() * 1000))
+        self._sequence = itertools.count()
+
+    def start(self, node):
+        """Begin a new run on this process: new run part, counter back to 0"""
+        self.node = node
+        self._run = _base36(int(time.time() * 1000))
+        self._sequence = itertools.count()
+
+    def token(self, sep='_'):
+        """Return the unique part of an identifier: ``<run><sep><node><sep><sequence>``"""
+        return f"{self._run}{sep}{self.node}{sep}{_base36(next(self._sequence))}"
+
+    def name(self, prefix, sep='_'):
+        """Return a unique name such as ``TestTeam_mf3k2x1a_0_2s``"""
+        return f"{prefix}{sep}{self.token(sep)}"
+
+    def email(self, prefix):
+        """Return a unique email address such as ``teststaff_mf3k2x1a_0_2s@example.com``"""
+        return f"{prefix}_{self.token()}@{EMAIL_DOMAIN}"
+
+
+unique_ids = UniqueIds()
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    # Workers receive their index from the master before the first test_start
+    runner = environment.runner
+    node = max(getattr(runner, 'worker_index', 0), 0) if isinstance(runner, WorkerRunner) else 0
+    unique_ids.start(node)
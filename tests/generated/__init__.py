@@ -0,0 +1 @@
+# Generated full-API coverage tests (generate_locustfile.py)
@@ -0,0 +1,879 @@
+"""
+Full ScoreBuddy API coverage - GENERATED by generate_locustfile.py, do not edit
+
+Source: scorebuddy_open_api.json (sha1 55bbc0c356c31df2667236a8ce9965647179147f)
+
+    locust -f tests/generated/api_coverage.py --headless -u 50 -r 10 --run-time 10m
+    locust -f tests/generated/api_coverage.py --tags scorecards get
+
+One class per resource, one task per operation (tagged with its method and resource); class
+weights are the sums of their task weights. Path parameters, created targets and cleanup are
+handled by tests/base/coverage.py.
+
+Not covered:
+    POST /authorisation/token - authentication endpoint (covered by the token manager)
+    PATCH /provision/{user_id}/user - would modify a fixture (no POST /provision to create {user_id})
+    PATCH /provision/{user_id}/staff - would modify a fixture (no POST /provision to create {user_id})
+    DELETE /integrations/{integration_id}/cases/{case_id} - would modify a fixture (no POST /integrations/{integration_id}/cases to create {case_id})
+    POST /integrations/{integration_id}/files/{file_name} - multipart/form-data request body
+    PUT /integrations/{integration_id}/files/{file_name} - multipart/form-data request body
+    PATCH /integrations/{integration_id}/files/{file_name} - multipart/form-data request body
+    DELETE /integrations/{integration_id}/files/{file_name} - would modify a fixture (no POST /integrations/{integration_id}/files to create {file_name})
+"""
+from locust import task, tag
+from tests.base.coverage import CoverageTest
+
+
+class PingCoverage(CoverageTest):
+    """Operations on /ping"""
+    weight = 10
+
+    @task(10)
+    @tag('get', 'ping', 'coverage')
+    def ping(self):
+        """GET /ping - Checks if the server is alive and returns current rate limit statistics"""
+        self.call_operation('ping')
+
+
+class ScoresCoverage(CoverageTest):
+    """Operations on /scores"""
+    weight = 30
+
+    @task(10)
+    @tag('get', 'scores', 'coverage')
+    def get_scores(self):
+        """GET /scores - Request Scores"""
+        self.call_operation('getScores')
+
+    @task(10)
+    @tag('get', 'scores', 'coverage')
+    def get_score(self):
+        """GET /scores/{score_id} - Request a specific Score"""
+        self.call_operation('getScore')
+
+    @task(10)
+    @tag('get', 'scores', 'coverage')
+    def get_reviews(self):
+        """GET /scores/reviews - Results Reviews"""
+        self.call_operation('getReviews')
+
+
+class ExportCoverage(CoverageTest):
+    """Operations on /export"""
+    weight = 10
+
+    @task(10)
+    @tag('get', 'export', 'coverage')
+    def get_export(self):
+        """GET /export/questions - Request Data Export"""
+        self.call_operation('getExport')
+
+
+class StaffCoverage(CoverageTest):
+    """Operations on /staff"""
+    weight = 84
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_staff(self):
+        """GET /staff - Request members of Staff. Will return Employees __and__ Supervisors"""
+        self.call_operation('getStaff')
+
+    @task(2)
+    @tag('post', 'staff', 'coverage')
+    def insert_staff(self):
+        """POST /staff - Insert an member of Staff."""
+        self.call_operation('insertStaff')
+
+    @task(2)
+    @tag('put', 'staff', 'coverage')
+    def upsert_staff(self):
+        """PUT /staff - Insert or Update a member of Staff."""
+        self.call_operation('upsertStaff')
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_staff_member(self):
+        """GET /staff/{staff_id} - Request a specific member of Staff"""
+        self.call_operation('getStaffMember')
+
+    @task(2)
+    @tag('patch', 'staff', 'coverage')
+    def update_staff(self):
+        """PATCH /staff/{staff_id} - Update a specific member of Staff."""
+        self.call_operation('updateStaff')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def delete_staff(self):
+        """DELETE /staff/{staff_id} - Delete a specific member of Staff."""
+        self.call_operation('deleteStaff')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def hard_delete_staff(self):
+        """DELETE /staff/{staff_id}/hard - Hard delete a specific member of Staff."""
+        self.call_operation('hardDeleteStaff')
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_employees(self):
+        """GET /staff/employees - Request employees. Identical to /staff bar limited to Employees by default."""
+        self.call_operation('getEmployees')
+
+    @task(2)
+    @tag('post', 'staff', 'coverage')
+    def insert_employee(self):
+        """POST /staff/employees - Insert an Employee."""
+        self.call_operation('insertEmployee')
+
+    @task(2)
+    @tag('put', 'staff', 'coverage')
+    def upsert_employee(self):
+        """PUT /staff/employees - Insert or Update an Employee."""
+        self.call_operation('upsertEmployee')
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_employee(self):
+        """GET /staff/employees/{staff_id} - Request a specific Employee. Identical to /staff bar limited to Employees by default."""
+        self.call_operation('getEmployee')
+
+    @task(2)
+    @tag('patch', 'staff', 'coverage')
+    def update_employee(self):
+        """PATCH /staff/employees/{staff_id} - Update a specific Employee."""
+        self.call_operation('updateEmployee')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def delete_employee(self):
+        """DELETE /staff/employees/{staff_id} - Delete a specific Employee."""
+        self.call_operation('deleteEmployee')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def hard_delete_employee(self):
+        """DELETE /staff/employees/{staff_id}/hard - Hard delete a specific Employee."""
+        self.call_operation('hardDeleteEmployee')
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_supervisors(self):
+        """GET /staff/supervisors - Request Supervisors. Identical to /staff bar limited to Supervisors by default ."""
+        self.call_operation('getSupervisors')
+
+    @task(2)
+    @tag('post', 'staff', 'coverage')
+    def insert_supervisor(self):
+        """POST /staff/supervisors - Insert a Supervisor."""
+        self.call_operation('insertSupervisor')
+
+    @task(2)
+    @tag('put', 'staff', 'coverage')
+    def upsert_supervisor(self):
+        """PUT /staff/supervisors - Insert or Update a Supervisor."""
+        self.call_operation('upsertSupervisor')
+
+    @task(10)
+    @tag('get', 'staff', 'coverage')
+    def get_supervisor(self):
+        """GET /staff/supervisors/{staff_id} - Request a specific Supervisor. Identical to /staff bar limited to Supervisors by default."""
+        self.call_operation('getSupervisor')
+
+    @task(2)
+    @tag('patch', 'staff', 'coverage')
+    def update_supervisor(self):
+        """PATCH /staff/supervisors/{staff_id} - Update a specific Supervisor."""
+        self.call_operation('updateSupervisor')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def delete_supervisor(self):
+        """DELETE /staff/supervisors/{staff_id} - Delete a specific Supervisor."""
+        self.call_operation('deleteSupervisor')
+
+    @task(1)
+    @tag('delete', 'staff', 'coverage')
+    def hard_delete_supervisor(self):
+        """DELETE /staff/supervisors/{staff_id}/hard - Delete a specific Supervisor."""
+        self.call_operation('hardDeleteSupervisor')
+
+
+class GroupsCoverage(CoverageTest):
+    """Operations on /groups"""
+    weight = 27
+
+    @task(10)
+    @tag('get', 'groups', 'coverage')
+    def get_groups(self):
+        """GET /groups - Request Groups"""
+        self.call_operation('getGroups')
+
+    @task(2)
+    @tag('post', 'groups', 'coverage')
+    def insert_group(self):
+        """POST /groups - Insert a Group"""
+        self.call_operation('insertGroup')
+
+    @task(2)
+    @tag('put', 'groups', 'coverage')
+    def upsert_group(self):
+        """PUT /groups - Insert or Update a Group."""
+        self.call_operation('upsertGroup')
+
+    @task(10)
+    @tag('get', 'groups', 'coverage')
+    def get_group(self):
+        """GET /groups/{group_id} - Request a specific Group."""
+        self.call_operation('getGroup')
+
+    @task(2)
+    @tag('patch', 'groups', 'coverage')
+    def update_group(self):
+        """PATCH /groups/{group_id} - Update a specific Group."""
+        self.call_operation('updateGroup')
+
+    @task(1)
+    @tag('delete', 'groups', 'coverage')
+    def delete_group(self):
+        """DELETE /groups/{group_id} - Delete a specific Group."""
+        self.call_operation('deleteGroup')
+
+
+class TeamsCoverage(CoverageTest):
+    """Operations on /teams"""
+    weight = 27
+
+    @task(10)
+    @tag('get', 'teams', 'coverage')
+    def get_teams(self):
+        """GET /teams - Request Teams"""
+        self.call_operation('getTeams')
+
+    @task(2)
+    @tag('post', 'teams', 'coverage')
+    def insert_team(self):
+        """POST /teams - Insert a Team"""
+        self.call_operation('insertTeam')
+
+    @task(2)
+    @tag('put', 'teams', 'coverage')
+    def upsert_team(self):
+        """PUT /teams - Insert or Update a Team."""
+        self.call_operation('upsertTeam')
+
+    @task(10)
+    @tag('get', 'teams', 'coverage')
+    def get_team(self):
+        """GET /teams/{team_id} - Request a specific Team"""
+        self.call_operation('getTeam')
+
+    @task(2)
+    @tag('patch', 'teams', 'coverage')
+    def update_team(self):
+        """PATCH /teams/{team_id} - Update a specific Team."""
+        self.call_operation('updateTeam')
+
+    @task(1)
+    @tag('delete', 'teams', 'coverage')
+    def delete_team(self):
+        """DELETE /teams/{team_id} - Delete a specific Team."""
+        self.call_operation('deleteTeam')
+
+
+class ScorecardsCoverage(CoverageTest):
+    """Operations on /scorecards"""
+    weight = 260
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecards(self):
+        """GET /scorecards - Request Scorecards"""
+        self.call_operation('getScorecards')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard(self):
+        """GET /scorecards/{scorecard_id} - Request a specific Scorecard"""
+        self.call_operation('getScorecard')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_versions(self):
+        """GET /scorecards/{scorecard_id}/versions - Request all Versions, of a specific Scorecard"""
+        self.call_operation('getScorecardVersions')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_version(self):
+        """GET /scorecards/{scorecard_id}/versions/{version} - Request a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardVersion')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_version_causes(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/causes - Request Causes, for a specific Version of a specific Scorecard."""
+        self.call_operation('getScorecardVersionCauses')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_version_cause(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/causes/{cause_id} - Request a single Cause, for a specific Version of a specific Scorecard."""
+        self.call_operation('getScorecardVersionCause')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_questions(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions - Request Questions, for a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardQuestions')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_question(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions/{question_id} - Request a specific Question, for a specific Version, of a specific Scorecard, from Scorebuddy."""
+        self.call_operation('getScorecardQuestion')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_answers(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions/{question_id}/answers - Request Answers, for a specific Question, for a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardAnswers')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_answer(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions/{question_id}/answers/{answer_key} - Request a specific Answer, for a specific Question, for a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardAnswer')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_causes(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions/{question_id}/causes - Request Causes, for a specific Question, for a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardCauses')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_cause(self):
+        """GET /scorecards/{scorecard_id}/versions/{version}/questions/{question_id}/causes/{cause_id} - Request a specific Cause, for a specific Question, for a specific Version, of a specific Scorecard."""
+        self.call_operation('getScorecardCause')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_comments(self):
+        """GET /scorecards/{scorecard_id}/comments - Request Comments for a specific Scorecard."""
+        self.call_operation('getScorecardComments')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_comment(self):
+        """GET /scorecards/{scorecard_id}/comments/{comment_id} - Request a specific Comment for a specific Scorecard."""
+        self.call_operation('getScorecardComment')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_custom_objects(self):
+        """GET /scorecards/{scorecard_id}/custom_objects - Request Custom Objects for a specific Scorecard"""
+        self.call_operation('getScorecardCustomObjects')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_custom_object(self):
+        """GET /scorecards/{scorecard_id}/custom_objects/{object_id} - Request a specific Custom Objects for a specific Scorecard."""
+        self.call_operation('getScorecardCustomObject')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_data_tags(self):
+        """GET /scorecards/{scorecard_id}/custom_objects/{object_id}/data_tags - Request the Data Tags, for a specific Custom Object, for a specific Scorecard."""
+        self.call_operation('getScorecardDataTags')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_data_tag(self):
+        """GET /scorecards/{scorecard_id}/custom_objects/{object_id}/data_tags/{tag_id} - Request a specific Data Tag, for a specific Custom Object, for a specific Scorecard."""
+        self.call_operation('getScorecardDataTag')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_events(self):
+        """GET /scorecards/{scorecard_id}/events - Request Events"""
+        self.call_operation('getScorecardEvents')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_event(self):
+        """GET /scorecards/{scorecard_id}/events/{event_id} - Request a specific Event."""
+        self.call_operation('getScorecardEvent')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_sub_events(self):
+        """GET /scorecards/{scorecard_id}/events/{event_id}/sub_events - Request all Sub Events for a specific Event."""
+        self.call_operation('getScorecardSubEvents')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_sub_event(self):
+        """GET /scorecards/{scorecard_id}/events/{event_id}/sub_events/{sub_event_id} - Request a specific Sub Events for a specific Event."""
+        self.call_operation('getScorecardSubEvent')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_sections(self):
+        """GET /scorecards/{scorecard_id}/sections - Request Sections"""
+        self.call_operation('getScorecardSections')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_section(self):
+        """GET /scorecards/{scorecard_id}/sections/{section_id} - Request a specific Section."""
+        self.call_operation('getScorecardSection')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_categories(self):
+        """GET /scorecards/categories - Request Scorecard Categories"""
+        self.call_operation('getScorecardCategories')
+
+    @task(10)
+    @tag('get', 'scorecards', 'coverage')
+    def get_scorecard_category(self):
+        """GET /scorecards/categories/{category_id} - Request a specific Scorecard Category."""
+        self.call_operation('getScorecardCategory')
+
+
+class UsersCoverage(CoverageTest):
+    """Operations on /users"""
+    weight = 31
+
+    @task(10)
+    @tag('get', 'users', 'coverage')
+    def get_users(self):
+        """GET /users - Request Users. Will not return API Users. These can only be managed in Scorebuddy. Users that have been deleted in the Scorebuddy website will no longer be returned by the API."""
+        self.call_operation('getUsers')
+
+    @task(2)
+    @tag('post', 'users', 'coverage')
+    def insert_user(self):
+        """POST /users - Insert a User."""
+        self.call_operation('insertUser')
+
+    @task(2)
+    @tag('put', 'users', 'coverage')
+    def upsert_user(self):
+        """PUT /users - Insert or Update a User."""
+        self.call_operation('upsertUser')
+
+    @task(10)
+    @tag('get', 'users', 'coverage')
+    def get_user(self):
+        """GET /users/{user_id} - Request a specific User. Will not return API Users. These can only be managed in Scorebuddy. Users that have been deleted in the Scorebuddy website will no longer be returned by the API."""
+        self.call_operation('getUser')
+
+    @task(2)
+    @tag('patch', 'users', 'coverage')
+    def update_user(self):
+        """PATCH /users/{user_id} - Update a specific User."""
+        self.call_operation('updateUser')
+
+    @task(1)
+    @tag('delete', 'users', 'coverage')
+    def delete_user(self):
+        """DELETE /users/{user_id} - Delete a specific User."""
+        self.call_operation('deleteUser')
+
+    @task(2)
+    @tag('post', 'users', 'coverage')
+    def insert_password(self):
+        """POST /users/{user_id}/password - Insert the password for a given user."""
+        self.call_operation('insertPassword')
+
+    @task(2)
+    @tag('put', 'users', 'coverage')
+    def update_password(self):
+        """PUT /users/{user_id}/password - Insert or Update the password for a given user."""
+        self.call_operation('updatePassword')
+
+
+class IntegrationsCoverage(CoverageTest):
+    """Operations on /integrations"""
+    weight = 308
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_integrations(self):
+        """GET /integrations - Request Internal Integrations"""
+        self.call_operation('getIntegrations')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_integration(self):
+        """POST /integrations - Insert an Internal Integration"""
+        self.call_operation('insertIntegration')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_integration(self):
+        """PUT /integrations - Insert or Update an Internal Integration."""
+        self.call_operation('upsertIntegration')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_integration(self):
+        """GET /integrations/{integration_id} - Request a specific Internal Integration."""
+        self.call_operation('getIntegration')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_integration(self):
+        """PATCH /integrations/{integration_id} - Update a specific Internal Integration."""
+        self.call_operation('updateIntegration')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_integration(self):
+        """DELETE /integrations/{integration_id} - Delete a specific Internal Integration."""
+        self.call_operation('deleteIntegration')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_lists(self):
+        """GET /integrations/{integration_id}/lists - Request Lists"""
+        self.call_operation('getLists')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_list(self):
+        """POST /integrations/{integration_id}/lists - Insert a List"""
+        self.call_operation('insertList')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_list(self):
+        """GET /integrations/{integration_id}/lists/{list_id} - Request a specific List."""
+        self.call_operation('getList')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_list(self):
+        """PATCH /integrations/{integration_id}/lists/{list_id} - Update a specific List."""
+        self.call_operation('updateList')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_list(self):
+        """DELETE /integrations/{integration_id}/lists/{list_id} - Delete a specific List."""
+        self.call_operation('deleteList')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_cases(self):
+        """GET /integrations/{integration_id}/cases - Request Cases"""
+        self.call_operation('getCases')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_case(self):
+        """GET /integrations/{integration_id}/cases/{case_id} - Request a specific Case."""
+        self.call_operation('getCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_external_cases(self):
+        """GET /integrations/{integration_id}/cases/external - Request External Cases"""
+        self.call_operation('getExternalCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_external_case(self):
+        """POST /integrations/{integration_id}/cases/external - Insert an External Case"""
+        self.call_operation('insertExternalCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_external_case(self):
+        """PUT /integrations/{integration_id}/cases/external - Insert or Update an External Case."""
+        self.call_operation('upsertExternalCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_external_case(self):
+        """GET /integrations/{integration_id}/cases/external/{case_id} - Request a specific External Case."""
+        self.call_operation('getExternalCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_external_case(self):
+        """PATCH /integrations/{integration_id}/cases/external/{case_id} - Update a specific External Case."""
+        self.call_operation('updateExternalCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_external_case(self):
+        """DELETE /integrations/{integration_id}/cases/external/{case_id} - Delete a specific External Case."""
+        self.call_operation('deleteExternalCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_basic_cases(self):
+        """GET /integrations/{integration_id}/cases/basic - Request Basic Cases"""
+        self.call_operation('getBasicCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_basic_case(self):
+        """POST /integrations/{integration_id}/cases/basic - Insert a Basic Case"""
+        self.call_operation('insertBasicCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_basic_case(self):
+        """PUT /integrations/{integration_id}/cases/basic - Insert or Update a Basic Case."""
+        self.call_operation('upsertBasicCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_basic_case(self):
+        """GET /integrations/{integration_id}/cases/basic/{case_id} - Request a specific Basic Case."""
+        self.call_operation('getBasicCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_basic_case(self):
+        """PATCH /integrations/{integration_id}/cases/basic/{case_id} - Update a specific Basic Case."""
+        self.call_operation('updateBasicCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_basic_case(self):
+        """DELETE /integrations/{integration_id}/cases/basic/{case_id} - Delete a specific Basic Case."""
+        self.call_operation('deleteBasicCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_ticket_cases(self):
+        """GET /integrations/{integration_id}/cases/ticket - Request Ticket Cases"""
+        self.call_operation('getTicketCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_ticket_case(self):
+        """POST /integrations/{integration_id}/cases/ticket - Insert a Ticket Case"""
+        self.call_operation('insertTicketCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_ticket_case(self):
+        """PUT /integrations/{integration_id}/cases/ticket - Insert or Update a Ticket Case."""
+        self.call_operation('upsertTicketCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_ticket_case(self):
+        """GET /integrations/{integration_id}/cases/ticket/{case_id} - Request a specific Ticket Case."""
+        self.call_operation('getTicketCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_ticket_case(self):
+        """PATCH /integrations/{integration_id}/cases/ticket/{case_id} - Update a specific Ticket Case."""
+        self.call_operation('updateTicketCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_ticket_case(self):
+        """DELETE /integrations/{integration_id}/cases/ticket/{case_id} - Delete a specific Ticket Case."""
+        self.call_operation('deleteTicketCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_email_cases(self):
+        """GET /integrations/{integration_id}/cases/email - Request Email Cases"""
+        self.call_operation('getEmailCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_email_case(self):
+        """POST /integrations/{integration_id}/cases/email - Insert a Email Case"""
+        self.call_operation('insertEmailCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_email_case(self):
+        """PUT /integrations/{integration_id}/cases/email - Insert or Update a Email Case."""
+        self.call_operation('upsertEmailCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_email_case(self):
+        """GET /integrations/{integration_id}/cases/email/{case_id} - Request a specific Email Case."""
+        self.call_operation('getEmailCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_email_case(self):
+        """PATCH /integrations/{integration_id}/cases/email/{case_id} - Update a specific Email Case."""
+        self.call_operation('updateEmailCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_email_case(self):
+        """DELETE /integrations/{integration_id}/cases/email/{case_id} - Delete a specific Email Case."""
+        self.call_operation('deleteEmailCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_chat_cases(self):
+        """GET /integrations/{integration_id}/cases/chat - Request Chat Cases"""
+        self.call_operation('getChatCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_chat_case(self):
+        """POST /integrations/{integration_id}/cases/chat - Insert a Chat Case"""
+        self.call_operation('insertChatCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_chat_case(self):
+        """PUT /integrations/{integration_id}/cases/chat - Insert or Update a Chat Case."""
+        self.call_operation('upsertChatCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_chat_case(self):
+        """GET /integrations/{integration_id}/cases/chat/{case_id} - Request a specific Chat Case."""
+        self.call_operation('getChatCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_chat_case(self):
+        """PATCH /integrations/{integration_id}/cases/chat/{case_id} - Update a specific Chat Case."""
+        self.call_operation('updateChatCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_chat_case(self):
+        """DELETE /integrations/{integration_id}/cases/chat/{case_id} - Delete a specific Chat Case."""
+        self.call_operation('deleteChatCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_audio_cases(self):
+        """GET /integrations/{integration_id}/cases/audio - Request Audio Cases"""
+        self.call_operation('getAudioCases')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_audio_case(self):
+        """POST /integrations/{integration_id}/cases/audio - Insert a Audio Case"""
+        self.call_operation('insertAudioCase')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_audio_case(self):
+        """PUT /integrations/{integration_id}/cases/audio - Insert or Update a Audio Case."""
+        self.call_operation('upsertAudioCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_audio_case(self):
+        """GET /integrations/{integration_id}/cases/audio/{case_id} - Request a specific Audio Case."""
+        self.call_operation('getAudioCase')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_audio_case(self):
+        """PATCH /integrations/{integration_id}/cases/audio/{case_id} - Update a specific Audio Case."""
+        self.call_operation('updateAudioCase')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_audio_case(self):
+        """DELETE /integrations/{integration_id}/cases/audio/{case_id} - Delete a specific Audio Case."""
+        self.call_operation('deleteAudioCase')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_satisfaction_ratings(self):
+        """GET /integrations/{integration_id}/cases/{external_case_id}/satisfaction - Request Satisfaction Ratings"""
+        self.call_operation('getSatisfactionRatings')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_satisfaction_rating(self):
+        """POST /integrations/{integration_id}/cases/{external_case_id}/satisfaction - Insert a Satisfaction Rating"""
+        self.call_operation('insertSatisfactionRating')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_satisfaction_rating(self):
+        """PUT /integrations/{integration_id}/cases/{external_case_id}/satisfaction - Insert or Update a Satisfaction Rating."""
+        self.call_operation('upsertSatisfactionRating')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_satisfaction_ratings_by_id(self):
+        """GET /integrations/{integration_id}/cases/{external_case_id}/satisfaction/{satisfaction_id} - Request Satisfaction Ratings By Satisfaction Id"""
+        self.call_operation('getSatisfactionRatingsById')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_satisfaction_rating(self):
+        """PATCH /integrations/{integration_id}/cases/{external_case_id}/satisfaction/{satisfaction_id} - Update a Satisfaction Ratings By Satisfaction Id"""
+        self.call_operation('updateSatisfactionRating')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_satisfaction_rating(self):
+        """DELETE /integrations/{integration_id}/cases/{external_case_id}/satisfaction/{satisfaction_id} - Delete a Satisfaction Ratings By Satisfaction Id"""
+        self.call_operation('deleteSatisfactionRating')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_meta_data(self):
+        """GET /integrations/{integration_id}/meta_data - Request Meta Data Definitions"""
+        self.call_operation('getMetaData')
+
+    @task(2)
+    @tag('post', 'integrations', 'coverage')
+    def insert_meta_data(self):
+        """POST /integrations/{integration_id}/meta_data - Insert a Meta Data Definition"""
+        self.call_operation('insertMetaData')
+
+    @task(2)
+    @tag('put', 'integrations', 'coverage')
+    def upsert_meta_data(self):
+        """PUT /integrations/{integration_id}/meta_data - Insert or Update a Meta Data Definition."""
+        self.call_operation('upsertMetaData')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_meta_datum(self):
+        """GET /integrations/{integration_id}/meta_data/{definition_name} - Request a specific Meta Data Definition."""
+        self.call_operation('getMetaDatum')
+
+    @task(2)
+    @tag('patch', 'integrations', 'coverage')
+    def update_meta_data(self):
+        """PATCH /integrations/{integration_id}/meta_data/{definition_name} - Update a specific Meta Data Definition."""
+        self.call_operation('updateMetaData')
+
+    @task(1)
+    @tag('delete', 'integrations', 'coverage')
+    def delete_meta_data(self):
+        """DELETE /integrations/{integration_id}/meta_data/{definition_name} - Delete a specific Meta Data Definition."""
+        self.call_operation('deleteMetaData')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_files(self):
+        """GET /integrations/{integration_id}/files - Request File List"""
+        self.call_operation('getFiles')
+
+    @task(10)
+    @tag('get', 'integrations', 'coverage')
+    def get_file(self):
+        """GET /integrations/{integration_id}/files/{file_name} - Request a specific File Meta Data."""
+        self.call_operation('getFile')
@@ -3,6 +3,7 @@ Groups API load tests - DELETE operations only
 """
 from locust import task, tag
 from tests.base.base_test import BaseResourceTest
+from tests.base.run_phase import run_clock
 import time
 import random
 
@@ -10,39 +11,11 @@ import random
 class GroupsDeleteTest(BaseResourceTest):
     """Load tests for Groups API DELETE endpoints"""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._test_start_time = time.time()
-        self._test_duration = None  # Will be set from environment
-    
-    def _get_test_duration(self):
-        """Get test duration from environment"""
-        if self._test_duration is None:
-            # Try to get duration from environment
-            if hasattr(self.environment, 'parsed_options') and hasattr(self.environment.parsed_options, 'run_time'):
-                self._test_duration = self.environment.parsed_options.run_time
-            else:
-                # Default to 30 seconds if not specified
-                self._test_duration = 30
-        return self._test_duration
-    
-    def _should_stop_creating_requests(self):
-        """Check if we should stop creating new requests (5 seconds before end)"""
-        elapsed_time = time.time() - self._test_start_time
-        test_duration = self._get_test_duration()
-        remaining_time = test_duration - elapsed_time
-        
-        # Stop creating new requests 5 seconds before test ends
-        return remaining_time <= 5
-    
     def _create_test_group(self):
         """Create a test group for deletion"""
         group_name = f"DeleteTest_{int(time.time() * 1000) % 100000}_{random.randint(1000, 9999)}"
         
-        group_data = {
-            "group_name": group_name,
-            "description": f"Test group for deletion: {group_name}"
-        }
+        group_data = self.prepared_payload("insertGroup", fields=("group_name", "description"), group_name=group_name)
         
         try:
             response = self.post_resource("/groups", group_data, f"Create Test Group {group_name}")
@@ -56,10 +29,11 @@ class GroupsDeleteTest(BaseResourceTest):
                                   (response_data.get("group", {}).get("group_id")) or
                                   (response_data.get("group", {}).get("id")))
                         if group_id:
-                            print(f"✓ Created test group {group_id} for deletion")
+                            self.journal_created(f"/groups/{group_id}")
+                            self.log.debug("✓ Created test group %s for deletion", group_id)
                             return group_id
         except Exception as e:
-            print(f"✗ Error creating test group: {e}")
+            self.log.error("✗ Error creating test group: %s", e)
         
         return None
     
@@ -69,74 +43,74 @@ class GroupsDeleteTest(BaseResourceTest):
     def delete_test_groups_only(self):
         """Delete only test groups (safe for production)"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create a test group first, then delete it
         group_id = self._create_test_group()
         if not group_id:
-            print("✗ Could not create test group for deletion")
+            self.log.warning("✗ Could not create test group for deletion")
             return
         
         # Small delay to ensure group is created
         time.sleep(0.1)
         
-        print(f"Deleting test group: {group_id}")
+        self.log.debug("Deleting test group: %s", group_id)
         try:
-            response = self.delete_resource(f"/groups/{group_id}", f"Delete Test Group {group_id}")
-            print(f"DELETE response received: {response.status_code}")
+            response = self.delete_created(f"/groups/{group_id}", f"Delete Test Group {group_id}")
+            self.log.debug("DELETE response received: %s", response.status_code)
         except Exception as e:
-            print(f"✗ DELETE request failed with exception: {e}")
+            self.log.error("✗ DELETE request failed with exception: %s", e)
             return
         
         if response.status_code in [200, 204]:
-            print(f"✓ Successfully deleted test group: {group_id}")
+            self.log.debug("✓ Successfully deleted test group: %s", group_id)
         else:
-            print(f"✗ Failed to delete test group {group_id}: {response.status_code}")
+            self.log.warning("✗ Failed to delete test group %s: %s", group_id, response.status_code)
     
     @task(2)
     @tag('delete', 'groups', 'create_and_delete')
     def create_and_delete_group(self):
         """Create a group and then delete it immediately"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping create-and-delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping create-and-delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create a test group first
         group_id = self._create_test_group()
         if not group_id:
-            print("✗ Could not create test group for deletion")
+            self.log.warning("✗ Could not create test group for deletion")
             return
         
         # Small delay to ensure group is created
         time.sleep(0.1)
         
         # Now delete the group we just created
-        print(f"Deleting newly created group: {group_id}")
+        self.log.debug("Deleting newly created group: %s", group_id)
         try:
-            response = self.delete_resource(f"/groups/{group_id}", f"Delete New Group {group_id}")
-            print(f"DELETE response received: {response.status_code}")
+            response = self.delete_created(f"/groups/{group_id}", f"Delete New Group {group_id}")
+            self.log.debug("DELETE response received: %s", response.status_code)
         except Exception as e:
-            print(f"✗ DELETE request failed with exception: {e}")
+            self.log.error("✗ DELETE request failed with exception: %s", e)
             return
         
         if response.status_code in [200, 204]:
-            print(f"✓ Successfully deleted newly created group: {group_id}")
+            self.log.debug("✓ Successfully deleted newly created group: %s", group_id)
         else:
-            print(f"✗ Failed to delete newly created group {group_id}: {response.status_code}")
+            self.log.warning("✗ Failed to delete newly created group %s: %s", group_id, response.status_code)
     
     @task(1)
     @tag('delete', 'groups', 'safe_testing')
     def safe_delete_testing(self):
         """Safe DELETE testing with test groups only"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping safe delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping safe delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create multiple test groups and delete them
@@ -151,13 +125,13 @@ class GroupsDeleteTest(BaseResourceTest):
         deleted_count = 0
         for group_id in test_groups:
             try:
-                response = self.delete_resource(f"/groups/{group_id}", f"Delete Test Group {group_id}")
+                response = self.delete_created(f"/groups/{group_id}", f"Delete Test Group {group_id}")
                 if response.status_code in [200, 204]:
-                    print(f"✓ Successfully deleted test group: {group_id}")
+                    self.log.debug("✓ Successfully deleted test group: %s", group_id)
                     deleted_count += 1
                 else:
-                    print(f"✗ Failed to delete test group {group_id}: {response.status_code}")
+                    self.log.warning("✗ Failed to delete test group %s: %s", group_id, response.status_code)
             except Exception as e:
-                print(f"✗ Error deleting test group {group_id}: {e}")
+                self.log.error("✗ Error deleting test group %s: %s", group_id, e)
         
-        print(f"Safe delete test completed: {deleted_count}/{len(test_groups)} groups deleted")
+        self.log.debug("Safe delete test completed: %s/%s groups deleted", deleted_count, len(test_groups))
@@ -8,91 +8,52 @@ from tests.base.base_test import BaseResourceTest
 class GroupsGetTest(BaseResourceTest):
     """Load tests for Groups API GET endpoints"""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._group_ids = [32, 33, 34, 35, 36, 37]  # Known group IDs
-        self._group_ids_cached = False
-    
-    def _cache_group_ids_from_response(self):
-        """Cache group IDs from the groups list response"""
-        if not self._group_ids_cached:
-            try:
-                response = self.client.get("/groups")
-                if response.status_code == 200:
-                    groups_data = response.json()
-                    if isinstance(groups_data, list):
-                        # Extract IDs from the response
-                        cached_ids = []
-                        for group in groups_data:
-                            if isinstance(group, dict) and 'id' in group:
-                                cached_ids.append(group['id'])
-                            elif isinstance(group, dict) and 'group_id' in group:
-                                cached_ids.append(group['group_id'])
-                        
-                        if cached_ids:
-                            self._group_ids = cached_ids
-                            print(f"Cached {len(cached_ids)} group IDs from API response: {cached_ids}")
-                        else:
-                            print("No group IDs found in API response, using hardcoded IDs")
-                    else:
-                        print("Unexpected response format, using hardcoded IDs")
-                else:
-                    print(f"Failed to fetch groups list for caching: {response.status_code}")
-            except Exception as e:
-                print(f"Error caching group IDs: {e}")
-            
-            self._group_ids_cached = True
-    
     # GET Operations
     @task(4)
     @tag('get', 'groups', 'list')
     def get_groups_list(self):
         """Get Groups List - Primary endpoint for fetching all groups"""
-        print("Attempting to get groups list...")
+        self.log.debug("Attempting to get groups list...")
         response = self.get_resource("/groups", "Groups")
-        print(f"Groups list response status: {response.status_code}")
+        self.log.debug("Groups list response status: %s", response.status_code)
         
         if response.status_code == 200:
             try:
                 groups_data = response.json()
-                print(f"Retrieved {len(groups_data) if isinstance(groups_data, list) else 'unknown'} groups")
-                
-                # Cache group IDs for subsequent individual group requests
-                self._cache_group_ids_from_response()
+                self.log.debug("Retrieved %s groups", len(groups_data) if isinstance(groups_data, list) else 'unknown')
             except Exception as e:
-                print(f"Error parsing groups response: {e}")
+                self.log.error("Error parsing groups response: %s", e)
         else:
-            print(f"Groups list failed: {response.text}")
+            self.log.warning("Groups list failed: %s", response.text)
     
     @task(3)
     @tag('get', 'groups', 'individual')
     def get_group_by_id(self):
         """Get Group By Id - Fetch a specific group by its ID"""
-        import random
+        group_id = self.choose_cached_id('groups')
         
-        # Ensure we have cached group IDs
-        if not self._group_ids_cached:
-            self._cache_group_ids_from_response()
+        if group_id is None:
+            self.log.debug("No group IDs available for testing, skipping individual group request")
+            return
         
-        group_id = random.choice(self._group_ids)
-        print(f"Testing with group ID: {group_id}")
+        self.log.debug("Testing with group ID: %s", group_id)
         response = self.get_resource(f"/groups/{group_id}", f"Group {group_id}")
-        print(f"Group by ID response status: {response.status_code}")
+        self.log.debug("Group by ID response status: %s", response.status_code)
         
         if response.status_code == 200:
             try:
                 group_data = response.json()
-                print(f"Successfully retrieved group {group_id}")
+                self.log.debug("Successfully retrieved group %s", group_id)
             except Exception as e:
-                print(f"Error parsing group {group_id} response: {e}")
+                self.log.error("Error parsing group %s response: %s", group_id, e)
         else:
-            print(f"Group by ID failed: {response.text}")
+            self.log.warning("Group by ID failed: %s", response.text)
     
     @task(1)
     @tag('get', 'groups', 'validation')
     def get_groups_with_query_params(self):
         """Get Groups with query parameters - Test API flexibility"""
-        print("Testing groups list with query parameters...")
+        self.log.debug("Testing groups list with query parameters...")
         
         # Test with common query parameters that might be supported
         query_params = [
@@ -106,9 +67,9 @@ class GroupsGetTest(BaseResourceTest):
             try:
                 response = self.get_resource_with_params("/groups", params, f"Groups with params {params}")
                 if response:
-                    print(f"Groups with params {params}: {response.status_code}")
+                    self.log.debug("Groups with params %s: %s", params, response.status_code)
                     
                     if response.status_code not in [200, 400, 422]:  # 400/422 might be expected for invalid params
-                        print(f"Unexpected status for params {params}: {response.text}")
+                        self.log.warning("Unexpected status for params %s: %s", params, response.text)
             except Exception as e:
-                print(f"Error testing groups with params {params}: {e}")
\ No newline at end of file
+                self.log.error("Error testing groups with params %s: %s", params, e)
\ No newline at end of file
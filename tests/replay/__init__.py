@@ -0,0 +1 @@
+# Traffic replay test module
@@ -0,0 +1,71 @@
+"""
+Traffic replay load test - reproduces a recorded JSONL request log (see tests/base/replay.py)
+"""
+import time
+import gevent
+from locust import events, task, tag
+from locust.exception import StopUser
+from config.settings import settings
+from tests.base.arrival import arrival_stats
+from tests.base.base_test import BaseResourceTest
+from tests.base.latency import set_intended_start
+from tests.base.replay import IdRemapper, replay_stream, reset_streams
+
+
+class ReplayTrafficTest(BaseResourceTest):
+    """Replays REPLAY_FILE with its original inter-arrival times (scaled by REPLAY_SPEED)
+
+    Users take the next request from the process-wide stream, wait until it is due and send
+    it, so the user count is the concurrency available to the replay, not its rate. Requests
+    that start after their due time are counted as late in the arrival report (arrival.py).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Latency is measured from each request's due time instead (see tests/base/latency.py)
+        self._latency_pace = None
+        self._remapper = IdRemapper(self.client) if settings.REPLAY_REMAP_IDS else None
+
+    @task
+    @tag('replay')
+    def replay_next_request(self):
+        """Send the next request of the replay log when it is due"""
+        if not settings.REPLAY_FILE:
+            self.log.warning("REPLAY_FILE is not set - nothing to replay")
+            raise StopUser()
+
+        item = replay_stream().next()
+        if item is None:
+            self.log.info("Replay log finished")
+            raise StopUser()
+        due, entry = item
+
+        delay = due - time.time()
+        if delay > 0:
+            gevent.sleep(delay)
+        arrival_stats.log_dispatch(type(self).__name__, max(time.time() - due, 0.0), False)
+        set_intended_start(due)
+
+        path = entry['path']
+        body = entry.get('body')
+        if self._remapper:
+            path = self._remapper.path(path)
+            body = self._remapper.body(body)
+
+        kwargs = {}
+        query = entry.get('query')
+        if isinstance(query, str) and query:
+            path = f"{path}?{query.lstrip('?')}"
+        elif query:
+            kwargs['params'] = query
+        if body is not None:
+            kwargs['json'] = body
+
+        self._ensure_headers_set()
+        self.client.request(entry['method'].upper(), path, **kwargs)
+
+
+@events.test_start.add_listener
+def _on_test_start(environment, **kwargs):
+    # Every run replays the log from the top
+    reset_streams()
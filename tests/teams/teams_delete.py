@@ -3,8 +3,9 @@ Teams API load tests - DELETE operations only
 """
 from locust import task, tag
 from tests.base.base_test import BaseResourceTest
+from tests.base.run_phase import run_clock
+from tests.base.unique_ids import unique_ids
 import time
-import random
 
 
 class TeamsDeleteTest(BaseResourceTest):
@@ -13,41 +14,14 @@ class TeamsDeleteTest(BaseResourceTest):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._created_teams = []  # Track teams created by this instance
-        self._group_ids = [32, 33, 34, 35, 36, 37]  # Valid group IDs (visible in UI, not soft deleted)
-        # Protected team IDs range: 34-45 (pre-existing teams, never delete)
-        self._protected_team_ids = list(range(34, 46))
-        self._test_start_time = time.time()
-        self._test_duration = None  # Will be set from environment
     
-    def _get_test_duration(self):
-        """Get test duration from environment"""
-        if self._test_duration is None:
-            # Try to get duration from environment
-            if hasattr(self.environment, 'parsed_options') and hasattr(self.environment.parsed_options, 'run_time'):
-                self._test_duration = self.environment.parsed_options.run_time
-            else:
-                # Default to 30 seconds if not specified
-                self._test_duration = 30
-        return self._test_duration
-    
-    def _should_stop_creating_requests(self):
-        """Check if we should stop creating new requests (5 seconds before end)"""
-        elapsed_time = time.time() - self._test_start_time
-        test_duration = self._get_test_duration()
-        remaining_time = test_duration - elapsed_time
-        
-        # Stop creating new requests 5 seconds before test ends
-        return remaining_time <= 5
-    
-    def _get_unique_team_name(self, prefix="DeleteTest"):
-        """Generate a unique team name"""
-        timestamp = int(time.time() * 1000) % 100000
-        random_num = random.randint(1000, 9999)
-        return f"{prefix}_{timestamp}_{random_num}"
+    def _is_protected_team(self, team_id):
+        """Pre-existing teams (as discovered by the ID registry) are never deleted"""
+        return team_id in self.get_cached_ids('teams')
     
     def _get_random_group_id(self):
         """Get a random valid group ID"""
-        return random.choice(self._group_ids)
+        return self.choose_cached_id('groups')
     
     def _extract_team_id_from_response(self, response):
         """Extract team ID from response"""
@@ -62,18 +36,14 @@ class TeamsDeleteTest(BaseResourceTest):
                               (response_data.get("team", {}).get("id")))
                     return team_id
         except Exception as e:
-            print(f"Could not extract team ID from response: {e}")
+            self.log.debug("Could not extract team ID from response: %s", e)
         return None
     
     def _create_test_team(self):
         """Create a test team for deletion"""
-        team_name = self._get_unique_team_name("DeleteTest")
+        team_name = unique_ids.name("DeleteTest")
         
-        team_data = {
-            "team_name": team_name,
-            "group_id": self._get_random_group_id(),
-            "deleted": False
-        }
+        team_data = self.prepared_payload("insertTeam", team_name=team_name, group_id=self._get_random_group_id())
         
         try:
             response = self.post_resource("/teams", team_data, f"Create Test Team {team_name}")
@@ -81,39 +51,40 @@ class TeamsDeleteTest(BaseResourceTest):
                 team_id = self._extract_team_id_from_response(response)
                 if team_id:
                     # Safety check: ensure we never track protected team IDs
-                    if team_id not in self._protected_team_ids:
+                    if not self._is_protected_team(team_id):
                         self._created_teams.append(team_id)
-                        print(f"✓ Created test team {team_id} for deletion")
+                        self.journal_created(f"/teams/{team_id}")
+                        self.log.debug("✓ Created test team %s for deletion", team_id)
                         return team_id
                     else:
-                        print(f"⚠ Warning: Created team {team_id} is in protected range, not tracking")
+                        self.log.warning("⚠ Warning: Created team %s is in protected range, not tracking", team_id)
                         return None
         except Exception as e:
-            print(f"✗ Error creating test team: {e}")
+            self.log.error("✗ Error creating test team: %s", e)
         
         return None
     
     def _delete_team(self, team_id):
         """Delete a team by ID with safety check"""
-        # Safety check: never delete protected team IDs (34-45)
-        if team_id in self._protected_team_ids:
-            print(f"⚠ Safety check: Skipping deletion of protected team ID {team_id} (pre-existing team)")
+        # Safety check: never delete protected (pre-existing) team IDs
+        if self._is_protected_team(team_id):
+            self.log.warning("⚠ Safety check: Skipping deletion of protected team ID %s (pre-existing team)", team_id)
             return False
         
         try:
-            print(f"Deleting team {team_id}...")
-            response = self.delete_resource(f"/teams/{team_id}", f"Delete Team {team_id}")
+            self.log.debug("Deleting team %s...", team_id)
+            response = self.delete_created(f"/teams/{team_id}", f"Delete Team {team_id}")
             if response.status_code in [200, 204]:
-                print(f"✓ Successfully deleted team {team_id}")
+                self.log.debug("✓ Successfully deleted team %s", team_id)
                 # Remove from tracking list if present
                 if team_id in self._created_teams:
                     self._created_teams.remove(team_id)
                 return True
             else:
-                print(f"✗ Failed to delete team {team_id}: {response.status_code}")
+                self.log.warning("✗ Failed to delete team %s: %s", team_id, response.status_code)
                 return False
         except Exception as e:
-            print(f"✗ Error deleting team {team_id}: {e}")
+            self.log.error("✗ Error deleting team %s: %s", team_id, e)
             return False
     
     # DELETE Operations
@@ -122,74 +93,74 @@ class TeamsDeleteTest(BaseResourceTest):
     def delete_test_teams_only(self):
         """Delete only test teams (safe for production)"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create a test team first, then delete it
         team_id = self._create_test_team()
         if not team_id:
-            print("✗ Could not create test team for deletion")
+            self.log.warning("✗ Could not create test team for deletion")
             return
         
         # Small delay to ensure team is created
         time.sleep(0.1)
         
-        print(f"Deleting test team: {team_id}")
+        self.log.debug("Deleting test team: %s", team_id)
         try:
-            response = self.delete_resource(f"/teams/{team_id}", f"Delete Test Team {team_id}")
-            print(f"DELETE response received: {response.status_code}")
+            response = self.delete_created(f"/teams/{team_id}", f"Delete Test Team {team_id}")
+            self.log.debug("DELETE response received: %s", response.status_code)
         except Exception as e:
-            print(f"✗ DELETE request failed with exception: {e}")
+            self.log.error("✗ DELETE request failed with exception: %s", e)
             return
         
         if response.status_code in [200, 204]:
-            print(f"✓ Successfully deleted test team: {team_id}")
+            self.log.debug("✓ Successfully deleted test team: %s", team_id)
         else:
-            print(f"✗ Failed to delete test team {team_id}: {response.status_code}")
+            self.log.warning("✗ Failed to delete test team %s: %s", team_id, response.status_code)
     
     @task(2)
     @tag('delete', 'teams', 'create_and_delete')
     def create_and_delete_team(self):
         """Create a team and then delete it immediately"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping create-and-delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping create-and-delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create a test team first
         team_id = self._create_test_team()
         if not team_id:
-            print("✗ Could not create test team for deletion")
+            self.log.warning("✗ Could not create test team for deletion")
             return
         
         # Small delay to ensure team is created
         time.sleep(0.1)
         
         # Now delete the team we just created
-        print(f"Deleting newly created team: {team_id}")
+        self.log.debug("Deleting newly created team: %s", team_id)
         try:
-            response = self.delete_resource(f"/teams/{team_id}", f"Delete New Team {team_id}")
-            print(f"DELETE response received: {response.status_code}")
+            response = self.delete_created(f"/teams/{team_id}", f"Delete New Team {team_id}")
+            self.log.debug("DELETE response received: %s", response.status_code)
         except Exception as e:
-            print(f"✗ DELETE request failed with exception: {e}")
+            self.log.error("✗ DELETE request failed with exception: %s", e)
             return
         
         if response.status_code in [200, 204]:
-            print(f"✓ Successfully deleted newly created team: {team_id}")
+            self.log.debug("✓ Successfully deleted newly created team: %s", team_id)
         else:
-            print(f"✗ Failed to delete newly created team {team_id}: {response.status_code}")
+            self.log.warning("✗ Failed to delete newly created team %s: %s", team_id, response.status_code)
     
     @task(1)
     @tag('delete', 'teams', 'safe_testing')
     def safe_delete_testing(self):
         """Safe DELETE testing with test teams only"""
         # Check if we should stop creating new requests
-        if self._should_stop_creating_requests():
-            elapsed = time.time() - self._test_start_time
-            print(f"[INFO] Stopping safe delete requests - {elapsed:.1f}s elapsed, stopping 5s before end")
+        if run_clock.draining:
+            elapsed = run_clock.elapsed()
+            self.log.info("Stopping safe delete requests - %.1fs elapsed, run is draining", elapsed)
             return
         
         # Create multiple test teams and delete them
@@ -204,13 +175,13 @@ class TeamsDeleteTest(BaseResourceTest):
         deleted_count = 0
         for team_id in test_teams:
             try:
-                response = self.delete_resource(f"/teams/{team_id}", f"Delete Test Team {team_id}")
+                response = self.delete_created(f"/teams/{team_id}", f"Delete Test Team {team_id}")
                 if response.status_code in [200, 204]:
-                    print(f"✓ Successfully deleted test team: {team_id}")
+                    self.log.debug("✓ Successfully deleted test team: %s", team_id)
                     deleted_count += 1
                 else:
-                    print(f"✗ Failed to delete test team {team_id}: {response.status_code}")
+                    self.log.warning("✗ Failed to delete test team %s: %s", team_id, response.status_code)
             except Exception as e:
-                print(f"✗ Error deleting test team {team_id}: {e}")
+                self.log.error("✗ Error deleting test team %s: %s", team_id, e)
         
-        print(f"Safe delete test completed: {deleted_count}/{len(test_teams)} teams deleted")
+        self.log.debug("Safe delete test completed: %s/%s teams deleted", deleted_count, len(test_teams))
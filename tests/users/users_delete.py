@@ -4,6 +4,9 @@ Users API load tests - DELETE operations only
 from locust import HttpUser, task, tag
 from config.settings import settings
 from auth.token_manager import token_manager
+from tests.base.log import get_logger
+
+log = get_logger('UsersDeleteTest')
 
 
 class UsersDeleteTest(HttpUser):
@@ -28,14 +31,15 @@ class UsersDeleteTest(HttpUser):
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json"
             })
+            token_manager.register_client(self.client)
         else:
-            print("Failed to get authentication token")
+            log.warning("Failed to get authentication token")
     
     def delete_resource(self, endpoint, resource_name="resource"):
         """Generic DELETE request handler"""
         response = self.client.delete(endpoint)
         if response.status_code not in [200, 204]:
-            print(f"{resource_name} DELETE failed: {response.status_code} - {response.text}")
+            log.warning("%s DELETE failed: %s - %s", resource_name, response.status_code, response.text)
         return response
     
     # DELETE Operations (commented out as requested)